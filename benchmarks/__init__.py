@@ -0,0 +1,6 @@
+"""
+Benchmark suite for the game's hot paths.
+
+Run from the repository root:
+    python -m benchmarks [--only NAME ...] [--repeat N] [--output results.json]
+"""
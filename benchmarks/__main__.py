@@ -0,0 +1,133 @@
+"""Command line entry point for the benchmark suite."""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+
+# Keep the game's logging quiet unless asked otherwise
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("LOG_TO_FILE", "False")
+
+from benchmarks.solvability import DEFAULT_SEGMENTS_PER_BAND  # noqa: E402
+
+DEFAULT_SEED = 1234
+DEFAULT_REPEAT = 200
+DEFAULT_WARMUP = 10
+
+
+def _positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark Dasher's hot paths and report timings as JSON."
+    )
+    parser.add_argument(
+        "--only",
+        nargs="*",
+        default=None,
+        help="Run only benchmarks whose name starts with one of these prefixes",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=_positive_int,
+        default=DEFAULT_REPEAT,
+        help="Timed samples per case",
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=DEFAULT_WARMUP, help="Untimed runs per case"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=DEFAULT_SEED, help="Seed for generated worlds"
+    )
+    parser.add_argument(
+        "--output", default=None, help="Write the JSON report to this file"
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List the benchmark names and exit"
+    )
+    parser.add_argument(
+        "--solvability",
+        type=int,
+        nargs="?",
+        const=DEFAULT_SEGMENTS_PER_BAND,
+        default=None,
+        metavar="SEGMENTS",
+        help="Count unsolvable segments per difficulty band instead of timing "
+        f"(default: {DEFAULT_SEGMENTS_PER_BAND} generated segments per band)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    import pygame
+    from src.core.game import Game
+    from benchmarks.harness import BENCHMARKS, measure, summarize
+    from benchmarks.cases import BenchmarkContext
+
+    if args.list:
+        for name in BENCHMARKS:
+            print(name)
+        return None
+
+    game = Game(headless=True, seed=args.seed)
+
+    meta = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "seed": args.seed,
+    }
+
+    if args.solvability is not None:
+        from benchmarks.solvability import count_unsolvable
+
+        results = count_unsolvable(args.seed, args.solvability)
+        for band, counts in results.items():
+            for source, c in counts.items():
+                print(
+                    f"band {band} {source}: {c['unsolvable']}/{c['segments']} "
+                    f"unsolvable, {c['unsolvable_with_margin']} with margin, "
+                    f"{c['unsolvable_speed_boost']} with speed boost, "
+                    f"{c['unsolvable_flying']} flying",
+                    file=sys.stderr,
+                )
+        report = {"meta": meta, "solvability": results}
+    else:
+        context = BenchmarkContext(game, args.seed)
+        results = {}
+        for name, case in BENCHMARKS.items():
+            if args.only and not any(name.startswith(prefix) for prefix in args.only):
+                continue
+            run_sample = case(context)
+            samples = measure(run_sample, args.repeat, args.warmup)
+            results[name] = summarize(samples)
+            print(
+                f"{name}: median {results[name]['median_ms']:.3f} ms, "
+                f"p99 {results[name]['p99_ms']:.3f} ms",
+                file=sys.stderr,
+            )
+        meta.update(repeat=args.repeat, warmup=args.warmup)
+        report = {"meta": meta, "results": results}
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""Benchmark cases for generation, physics, drawing, effects, text and cleanup."""
+
+import random
+from benchmarks.harness import benchmark
+from src.constants.screen import WIDTH
+from src.constants.difficulty import DIFFICULTY_MAX_DISTANCE
+from src.constants.player import PLAYER_INITIAL_Y
+from src.constants.simulation import FRAME_DURATION_MS
+from src.constants.colors import BLACK
+from src.constants.level_generation import SEGMENT_LENGTH
+from src.entities.player import Player
+from src.entities.effects import effect_manager
+from src.core.input_recording import RecordedKeys, KEY_BITS
+from src.level.level_generator import (
+    difficulty_at,
+    fill_segment,
+    generate_segment,
+    remove_old_objects,
+    segment_start,
+)
+from src.level.world_store import (
+    WorldStore,
+    KINDS,
+    FLOOR,
+    PLATFORM,
+    OBSTACLE,
+    COIN,
+    POWER_UP,
+)
+from src.utils.utils import render_retro_text
+import pygame
+import src.core.input_handler as input_handler
+
+# Distances at which segment generation is measured
+GENERATION_DISTANCES = [0, 5000, 10000, 15000, DIFFICULTY_MAX_DISTANCE]
+
+# Number of segments generated ahead of the player for the dense world cases
+DENSE_WORLD_SEGMENTS = 4
+
+# Number of live effects for the effect manager case (each has 10-15 particles)
+EFFECT_COUNT = 60
+
+# Distance between the player positions of the world query case
+WORLD_QUERY_SPACING = WIDTH // 4
+
+
+class BenchmarkContext:
+    """Shared state for the benchmark cases: a headless game and a base seed."""
+
+    def __init__(self, game, seed):
+        self.game = game
+        self.seed = seed
+
+    def rng(self, offset=0):
+        """Create a fresh generator so each case sees the same random sequence."""
+        return random.Random(self.seed + offset)
+
+
+def segment_index_at(distance):
+    """Return the index of the segment that contains an x position."""
+    return max(0, int((distance - segment_start(0)) // SEGMENT_LENGTH))
+
+
+def build_world(context, distance, segments=DENSE_WORLD_SEGMENTS):
+    """Generate a world of several segments from the given distance on.
+
+    Returns (player, world, objects, start_x), where objects are the world's
+    (kind, object) pairs to build it again from and start_x is where the
+    first segment starts.
+    """
+    first = segment_index_at(distance)
+    objects = []
+    for index in range(first, first + segments):
+        objects.extend(generate_segment(context.seed, index).objects)
+    world = WorldStore()
+    for kind, obj in objects:
+        world.insert(obj, kind)
+
+    start_x = segment_start(first)
+    player = Player(x=start_x, y=PLAYER_INITIAL_Y, rng=context.rng(distance))
+    player.furthest_right_position = start_x
+    return player, world, objects, start_x
+
+
+for _distance in GENERATION_DISTANCES:
+
+    def _generation_case(context, distance=_distance):
+        index = segment_index_at(distance)
+        state = {"sample": 0}
+
+        def setup():
+            # A different but repeatable seed for every sample
+            state["sample"] += 1
+
+        def run():
+            generate_segment(context.seed * 1000 + state["sample"], index)
+
+        run.setup = setup
+        return run
+
+    def _full_generation_case(context, distance=_distance):
+        start_x = segment_start(segment_index_at(distance))
+        difficulty_factor = difficulty_at(start_x)
+        state = {"sample": 0}
+
+        def setup():
+            state["sample"] += 1
+            state["world"] = WorldStore()
+            state["rng"] = context.rng(distance * 1000 + state["sample"])
+
+        def run():
+            fill_segment(
+                state["world"],
+                start_x,
+                start_x + SEGMENT_LENGTH,
+                difficulty_factor,
+                state["rng"],
+            )
+
+        run.setup = setup
+        return run
+
+    benchmark(f"generate_segment[distance={_distance}]")(_generation_case)
+    benchmark(f"fill_segment[distance={_distance}]")(_full_generation_case)
+
+
+@benchmark("player_update[dense]")
+def player_update_dense(context):
+    player, _, objects, start_x = build_world(context, DIFFICULTY_MAX_DISTANCE)
+    state = {}
+
+    def setup():
+        player.x = start_x
+        player.y = PLAYER_INITIAL_Y
+        player.vx = 0
+        player.vy = 0
+        player.lives = 3
+        # A fresh world, so collected coins and power-ups are back every sample
+        state["world"] = WorldStore()
+        for kind, obj in objects:
+            state["world"].insert(obj, kind)
+        input_handler.current_keys = RecordedKeys(KEY_BITS[pygame.K_RIGHT])
+
+    def run():
+        player.update(state["world"])
+
+    run.setup = setup
+    return run
+
+
+@benchmark("world_query[dense]")
+def world_query_dense(context):
+    # The world queries of one frame (player collisions and pickups, then
+    # draw culling) at player positions across the whole world
+    player, world, _, start_x = build_world(context, DIFFICULTY_MAX_DISTANCE)
+    end_x = start_x + DENSE_WORLD_SEGMENTS * SEGMENT_LENGTH
+    positions = range(int(start_x), int(end_x), WORLD_QUERY_SPACING)
+    width, height = player.width, player.height
+
+    def run():
+        for x in positions:
+            world.query_rect_by_kind(
+                x, PLAYER_INITIAL_Y, width, height, (FLOOR, PLATFORM, OBSTACLE)
+            )
+            world.query_rect_by_kind(
+                x, PLAYER_INITIAL_Y, width, height, (COIN, POWER_UP)
+            )
+            for kind in KINDS:
+                world.query_range(x - WIDTH // 2, x + WIDTH, (kind,))
+
+    return run
+
+
+@benchmark("game_draw[offscreen]")
+def game_draw_offscreen(context):
+    game = context.game
+    player, world, _, start_x = build_world(context, DIFFICULTY_MAX_DISTANCE)
+    game.player = player
+    game.world = world
+    # Look at the densest part of the generated world
+    game.camera_x = start_x + WIDTH
+    game.player.x = game.camera_x + WIDTH // 2
+    game.player_has_moved = True
+
+    def run():
+        game.draw()
+
+    return run
+
+
+def _populate_effects(context):
+    rng = context.rng()
+    effect_manager.set_rng(rng)
+    effect_manager.effects = []
+    for i in range(EFFECT_COUNT):
+        x = rng.uniform(0, WIDTH)
+        y = rng.uniform(0, 400)
+        if i % 3 == 0:
+            effect_manager.create_powerup_effect(x, y, "speed")
+        elif i % 3 == 1:
+            effect_manager.create_coin_effect(x, y)
+        else:
+            effect_manager.create_speed_trail(x, y)
+
+
+@benchmark("effect_manager_update[many]")
+def effect_manager_update_many(context):
+    dt = FRAME_DURATION_MS / 1000.0
+
+    def run():
+        effect_manager.update(dt)
+
+    run.setup = lambda: _populate_effects(context)
+    return run
+
+
+@benchmark("effect_manager_draw[many]")
+def effect_manager_draw_many(context):
+    screen = context.game.screen
+
+    def run():
+        effect_manager.draw(screen, 0)
+
+    run.setup = lambda: _populate_effects(context)
+    return run
+
+
+@benchmark("render_retro_text[single_line]")
+def render_retro_text_single_line(context):
+    def run():
+        render_retro_text("Score: 123456", 18, BLACK)
+
+    return run
+
+
+@benchmark("render_retro_text[wrapped]")
+def render_retro_text_wrapped(context):
+    message = (
+        "Arr matey, ye be dashin' across the seven seas of spikes and fire, "
+        "keep yer eyes on the horizon and yer boots off the saws!"
+    )
+
+    def run():
+        render_retro_text(message, 16, BLACK, WIDTH - 80)
+
+    return run
+
+
+@benchmark("remove_old_objects[dense]")
+def remove_old_objects_dense(context):
+    # The player stands at the start of the world, so nothing is behind the
+    # boundary: the common per-frame case
+    player, world, _, _ = build_world(context, DIFFICULTY_MAX_DISTANCE, segments=8)
+
+    def run():
+        remove_old_objects(player, world)
+
+    return run
@@ -0,0 +1,68 @@
+"""Timing and statistics helpers for the benchmark suite."""
+
+import time
+
+# Registered benchmarks in definition order: name -> function
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark function under a name.
+
+    The function receives a BenchmarkContext and returns a callable that runs
+    one sample. Per-sample setup that should not be timed goes in an optional
+    `setup` attribute on that callable.
+    """
+
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+def percentile(sorted_samples, fraction):
+    """Return the given percentile (0.0 to 1.0) of already sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    # Linear interpolation between the closest ranks
+    position = (len(sorted_samples) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    weight = position - lower
+    return sorted_samples[lower] * (1 - weight) + sorted_samples[upper] * weight
+
+
+def summarize(samples):
+    """Summarize sample durations (in seconds) as milliseconds."""
+    ordered = sorted(samples)
+    to_ms = 1000.0
+    return {
+        "samples": len(ordered),
+        "min_ms": ordered[0] * to_ms,
+        "median_ms": percentile(ordered, 0.5) * to_ms,
+        "p90_ms": percentile(ordered, 0.9) * to_ms,
+        "p95_ms": percentile(ordered, 0.95) * to_ms,
+        "p99_ms": percentile(ordered, 0.99) * to_ms,
+        "max_ms": ordered[-1] * to_ms,
+        "mean_ms": sum(ordered) / len(ordered) * to_ms,
+    }
+
+
+def measure(run_sample, repeat, warmup):
+    """Time run_sample() repeat times after some untimed warmup runs."""
+    setup = getattr(run_sample, "setup", None)
+
+    for _ in range(warmup):
+        if setup:
+            setup()
+        run_sample()
+
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        run_sample()
+        samples.append(time.perf_counter() - start)
+    return samples
@@ -0,0 +1,99 @@
+"""Counts of generated segments the player cannot get through, per difficulty band.
+
+Every band gets segments made by the full generator at difficulties spread
+over the band, like tools/build_segment_templates.py makes them, and every
+template of the band's library entry. Each segment is checked with the jump
+reachability tables (see reachability.find_dead_end), once against the bare
+obstacle hitboxes and once with SOLVABILITY_HAZARD_MARGIN around them. The
+bare check is repeated with the speed boost and flying jump tables, to see how
+many dead ends those power-ups get the player through.
+"""
+
+import random
+from src.constants.level_generation import (
+    SEGMENT_LENGTH,
+    TEMPLATE_DIFFICULTY_BANDS,
+    SOLVABILITY_HAZARD_MARGIN,
+)
+from src.level import segment_templates
+from src.level.level_generator import fill_segment
+from src.level.reachability import (
+    NORMAL_JUMPS,
+    SPEED_BOOST_JUMPS,
+    FLYING_JUMPS,
+    find_dead_end,
+)
+from src.level.world_store import WorldStore, KINDS, FLOOR, PLATFORM, OBSTACLE
+
+# Full segments generated per difficulty band
+DEFAULT_SEGMENTS_PER_BAND = 200
+
+
+def _dead_end(objects, margin, table=NORMAL_JUMPS):
+    """Return where the player gets stuck in a segment starting at x = 0."""
+    surfaces = [
+        (obj.x, obj.y, obj.width) for kind, obj in objects if kind in (FLOOR, PLATFORM)
+    ]
+    hazards = [
+        tuple(obj.get_collision_rect()) for kind, obj in objects if kind == OBSTACLE
+    ]
+    return find_dead_end(
+        surfaces, hazards, 0, SEGMENT_LENGTH, margin=margin, table=table
+    )
+
+
+def _count(segments):
+    """Count the segments that cannot be crossed, without and with the margin.
+
+    The speed boost and flying counts are without the margin.
+    """
+    counts = {
+        "segments": 0,
+        "unsolvable": 0,
+        "unsolvable_with_margin": 0,
+        "unsolvable_speed_boost": 0,
+        "unsolvable_flying": 0,
+    }
+    for objects in segments:
+        counts["segments"] += 1
+        if _dead_end(objects, 0) is not None:
+            counts["unsolvable"] += 1
+        if _dead_end(objects, SOLVABILITY_HAZARD_MARGIN) is not None:
+            counts["unsolvable_with_margin"] += 1
+        if _dead_end(objects, 0, SPEED_BOOST_JUMPS) is not None:
+            counts["unsolvable_speed_boost"] += 1
+        if _dead_end(objects, 0, FLYING_JUMPS) is not None:
+            counts["unsolvable_flying"] += 1
+    return counts
+
+
+def _generated(band, count, seed):
+    """Yield the (kind, object) pairs of full segments generated for a band at x = 0."""
+    for i in range(count):
+        rng = random.Random(f"{seed}:{band}:{i}")
+        difficulty_factor = (band + rng.random()) / TEMPLATE_DIFFICULTY_BANDS
+        world = WorldStore()
+        fill_segment(world, 0, SEGMENT_LENGTH, difficulty_factor, rng)
+        yield [(kind, obj) for kind in KINDS for obj in world.objects(kind)]
+
+
+def _templates(band, seed):
+    """Yield the (kind, object) pairs of every library template of a band at x = 0."""
+    library = segment_templates.get_library()
+    if not library:
+        return
+    rng = random.Random(f"{seed}:{band}")
+    difficulty_factor = (band + 0.5) / TEMPLATE_DIFFICULTY_BANDS
+    for template in library[band]:
+        yield segment_templates.instantiate(template, 0, difficulty_factor, rng)
+
+
+def count_unsolvable(seed, segments_per_band=DEFAULT_SEGMENTS_PER_BAND):
+    """Return the unsolvable segment counts of every difficulty band."""
+    results = {}
+    for band in range(TEMPLATE_DIFFICULTY_BANDS):
+        results[band] = {
+            "generated": _count(_generated(band, segments_per_band, seed)),
+            "templates": _count(_templates(band, seed)),
+        }
+    return results
@@ -5,3 +5,7 @@ FLOOR_HEIGHT = 20
 COIN_SIZE = 20
 POWERUP_SIZE = 20
 DEFAULT_OBSTACLE_SIZE = 30
+
+# ===== GAME OBJECT TYPES =====
+OBSTACLE_TYPES = ("spikes", "fire", "saw", "bomb")
+POWERUP_TYPES = ("speed", "flying", "invincibility", "life")
@@ -1,10 +1,35 @@
 """Level generation constants for the Dasher game."""
 
+from src.constants.screen import WIDTH
+
 # ===== LEVEL GENERATION =====
 SEGMENT_LENGTH_MULTIPLIER = 3  # Generate segments 3x the screen width
-GRID_CELL_SIZE = 100  # Size of collision grid cells
+SEGMENT_LENGTH = WIDTH * SEGMENT_LENGTH_MULTIPLIER
+MIN_FLOOR_WIDTH = 100  # Narrowest floor between pits
+WORLD_CHUNK_WIDTH = 400  # Width of the x-chunks level objects are stored in
+PLATFORM_INDEX_BUCKET_WIDTH = 25  # Width range of each bucket of the platform index
+WORLD_COMPACTION_THRESHOLD = 32  # Tombstones kept before compacting
 OBSTACLE_BUFFER = 10  # Buffer around obstacles for collision detection
 MIN_PLATFORM_WIDTH = 50  # Minimum width for platforms
 MAX_PLATFORM_WIDTH = 150  # Maximum width for platforms
 PLATFORM_EDGE_BUFFER = 60  # Buffer from edge of pit (per side)
 MIN_PLATFORM_HORIZONTAL_DISTANCE = 50  # Minimum horizontal distance between platforms
+NEXT_SEGMENT_MARGIN = (
+    600  # Add the next segment when the camera is this close to the level's end
+)
+PREGENERATION_LOOKAHEAD_FRAMES = (
+    60  # Frames of player movement the next segment is started ahead of need
+)
+GENERATION_FRAME_BUDGET_MS = (
+    1.0  # Time per frame spent on the next segment where there is no worker thread
+)
+TEMPLATE_DIFFICULTY_BANDS = 10  # Difficulty bands of the segment template library
+TEMPLATES_PER_BAND = 64  # Segment templates built for each difficulty band
+TEMPLATE_SEGMENT_CHANCE = (
+    0.9  # Share of segments taken from the template library instead of generated
+)
+TEMPLATE_PICKUP_JITTER = 15  # How far coins and power-ups of a template may move
+TEMPLATE_LANDING_CLEARANCE = 50  # Floor kept free of obstacles where a pit ends
+SOLVABILITY_HAZARD_MARGIN = (
+    10  # Extra pixels around obstacle hitboxes for jumps that are not frame-perfect
+)
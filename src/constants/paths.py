@@ -46,3 +46,6 @@ FIRE_PATH = "assets/images/obstacles/fire.png"
 SAW_PATH = "assets/images/obstacles/saw.png"
 BOMB_DIR_PATH = "assets/images/obstacles/bomb"
 EXPLOSION_DIR_PATH = "assets/images/obstacles/bomb_explosion"
+
+# ===== LEVEL PATHS =====
+SEGMENT_TEMPLATES_PATH = "assets/levels/segment_templates.bin"
@@ -0,0 +1,43 @@
+"""Simulation and game loop constants for the Dasher game."""
+
+# ===== GAME LOOP =====
+TARGET_FPS = 60  # Frame rate the game logic is tuned for
+FRAME_DURATION_MS = 1000 / TARGET_FPS  # Simulated time per frame in milliseconds
+
+# ===== FIXED TIMESTEP =====
+MAX_RENDER_FPS = (
+    120  # Cap on rendered frames per second (simulation stays at TARGET_FPS)
+)
+MAX_STEPS_PER_FRAME = (
+    5  # Simulation steps allowed per rendered frame before slowing down
+)
+MAX_FRAME_TIME_MS = 250  # Longer frames (e.g. a hidden browser tab) are clamped to this
+INTERPOLATION_SNAP_DISTANCE = (
+    100  # Moves larger than this in one step are not interpolated
+)
+
+# ===== HEADLESS MODE =====
+HEADLESS_DEFAULT_FRAMES = 3600  # One minute of game time at the target frame rate
+BATCH_DEFAULT_GAMES = 200  # Games run by the batch runner when no replays are given
+
+# ===== PROFILING =====
+PROFILER_WINDOW = 240  # Frames kept for the rolling p50/p95/p99 phase timings
+
+# ===== TRACING =====
+TRACE_FLUSH_EVENTS = 4096  # Trace events buffered in memory before a chunk is written
+
+# ===== AUTOPILOT =====
+AUTOPILOT_PLAN_FRAMES = 90  # A plan must keep the player alive this far ahead
+AUTOPILOT_MAX_PLAN_FRAMES = 150  # ...and end on solid ground unless it reaches this
+AUTOPILOT_REPLAN_FRAMES = 45  # Plan again when fewer planned frames are left
+AUTOPILOT_NODE_BUDGET = 2500  # Maximum search nodes expanded per plan
+AUTOPILOT_GOOD_PROGRESS = (
+    0.75  # Stop searching once a plan averages this much of full speed
+)
+AUTOPILOT_HAZARD_MARGIN = 4  # Extra pixels kept clear around obstacle hitboxes
+AUTOPILOT_BOMB_FUSE_WARNING = 1.0  # Seconds before a lit bomb's blast is avoided
+
+# ===== MEMORY MONITOR =====
+MEMORY_SNAPSHOT_INTERVAL = 60000  # ms of game time between memory snapshots
+MEMORY_TOP_MODULES = 15  # Modules listed per snapshot, by retained size and growth
+MEMORY_TRACE_FRAMES = 1  # Stack frames stored per allocation (more is slower)
@@ -5,3 +5,8 @@ HEART_SPRITE_SIZE = 32
 MESSAGE_CHAR_DELAY = 5  # ms between characters in scrolling text
 DEFAULT_MESSAGE_DELAY = 7000  # ms between default messages
 MESSAGE_TRANSITION_DELAY = 500  # ms between messages
+
+# ===== DEBUG OVERLAY =====
+PROFILER_OVERLAY_REFRESH = 500  # ms between updates of the phase timing table
+SPARKLINE_FRAMES = 120  # Number of recent frames shown in the frame time sparkline
+SPARKLINE_MAX_MS = 33.3  # Frame time at the top of the sparkline (two 60 FPS frames)
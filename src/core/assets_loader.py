@@ -42,6 +42,7 @@ from src.constants.paths import (
 from src.constants.game_objects import COIN_SIZE, POWERUP_SIZE
 from src.constants.screen import PLAY_AREA_HEIGHT
 from src.utils.logger import get_module_logger
+from src.utils.tracer import tracer
 
 logger = get_module_logger("assets_loader")
 
@@ -129,7 +130,8 @@ def load_all_assets():
     """Load all game assets."""
     try:
         # First load the background assets
-        load_background_assets()
+        with tracer.span("assets.background", "assets"):
+            load_background_assets()
 
         # Then create the cached background if needed
         if USE_CACHED_BACKGROUND:
@@ -138,16 +140,22 @@ def load_all_assets():
                 if pygame.display.get_surface()
                 else 800
             )
-            cached_bg = create_cached_background(screen_width)
+            with tracer.span("assets.cached_background", "assets"):
+                cached_bg = create_cached_background(screen_width)
             if cached_bg is None:
                 logger.error("Failed to create cached background")
 
         # Load the rest of the assets
-        load_player_sprites()
-        load_fonts()
-        load_cloud_image()
-        load_game_object_textures()
-        load_ui_assets()
+        with tracer.span("assets.player_sprites", "assets"):
+            load_player_sprites()
+        with tracer.span("assets.fonts", "assets"):
+            load_fonts()
+        with tracer.span("assets.clouds", "assets"):
+            load_cloud_image()
+        with tracer.span("assets.textures", "assets"):
+            load_game_object_textures()
+        with tracer.span("assets.ui", "assets"):
+            load_ui_assets()
         logger.info("All assets loaded successfully!")
     except SystemExit:
         # This will be triggered when one of the asset loading functions calls exit()
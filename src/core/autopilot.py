@@ -0,0 +1,359 @@
+"""
+Autopilot key source that plays the game well enough for long stress runs.
+
+The autopilot looks at the floors, platforms and obstacles ahead of the player
+and searches for a sequence of key states that keeps the player alive while
+moving right. Candidate moves are checked with a copy of the player's physics
+(gravity, jumps, double jumps, and floor and platform collisions swept with
+src.entities.physics), so it finds the same moves a good player would: jumping
+pits, hopping onto platforms, clearing spikes, fire, saws and bombs, and
+stopping mid-air to land between them.
+
+The search is greedy best-first on horizontal progress. A plan is accepted once
+it keeps the player alive for AUTOPILOT_PLAN_FRAMES and ends on solid ground.
+Plans are followed until they run low or the player drifts from the predicted
+path, so most frames cost no search at all.
+
+Plug it in like any other key source:
+    input_handler.set_key_source(Autopilot(game))
+"""
+
+import heapq
+import pygame
+from src.constants.player import (
+    BASE_MOVE_SPEED,
+    SPEED_BOOST_MULTIPLIER,
+    JUMP_VELOCITY,
+    GRAVITY,
+    FLYING_GRAVITY_REDUCTION,
+    MAX_BACKTRACK_DISTANCE,
+    INVINCIBILITY_DURATION,
+)
+from src.constants.screen import PLAY_AREA_HEIGHT
+from src.constants.simulation import (
+    FRAME_DURATION_MS,
+    AUTOPILOT_PLAN_FRAMES,
+    AUTOPILOT_MAX_PLAN_FRAMES,
+    AUTOPILOT_REPLAN_FRAMES,
+    AUTOPILOT_NODE_BUDGET,
+    AUTOPILOT_GOOD_PROGRESS,
+    AUTOPILOT_HAZARD_MARGIN,
+    AUTOPILOT_BOMB_FUSE_WARNING,
+)
+from src.core.input_recording import RecordedKeys, KEY_BITS
+from src.entities.physics import move_box, touches, TOP, BOTTOM
+from src.level.world_store import FLOOR, PLATFORM, OBSTACLE
+import src.utils.game_clock as game_clock
+from src.utils.logger import get_module_logger
+
+logger = get_module_logger("autopilot")
+
+LEFT = KEY_BITS[pygame.K_LEFT]
+RIGHT = KEY_BITS[pygame.K_RIGHT]
+SPACE = KEY_BITS[pygame.K_SPACE]
+
+# Key states tried at every planning step
+ACTIONS = (RIGHT, RIGHT | SPACE, 0, SPACE, LEFT)
+
+
+def _hold_frames(frame):
+    """Frames a planned key state is held for: short steps near the player allow
+    precise jumps, longer steps further ahead keep the search small."""
+    if frame < 12:
+        return 2
+    if frame < 36:
+        return 4
+    return 6
+
+
+class _Body:
+    """The parts of the player's state that the physics depends on."""
+
+    __slots__ = (
+        "x",
+        "y",
+        "vx",
+        "vy",
+        "jumping",
+        "double_jumped",
+        "space_held",
+        "furthest",
+    )
+
+    def __init__(self, x, y, vx, vy, jumping, double_jumped, space_held, furthest):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.jumping = jumping
+        self.double_jumped = double_jumped
+        self.space_held = space_held
+        self.furthest = furthest
+
+    def copy(self):
+        return _Body(
+            self.x,
+            self.y,
+            self.vx,
+            self.vy,
+            self.jumping,
+            self.double_jumped,
+            self.space_held,
+            self.furthest,
+        )
+
+    def key(self):
+        """Rounded state used to skip positions that were already explored."""
+        return (
+            int(self.x // 4),
+            int(self.y // 4),
+            int(self.vy),
+            self.vx,
+            self.jumping,
+            self.double_jumped,
+            self.space_held,
+        )
+
+
+class Autopilot:
+    """Key source that steers the player of a running game."""
+
+    def __init__(self, game, frames=None):
+        self.game = game
+        self.frame_count = frames
+        self.frame = 0
+        self.plans = 0  # Number of searches run
+        self.failed_plans = 0  # Searches that found no safe way forward
+        # Planned (key mask, expected x, expected y) for each upcoming frame
+        self._plan = []
+
+    @property
+    def finished(self):
+        """Check if the requested number of frames has been played."""
+        return self.frame_count is not None and self.frame >= self.frame_count
+
+    def next_keys(self):
+        """Return the key state for the next frame."""
+        self.frame += 1
+        player = self.game.player
+        if player.dying or player.immobilized:
+            self._plan = []
+            return RecordedKeys(RIGHT)
+
+        if len(self._plan) < AUTOPILOT_REPLAN_FRAMES or not self._on_track():
+            self._plan = self._make_plan()
+        mask = self._plan.pop(0)[0] if self._plan else RIGHT
+        return RecordedKeys(mask)
+
+    def _on_track(self):
+        """Check if the player is where the plan expects it to be."""
+        _, x, y = self._plan[0]
+        player = self.game.player
+        return abs(player.x - x) < 0.5 and abs(player.y - y) < 0.5
+
+    def _make_plan(self):
+        """Search for a new plan from the player's current state."""
+        player = self.game.player
+        width, height = player.width, player.height
+        move_speed = BASE_MOVE_SPEED * (
+            SPEED_BOOST_MULTIPLIER if player.speed_boost else 1
+        )
+        gravity = GRAVITY * (FLYING_GRAVITY_REDUCTION if player.flying else 1)
+
+        # Only look at objects the player can reach within the plan
+        horizon = AUTOPILOT_MAX_PLAN_FRAMES
+        left = player.x - move_speed * horizon - width
+        right = player.x + move_speed * horizon + width
+        world = self.game.world
+        floors = [
+            (f.x, f.y, f.width, f.height)
+            for f in world.query_range(left, right, (FLOOR,))
+            if f.x + f.width > left and f.x < right
+        ]
+        platforms = [
+            (p.x, p.y, p.width, p.height)
+            for p in world.query_range(left, right, (PLATFORM,))
+            if p.x + p.width > left and p.x < right
+        ]
+        hazards = self._hazards(left, right)
+        solids = [(floor, True, FLOOR) for floor in floors]
+        solids += [(platform, False, PLATFORM) for platform in platforms]
+
+        # Obstacles are harmless while an invincibility power-up lasts
+        safe_frames = 0
+        if player.invincible and not player.invincible_from_damage:
+            remaining = INVINCIBILITY_DURATION - (
+                game_clock.get_ticks() - player.invincible_timer
+            )
+            safe_frames = int(remaining / FRAME_DURATION_MS)
+
+        def step(body, mask, frame):
+            """Advance one frame like input_handler.handle_input and Player.update."""
+            # Input
+            if mask & LEFT:
+                body.vx = -move_speed
+            elif mask & RIGHT:
+                body.vx = move_speed
+            else:
+                body.vx = 0
+            space = bool(mask & SPACE)
+            if space and not body.space_held:
+                if not body.jumping:
+                    body.vy = JUMP_VELOCITY
+                    body.jumping = True
+                elif not body.double_jumped:
+                    body.vy = JUMP_VELOCITY
+                    body.double_jumped = True
+                elif player.flying:
+                    body.vy = -move_speed
+            body.space_held = space
+
+            # Movement, in one sweep like Player.update
+            body.vy += gravity
+            start_x, start_y = body.x, body.y
+            body.x, body.y, hits = move_box(
+                body.x, body.y, width, height, body.vx, body.vy, solids
+            )
+            for _, side in hits:
+                if side == TOP:
+                    body.vy = 0
+                    body.jumping = False
+                    body.double_jumped = False
+                elif side == BOTTOM:
+                    body.vy = 0
+            if body.x > body.furthest:
+                body.furthest = body.x
+            body.x = max(body.x, body.furthest - MAX_BACKTRACK_DISTANCE, 0)
+
+            if body.y > PLAY_AREA_HEIGHT:
+                return False
+            if frame >= safe_frames:
+                moved_x, moved_y = body.x - start_x, body.y - start_y
+                for hazard in hazards:
+                    if touches(
+                        start_x, start_y, width, height, moved_x, moved_y, hazard
+                    ):
+                        return False
+            return True
+
+        start = _Body(
+            player.x,
+            player.y,
+            player.vx,
+            player.vy,
+            player.jumping,
+            player.double_jumped,
+            self._space_held(),
+            player.furthest_right_position,
+        )
+
+        # Greedy best-first search: always extend the node furthest to the right.
+        # Nodes are (body, frame, parent node, planned frames of this step)
+        root = (start, 0, None, [])
+        queue = [(-start.x, 0, root)]
+        visited = {start.key()}
+        best = (0, start.x, root)  # Longest surviving node, for when all else fails
+        goal = None
+        counter = 0
+        nodes = 0
+
+        while queue and nodes < AUTOPILOT_NODE_BUDGET:
+            _, _, node = heapq.heappop(queue)
+            body, frame = node[0], node[1]
+            nodes += 1
+            hold = _hold_frames(frame)
+
+            for mask in ACTIONS:
+                trial = body.copy()
+                steps = []
+                alive = True
+                for i in range(hold):
+                    steps.append((mask, trial.x, trial.y))
+                    if not step(trial, mask, frame + i):
+                        alive = False
+                        break
+                end = frame + len(steps)
+                child = (trial, end, node, steps)
+                if end > best[0] or (end == best[0] and trial.x > best[1]):
+                    best = (end, trial.x, child)
+                if not alive:
+                    continue
+
+                # A plan is complete once it stays alive long enough and ends on
+                # solid ground. Keep the one that gets furthest
+                grounded = trial.vy == 0 and not trial.jumping
+                if (
+                    end >= AUTOPILOT_PLAN_FRAMES and grounded
+                ) or end >= AUTOPILOT_MAX_PLAN_FRAMES:
+                    if goal is None or trial.x > goal[0].x:
+                        goal = child
+                    continue
+
+                key = trial.key()
+                if key in visited:
+                    continue
+                visited.add(key)
+                counter += 1
+                heapq.heappush(queue, (-trial.x, counter, child))
+
+            # Stop early once a plan moves at close to full speed
+            if goal is not None and goal[0].x - start.x >= (
+                AUTOPILOT_GOOD_PROGRESS * move_speed * goal[1]
+            ):
+                break
+
+        self.plans += 1
+        if goal is None:
+            # No safe way forward: take the plan that stays alive the longest
+            self.failed_plans += 1
+            goal = best[2]
+            logger.debug(
+                f"No safe plan at x={int(player.x)}, surviving {best[0]} frames"
+            )
+
+        # Walk back up the tree to collect the planned frames
+        chunks = []
+        node = goal
+        while node is not None:
+            chunks.append(node[3])
+            node = node[2]
+        return [entry for chunk in reversed(chunks) for entry in chunk]
+
+    def _space_held(self):
+        """Check if SPACE was held last frame (a new press is needed to jump)."""
+        import src.core.input_handler as input_handler
+
+        return bool(input_handler.space_key_pressed)
+
+    def _hazards(self, left, right):
+        """Return the rectangles of obstacles the player must not touch."""
+        margin = AUTOPILOT_HAZARD_MARGIN
+        hazards = []
+        for obstacle in self.game.world.query_range(left, right, (OBSTACLE,)):
+            if obstacle.x + obstacle.width < left or obstacle.x > right:
+                continue
+            rect = obstacle.get_collision_rect()
+            # A lit bomb will explode soon: keep out of its blast
+            if (
+                obstacle.type == "bomb"
+                and obstacle.timer_started
+                and not obstacle.exploded
+                and obstacle.explosion_timer < AUTOPILOT_BOMB_FUSE_WARNING
+            ):
+                blast = obstacle.width * 3
+                rect = pygame.Rect(
+                    obstacle.x - blast / 2 + obstacle.width / 2,
+                    obstacle.y - blast / 2 + obstacle.height / 2,
+                    blast,
+                    blast,
+                )
+            if rect.width and rect.height:
+                hazards.append(
+                    (
+                        rect.x - margin,
+                        rect.y - margin,
+                        rect.width + 2 * margin,
+                        rect.height + 2 * margin,
+                    )
+                )
+        return hazards
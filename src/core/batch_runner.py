@@ -0,0 +1,271 @@
+"""
+Run many seeded headless games in parallel and aggregate the results.
+
+Each worker process keeps one headless Game and restarts it for every task,
+so assets are only loaded once per process. Games are driven by scripted
+input (ScriptedKeys), by the autopilot or by replaying input recordings.
+
+Usage:
+    python -m src.core.batch_runner --games 200 --frames 3600 --seed 1
+    python -m src.core.batch_runner --replay-dir recordings --workers 4
+    python -m src.core.batch_runner --games 50 --frames 7200 --autopilot
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import statistics
+import time
+
+# Keep the game's logging quiet unless asked otherwise (workers inherit this)
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("LOG_TO_FILE", "False")
+
+from src.constants.simulation import BATCH_DEFAULT_GAMES, HEADLESS_DEFAULT_FRAMES
+from src.utils.profiler import percentile
+from src.utils.logger import get_module_logger
+
+logger = get_module_logger("batch_runner")
+
+# Game kept by each worker process between tasks
+_worker_game = None
+
+
+def _init_worker():
+    """Create the worker's headless game."""
+    global _worker_game
+    # Batch games must never call the LLM service
+    os.environ["OPENAI_API_KEY"] = ""
+    # SDL turns SIGTERM into a quit event by default, which would stop the
+    # pool from terminating its workers
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+
+    from src.core.game import Game
+
+    _worker_game = Game(headless=True)
+
+
+def run_game(task):
+    """Run one game in the worker and return its result.
+
+    task is a dict with "index", "seed", "frames" and optionally "replay"
+    (path to an input recording), "autopilot" and "stop_on_game_over".
+    """
+    from src.core.autopilot import Autopilot
+    from src.core.input_recording import InputReplay
+    from src.core.input_scripts import ScriptedKeys
+    from src.utils.profiler import profiler
+    import src.core.input_handler as input_handler
+    import src.utils.game_clock as game_clock
+
+    seed = task["seed"]
+    frames = task["frames"]
+    if task.get("replay"):
+        key_source = InputReplay.load(task["replay"])
+        if key_source.seed is not None:
+            seed = key_source.seed
+        frames = frames or key_source.frame_count
+    elif task.get("autopilot"):
+        key_source = Autopilot(_worker_game, frames)
+    else:
+        key_source = ScriptedKeys(seed, frames)
+
+    game = _worker_game
+    game_clock.use_simulated_clock()
+    game.restart(seed)
+    input_handler.set_key_source(key_source)
+    # Keep every frame so percentiles cover the whole game
+    profiler.set_window(frames)
+
+    try:
+        result = game.run_headless(
+            frames, stop_on_game_over=task.get("stop_on_game_over", True)
+        )
+        result["frame_times"] = list(profiler.frame_times)
+    except Exception as e:
+        logger.error(f"Game {task['index']} (seed {seed}) failed: {e}")
+        result = {"seed": seed, "error": str(e)}
+    finally:
+        input_handler.set_key_source(None)
+
+    result["index"] = task["index"]
+    result["replay"] = task.get("replay")
+    return result
+
+
+def _stats(values):
+    """Summarize a list of numbers."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    return {
+        "min": ordered[0],
+        "median": percentile(ordered, 0.5),
+        "mean": statistics.fmean(ordered),
+        "p95": percentile(ordered, 0.95),
+        "max": ordered[-1],
+    }
+
+
+def aggregate(results):
+    """Combine the per-game results into one report."""
+    games = [r for r in results if "error" not in r]
+    errors = [r for r in results if "error" in r]
+
+    # Per-frame timings over every frame of every game
+    frame_times = sorted(t for r in games for t in r["frame_times"])
+    frame_summary = {
+        "frames": len(frame_times),
+        "p50_ms": percentile(frame_times, 0.5),
+        "p95_ms": percentile(frame_times, 0.95),
+        "p99_ms": percentile(frame_times, 0.99),
+        "max_ms": frame_times[-1] if frame_times else 0.0,
+    }
+
+    # Per-phase timings: typical game (median p50) and worst game (max p99)
+    phases = {}
+    for name in games[0]["profile"] if games else ():
+        phases[name] = {
+            "median_p50_ms": statistics.median(
+                r["profile"][name]["p50_ms"] for r in games
+            ),
+            "worst_p99_ms": max(r["profile"][name]["p99_ms"] for r in games),
+        }
+
+    object_kinds = games[0]["objects_alive"] if games else {}
+    return {
+        "games": len(results),
+        "errors": len(errors),
+        "game_overs": sum(1 for r in games if r["game_over"]),
+        "distance": _stats([r["distance"] for r in games]),
+        "score": _stats([r["score"] for r in games]),
+        "frames": _stats([r["frames"] for r in games]),
+        "segments_generated": _stats([r["segments_generated"] for r in games]),
+        "peak_objects_alive": _stats([r["peak_objects_alive"] for r in games]),
+        "world_churn": {
+            name: _stats([r["world_churn"][name] for r in games])
+            for name in (games[0]["world_churn"] if games else ())
+        },
+        "objects_alive": {
+            kind: _stats([r["objects_alive"][kind] for r in games])
+            for kind in object_kinds
+        },
+        "frame_time": frame_summary,
+        "phases": phases,
+    }
+
+
+def build_tasks(args):
+    """Create one task per game from the command line arguments."""
+    common = {
+        "frames": args.frames,
+        "autopilot": args.autopilot,
+        "stop_on_game_over": not args.keep_playing,
+    }
+    if args.replay_dir:
+        paths = sorted(glob.glob(os.path.join(args.replay_dir, "*")))
+        return [
+            dict(common, index=i, seed=None, replay=path)
+            for i, path in enumerate(paths)
+        ]
+    frames = args.frames or HEADLESS_DEFAULT_FRAMES
+    return [
+        dict(common, index=i, seed=args.seed + i, frames=frames)
+        for i in range(args.games)
+    ]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run many seeded headless Dasher games in parallel."
+    )
+    parser.add_argument(
+        "--games",
+        type=int,
+        default=BATCH_DEFAULT_GAMES,
+        help=f"Number of games to run with scripted input (default: {BATCH_DEFAULT_GAMES})",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=None,
+        help=f"Frames per game (default: {HEADLESS_DEFAULT_FRAMES}, or the replay length)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the first game; game i uses seed + i (default: 0)",
+    )
+    parser.add_argument(
+        "--replay-dir",
+        default=None,
+        help="Replay every input recording in this directory instead of scripted input",
+    )
+    parser.add_argument(
+        "--autopilot",
+        action="store_true",
+        help="Let the autopilot play instead of the scripted input",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--keep-playing",
+        action="store_true",
+        help="Start a new game after a game over instead of ending the run",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Write the report (with every game's result) to this JSON file",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    tasks = build_tasks(args)
+    if not tasks:
+        logger.error("No games to run")
+        return None
+
+    workers = args.workers or os.cpu_count() or 1
+    logger.info(f"Running {len(tasks)} games on {workers} workers")
+    start_time = time.perf_counter()
+
+    # Spawned workers start clean: pygame and the message thread do not survive fork
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(workers, initializer=_init_worker) as pool:
+        results = []
+        for result in pool.imap_unordered(run_game, tasks):
+            results.append(result)
+            logger.info(
+                f"Game {result['index']} finished ({len(results)}/{len(tasks)})"
+            )
+    results.sort(key=lambda r: r["index"])
+
+    report = aggregate(results)
+    report["workers"] = workers
+    report["elapsed"] = time.perf_counter() - start_time
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        for result in results:
+            result.pop("frame_times", None)
+        with open(args.output, "w") as f:
+            json.dump(dict(report, results=results), f, indent=2)
+        logger.info(f"Saved batch report to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,19 @@
 import asyncio
+import os
+import time
 import pygame
-from src.utils.compat import random, IS_WEB
+from src.utils.compat import IS_WEB, create_rng
 from src.core.assets_loader import load_all_assets
 from src.constants.colors import BLUE, RED
 from src.constants.screen import WIDTH, HEIGHT, PLAY_AREA_HEIGHT
+from src.constants.simulation import (
+    FRAME_DURATION_MS,
+    MAX_RENDER_FPS,
+    MAX_STEPS_PER_FRAME,
+    MAX_FRAME_TIME_MS,
+    INTERPOLATION_SNAP_DISTANCE,
+)
+from src.constants.level_generation import NEXT_SEGMENT_MARGIN
 from src.constants.game_states import (
     GAME_RUNNING,
     GAME_LOST_MESSAGE,
@@ -22,8 +32,22 @@ from src.entities.game_objects import Floor
 from src.ui.ui import draw_ui, draw_debug_info
 from src.entities.messages import message_manager
 import src.core.input_handler as input_handler
-from src.level.level_generator import generate_new_segment, remove_old_objects
+from src.level.level_generator import remove_old_objects, segment_start
+from src.level.pregenerator import SegmentPregenerator, lookahead_distance
+from src.level import segment_templates
+from src.level.world_store import (
+    WorldStore,
+    FLOOR,
+    PLATFORM,
+    OBSTACLE,
+    COIN,
+    POWER_UP,
+)
 from src.entities.effects import effect_manager
+import src.utils.game_clock as game_clock
+from src.utils.profiler import profiler
+from src.utils.tracer import tracer
+from src.utils.memory_monitor import memory_monitor
 from src.utils.logger import logger, get_module_logger
 from src.services.leaderboard import fetch_leaderboard, submit_score_and_wait
 
@@ -31,41 +55,87 @@ logger = get_module_logger("game")
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, seed=None):
+        self.headless = headless
+
+        # One seeded random number generator drives level generation, obstacles,
+        # effects and messages, so a seed always reproduces the same game
+        self.rng, self.seed = create_rng(seed)
+        effect_manager.set_rng(self.rng)
+        logger.info(f"Game seed: {self.seed}")
+
+        if self.headless:
+            # Use SDL's dummy drivers so no window or audio device is opened
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+            # Timers follow simulated frames instead of the wall clock
+            game_clock.use_simulated_clock()
+
         # Initialize Pygame
         pygame.init()
         logger.info("Pygame initialized")
 
         # Screen setup
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
-        pygame.display.set_caption("Dasher")
+        if self.headless:
+            # A display mode is still needed for convert_alpha() in the asset loader,
+            # but with the dummy driver it is just an offscreen surface
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+            pygame.display.set_caption("Dasher")
         self.clock = pygame.time.Clock()
-        logger.info(f"Screen setup complete: {WIDTH}x{HEIGHT}")
+        logger.info(f"Screen setup complete: {WIDTH}x{HEIGHT} (headless={headless})")
+
+        # Optionally write a Chrome trace of the frame timeline (desktop only).
+        # Started before asset loading so it shows up in the trace too
+        trace_path = None if IS_WEB else os.getenv("TRACE_OUTPUT_PATH")
+        if trace_path:
+            tracer.start(trace_path)
 
         # Load game assets
         try:
-            load_all_assets()
+            with tracer.span("load_all_assets", "assets"):
+                load_all_assets()
             logger.info("Game assets loaded")
         except Exception as e:
             logger.error(f"Failed to load assets: {str(e)}")
             exit()
 
+        # Optionally record the key state of every frame so the session can be
+        # replayed later with the same seed (desktop only)
+        self.record_input_path = None if IS_WEB else os.getenv("RECORD_INPUT_PATH")
+        self.games_started = 1
+        if self.record_input_path:
+            input_handler.start_recording(self.seed)
+
         # Set starting personality
         self.set_personality()
 
+        # Generates level segments ahead of the camera. Load the segment
+        # template library now rather than in the middle of the first segment
+        segment_templates.get_library()
+        self.pregenerator = SegmentPregenerator()
+
         # Initialize game state
         self.reset_game()
 
+        # Optionally track memory growth over long sessions (desktop only).
+        # Started after loading so the first snapshot is the baseline
+        memory_path = None if IS_WEB else os.getenv("MEMORY_MONITOR_PATH")
+        if memory_path:
+            memory_monitor.start(memory_path, self)
+
     def reset_game(self):
         # Initialize game
-        self.player = Player()
+        self.player = Player(rng=self.rng)
         self.camera_x = 0
-        self.rightmost_floor_end = WIDTH
-        self.floors = [Floor(0, WIDTH)]
-        self.platforms = []
-        self.obstacles = []
-        self.coins = []
-        self.power_ups = []
+        self.prev_camera_x = 0  # Camera position before the last simulation step
+        self.rightmost_floor_end = segment_start(0)
+        # Every floor, platform, obstacle, coin and power-up in the level
+        self.world = WorldStore()
+        self.world.insert(Floor(0, WIDTH), FLOOR)
+        self.pregenerator.reset()
+        self.segments_generated = 0
         self.game_over = False
         self.game_state = GAME_RUNNING
         self.game_over_timer = 0
@@ -73,7 +143,6 @@ class Game:
         self.score_submitted = False
         self.running = True
         self.frame_count = 0
-        self.last_time = pygame.time.get_ticks()
 
         # Reset conversation history for new game
         try:
@@ -91,17 +160,21 @@ class Game:
         # Starting personality
         if message_manager.llm_handler.is_available():
             if start_game:
-                starting_personality = message_manager.llm_handler.change_personality()
+                starting_personality = message_manager.llm_handler.change_personality(
+                    rng=self.rng
+                )
                 logger.info(f"Starting personality: {starting_personality}")
                 try:
-                    message_manager.set_message(random.choice(WELCOME_MESSAGES))
+                    message_manager.set_message(self.rng.choice(WELCOME_MESSAGES))
                 except Exception as e:
                     logger.warning(f"Failed to set welcome message: {str(e)}")
             else:
                 try:
-                    new_personality = message_manager.llm_handler.change_personality()
+                    new_personality = message_manager.llm_handler.change_personality(
+                        rng=self.rng
+                    )
                     message_manager.set_message(
-                        f"{random.choice(NEW_PERSONALITY_MESSAGES)} {new_personality.lower()}."
+                        f"{self.rng.choice(NEW_PERSONALITY_MESSAGES)} {new_personality.lower()}."
                     )
                     logger.info(f"Changed personality to {new_personality}")
                 except Exception as e:
@@ -110,9 +183,9 @@ class Game:
             # LLM service is not available
             message_manager.llm_handler.personality = DEFAULT_PERSONALITY
             if start_game:
-                message_manager.set_message(random.choice(WELCOME_MESSAGES))
+                message_manager.set_message(self.rng.choice(WELCOME_MESSAGES))
             else:
-                message_manager.set_message(random.choice(WELCOME_BACK_MESSAGES))
+                message_manager.set_message(self.rng.choice(WELCOME_BACK_MESSAGES))
             logger.info(
                 f"Using personality: {message_manager.llm_handler.get_current_personality()}"
             )
@@ -128,6 +201,14 @@ class Game:
                 pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
 
     def update(self, dt):
+        with profiler.phase("update"):
+            return self._update(dt)
+
+    def _update(self, dt):
+        # Sample this frame's key state (keyboard, replay or other key source)
+        with profiler.phase("update.input"):
+            input_handler.poll_keys()
+
         # Update message manager
         try:
             message_manager.update()
@@ -137,60 +218,58 @@ class Game:
         # Update game state
         if self.game_state == GAME_RUNNING:
             # Game logic
-            self.player_has_moved = (
-                input_handler.handle_input(self.player) or self.player_has_moved
-            )
+            with profiler.phase("update.input"):
+                self.player_has_moved = (
+                    input_handler.handle_input(self.player) or self.player_has_moved
+                )
 
-            self.game_over = self.player.update(
-                self.floors, self.platforms, self.obstacles, self.coins, self.power_ups
-            )
+            with profiler.phase("update.player"):
+                self.game_over = self.player.update(self.world)
 
             # If game_over is True, the player has completed their death animation
             if self.game_over:
                 self.game_state = GAME_LOST_MESSAGE
-                self.game_over_timer = pygame.time.get_ticks()
+                self.game_over_timer = game_clock.get_ticks()
 
             self.camera_x = input_handler.update_scroll(self.player, self.camera_x)
 
-            # Update animations for coins and power-ups
-            for coin in self.coins:
-                coin.update(dt)
-            for power_up in self.power_ups:
-                power_up.update(dt)
-            # Update animations for obstacles
-            for obstacle in self.obstacles:
-                obstacle.update(dt)
+            with profiler.phase("update.entities"):
+                # Update animations for coins and power-ups
+                for coin in self.world.objects(COIN):
+                    coin.update(dt)
+                for power_up in self.world.objects(POWER_UP):
+                    power_up.update(dt)
+                # Update animations for obstacles
+                for obstacle in self.world.objects(OBSTACLE):
+                    obstacle.update(dt)
 
             # Update effects
-            effect_manager.update(dt)
-
-            if self.camera_x + WIDTH > self.rightmost_floor_end - 600:
-                self.rightmost_floor_end = generate_new_segment(
-                    self.player,
-                    self.floors,
-                    self.platforms,
-                    self.obstacles,
-                    self.coins,
-                    self.power_ups,
-                    self.camera_x,
-                    WIDTH,
-                )
-
-            self.floors, self.platforms, self.obstacles, self.coins, self.power_ups = (
-                remove_old_objects(
-                    self.player,
-                    self.floors,
-                    self.platforms,
-                    self.obstacles,
-                    self.coins,
-                    self.power_ups,
-                )
-            )
+            with profiler.phase("update.effects"):
+                effect_manager.update(dt)
+
+            # Start the next segment ahead of time and add it once the camera
+            # gets close to the end of the level
+            add_at = self.rightmost_floor_end - NEXT_SEGMENT_MARGIN
+            camera_right = self.camera_x + WIDTH
+            if not self.pregenerator.pending and camera_right > add_at - (
+                lookahead_distance(self.player)
+            ):
+                with profiler.phase("update.generation"):
+                    self.pregenerator.start(self.seed, self.segments_generated)
+            if self.pregenerator.pending:
+                with profiler.phase("update.generation"):
+                    self.pregenerator.advance()
+            if camera_right > add_at:
+                with profiler.phase("update.generation"):
+                    self.add_segment(self.pregenerator.take())
+
+            with profiler.phase("update.cleanup"):
+                remove_old_objects(self.player, self.world)
 
         elif self.game_state == GAME_LOST_MESSAGE:
             # Show game over message for a few seconds
             if (
-                pygame.time.get_ticks() - self.game_over_timer
+                game_clock.get_ticks() - self.game_over_timer
                 > GAME_OVER_DISPLAY_DURATION
             ):
                 self.game_state = GAME_OVER
@@ -200,6 +279,15 @@ class Game:
                 )
 
         elif self.game_state == GAME_OVER:
+            # Every game gets a new level, from a seed drawn by the last one
+            self._set_seed(self.rng.getrandbits(32))
+            self.games_started += 1
+            if self.record_input_path:
+                # Each game is recorded on its own, so it replays with its seed
+                input_handler.stop_recording(
+                    self.get_recording_path(self.games_started - 1)
+                )
+                input_handler.start_recording(self.seed)
             # Reset the game
             self.reset_game()
             # After reset, change personality for the new game
@@ -207,119 +295,127 @@ class Game:
 
         return False  # Continue normal game loop
 
-    def draw(self):
+    def draw(self, interpolation=1.0):
+        with profiler.phase("draw"):
+            self._draw(interpolation)
+
+    def _draw(self, interpolation):
+        # Camera position blended between the last two simulation steps
+        camera_x = self.get_render_camera_x(interpolation)
+
         # Visible range for culling objects outside view
-        visible_range = (self.camera_x - 100, self.camera_x + WIDTH + 100)
+        visible_range = (camera_x - 100, camera_x + WIDTH + 100)
 
         if self.game_state == GAME_RUNNING or self.game_state == GAME_LOST_MESSAGE:
             # Draw background
-            draw_background(self.screen, self.camera_x)
+            with profiler.phase("draw.background"):
+                draw_background(self.screen, camera_x)
 
             # Draw game objects
-            for floor in self.floors:
-                if (
-                    floor.x + floor.width >= visible_range[0]
-                    and floor.x <= visible_range[1]
-                ):
-                    floor.draw(self.screen, self.camera_x)
-
-            for platform in self.platforms:
-                if (
-                    platform.x + platform.width >= visible_range[0]
-                    and platform.x <= visible_range[1]
-                ):
-                    platform.draw(self.screen, self.camera_x)
-
-            for obstacle in self.obstacles:
-                if (
-                    obstacle.x + obstacle.width >= visible_range[0]
-                    and obstacle.x <= visible_range[1]
-                ):
-                    obstacle.draw(self.screen, self.camera_x)
-
-            for coin in self.coins:
-                if (
-                    coin.x + coin.width >= visible_range[0]
-                    and coin.x <= visible_range[1]
-                ):
-                    coin.draw(self.screen, self.camera_x)
-
-            for power_up in self.power_ups:
-                if (
-                    power_up.x + power_up.width >= visible_range[0]
-                    and power_up.x <= visible_range[1]
-                ):
-                    power_up.draw(self.screen, self.camera_x)
-
-            self.player.draw(self.screen, self.camera_x)
-
-            # Draw effects
-            effect_manager.draw(self.screen, self.camera_x)
+            with profiler.phase("draw.world"):
+                self._draw_world(camera_x, visible_range)
 
-            draw_ui(self.screen, self.player)
+            with profiler.phase("draw.player"):
+                self.player.draw(self.screen, camera_x, interpolation)
 
-            # Draw debug info if enabled
-            if input_handler.show_debug:
-                draw_debug_info(self.screen, self.player)
-
-            # Draw welcome text if player hasn't moved yet
-            if not self.player_has_moved and self.game_state == GAME_RUNNING:
-                text = render_retro_text("Welcome to Dasher", 28, BLUE)
-                text_rect = text.get_rect(
-                    center=(WIDTH // 2, PLAY_AREA_HEIGHT // 2 - 50)
-                )
-                self.screen.blit(text, text_rect)
-
-            # Draw game over text if in game lost message state
-            if self.game_state == GAME_LOST_MESSAGE:
-                game_over_text = render_retro_text("GAME OVER", 36, RED)
-                game_over_rect = game_over_text.get_rect(
-                    center=(WIDTH // 2, PLAY_AREA_HEIGHT // 2 - 50)
-                )
-                self.screen.blit(game_over_text, game_over_rect)
+            # Draw effects
+            with profiler.phase("draw.effects"):
+                effect_manager.draw(self.screen, camera_x)
+
+            with profiler.phase("draw.ui"):
+                self._draw_overlays()
+
+    def _draw_world(self, camera_x, visible_range):
+        """Draw the level objects inside the visible range."""
+        left, right = visible_range
+        for kind in (FLOOR, PLATFORM, OBSTACLE, COIN, POWER_UP):
+            for obj in self.world.query_range(left, right, (kind,)):
+                if obj.x + obj.width >= left and obj.x <= right:
+                    obj.draw(self.screen, camera_x)
+
+    def _draw_overlays(self):
+        """Draw the HUD, debug info and welcome or game over text."""
+        draw_ui(self.screen, self.player)
+
+        # Draw debug info if enabled
+        if input_handler.show_debug:
+            draw_debug_info(self.screen, self.player)
+
+        # Draw welcome text if player hasn't moved yet
+        if not self.player_has_moved and self.game_state == GAME_RUNNING:
+            text = render_retro_text("Welcome to Dasher", 28, BLUE)
+            text_rect = text.get_rect(center=(WIDTH // 2, PLAY_AREA_HEIGHT // 2 - 50))
+            self.screen.blit(text, text_rect)
+
+        # Draw game over text if in game lost message state
+        if self.game_state == GAME_LOST_MESSAGE:
+            game_over_text = render_retro_text("GAME OVER", 36, RED)
+            game_over_rect = game_over_text.get_rect(
+                center=(WIDTH // 2, PLAY_AREA_HEIGHT // 2 - 50)
+            )
+            self.screen.blit(game_over_text, game_over_rect)
 
-                personality_text = render_retro_text(
-                    f"Player: {message_manager.llm_handler.get_current_personality()}",
-                    24,
-                    BLUE,
-                )
-                personality_rect = personality_text.get_rect(
-                    center=(WIDTH // 2, PLAY_AREA_HEIGHT // 2)
-                )
-                self.screen.blit(personality_text, personality_rect)
+            personality_text = render_retro_text(
+                f"Player: {message_manager.llm_handler.get_current_personality()}",
+                24,
+                BLUE,
+            )
+            personality_rect = personality_text.get_rect(
+                center=(WIDTH // 2, PLAY_AREA_HEIGHT // 2)
+            )
+            self.screen.blit(personality_text, personality_rect)
 
-                score_text = render_retro_text(
-                    f"Final Score: {self.player.score}", 24, BLUE
-                )
-                score_rect = score_text.get_rect(
-                    center=(WIDTH // 2, PLAY_AREA_HEIGHT // 2 + 50)
-                )
-                self.screen.blit(score_text, score_rect)
+            score_text = render_retro_text(
+                f"Final Score: {self.player.score}", 24, BLUE
+            )
+            score_rect = score_text.get_rect(
+                center=(WIDTH // 2, PLAY_AREA_HEIGHT // 2 + 50)
+            )
+            self.screen.blit(score_text, score_rect)
 
     async def run(self):
         logger.info("Game started")
 
+        # Timers follow simulation steps so they stay in sync with the physics
+        game_clock.use_simulated_clock(pygame.time.get_ticks())
+        last_time = time.perf_counter()
+        accumulator = 0.0
+
         try:
             while self.running:
                 # This is needed for Pygbag to work properly
                 # In web environment, this allows other tasks to run
                 await asyncio.sleep(0)
 
-                # Calculate delta time for smooth animations
-                current_time = pygame.time.get_ticks()
-                dt = (current_time - self.last_time) / 1000.0  # Convert to seconds
-                self.last_time = current_time
+                # Measure how much real time passed since the last rendered frame
+                current_time = time.perf_counter()
+                frame_time = (current_time - last_time) * 1000.0
+                last_time = current_time
+                accumulator += min(frame_time, MAX_FRAME_TIME_MS)
 
                 self.frame_count += 1
+                profiler.begin_frame()
 
                 # Handle events
-                self.handle_events()
-
-                # Update game state
-                submit_score = self.update(dt)
-
-                # Draw the game
-                self.draw()
+                with profiler.phase("events"):
+                    self.handle_events()
+
+                # Step the simulation at a fixed rate. When rendering falls behind,
+                # several steps run before the next draw (frame skipping), up to a cap
+                submit_score = False
+                steps = 0
+                while accumulator >= FRAME_DURATION_MS and steps < MAX_STEPS_PER_FRAME:
+                    submit_score = self.simulate_step() or submit_score
+                    accumulator -= FRAME_DURATION_MS
+                    steps += 1
+
+                # Past the cap, drop the backlog so the game slows down instead of
+                # spiralling into ever longer catch-up frames
+                if accumulator >= FRAME_DURATION_MS:
+                    accumulator %= FRAME_DURATION_MS
+
+                # Draw the game, interpolated between the last two simulation steps
+                self.draw(accumulator / FRAME_DURATION_MS)
 
                 # Submit score if game is over and score not yet submitted
                 if submit_score and IS_WEB and not self.score_submitted:
@@ -331,7 +427,9 @@ class Game:
 
                 # Update the display
                 pygame.display.flip()
-                self.clock.tick(60)  # 60 FPS
+                profiler.end_frame()
+                memory_monitor.update()
+                self.clock.tick(MAX_RENDER_FPS)
 
         except Exception as e:
             logger.error(f"Game loop error: {str(e)}")
@@ -340,6 +438,137 @@ class Game:
                 raise
         finally:
             logger.info("Game loop ended")
+            if self.record_input_path:
+                input_handler.stop_recording(
+                    self.get_recording_path(self.games_started)
+                )
+            tracer.stop()
+            memory_monitor.stop()
             if not IS_WEB:  # Don't quit pygame in web version
                 pygame.quit()
                 logger.info("Pygame quit")
+
+    def simulate_step(self):
+        """Advance the simulation by one fixed step of FRAME_DURATION_MS."""
+        self.save_render_state()
+        game_clock.advance(FRAME_DURATION_MS)
+        return self.update(FRAME_DURATION_MS / 1000.0)
+
+    def save_render_state(self):
+        """Remember positions before a simulation step for draw interpolation."""
+        self.prev_camera_x = self.camera_x
+        self.player.save_render_state()
+
+    def get_render_camera_x(self, interpolation=1.0):
+        """Return the camera position blended between the last two simulation steps."""
+        delta = self.camera_x - self.prev_camera_x
+        # Large jumps (a new game) snap instead of sliding
+        if abs(delta) > INTERPOLATION_SNAP_DISTANCE:
+            return self.camera_x
+        return self.prev_camera_x + delta * interpolation
+
+    def add_segment(self, segment):
+        """Add a generated segment to the world store."""
+        for kind, obj in segment.objects:
+            self.world.insert(obj, kind)
+        self.rightmost_floor_end = segment.end_x
+        self.segments_generated += 1
+
+    def restart(self, seed=None):
+        """Start a new game without reloading assets, optionally with a new seed."""
+        if seed is not None:
+            self._set_seed(seed)
+        effect_manager.effects = []
+        self.reset_game()
+
+    def _set_seed(self, seed):
+        self.rng.seed(seed)
+        self.seed = seed
+        logger.info(f"Game seed: {self.seed}")
+
+    def get_recording_path(self, game_number):
+        """Return the file the input of a game of this session is recorded to.
+
+        The first game goes to RECORD_INPUT_PATH and later ones next to it,
+        e.g. input_2.bin for the second game of input.bin.
+        """
+        if game_number == 1:
+            return self.record_input_path
+        root, extension = os.path.splitext(self.record_input_path)
+        return f"{root}_{game_number}{extension}"
+
+    def count_objects(self):
+        """Return the number of live level objects of each kind."""
+        return {
+            "floors": self.world.count(FLOOR),
+            "platforms": self.world.count(PLATFORM),
+            "obstacles": self.world.count(OBSTACLE),
+            "coins": self.world.count(COIN),
+            "power_ups": self.world.count(POWER_UP),
+            "effects": len(effect_manager.effects),
+        }
+
+    def get_rng_state(self):
+        """Snapshot the game's random number generator state."""
+        return self.rng.getstate()
+
+    def set_rng_state(self, state):
+        """Restore a snapshot taken with get_rng_state()."""
+        self.rng.setstate(state)
+
+    def run_headless(self, frames, draw=False, stop_on_game_over=False):
+        """Step the game for a number of frames as fast as possible and report FPS.
+
+        Nothing is flipped to a display and the frame rate is not capped. Each
+        frame advances the simulated clock by one target frame, so game timers
+        behave as they would at the target frame rate. If draw is True, the
+        game is also drawn into the offscreen screen surface every frame. If
+        stop_on_game_over is True, the run ends when the player dies instead
+        of starting a new game.
+        """
+        logger.info(f"Headless run started: {frames} frames, draw={draw}")
+        start_time = time.perf_counter()
+        frames_run = 0
+        peak_objects = 0
+
+        for _ in range(frames):
+            if not self.running:
+                break
+            if stop_on_game_over and self.game_state != GAME_RUNNING:
+                break
+
+            self.frame_count += 1
+            frames_run += 1
+            profiler.begin_frame()
+
+            with profiler.phase("events"):
+                self.handle_events()
+            self.simulate_step()
+            if draw:
+                self.draw()
+            profiler.end_frame()
+            memory_monitor.update()
+
+            peak_objects = max(peak_objects, len(self.world))
+
+        elapsed = time.perf_counter() - start_time
+        fps = frames_run / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            f"Headless run finished: {frames_run} frames in {elapsed:.2f}s ({fps:.1f} FPS)"
+        )
+
+        return {
+            "frames": frames_run,
+            "elapsed": elapsed,
+            "fps": fps,
+            "draw": draw,
+            "seed": self.seed,
+            "distance": self.player.furthest_right_position,
+            "score": self.player.score,
+            "game_over": self.game_state != GAME_RUNNING,
+            "segments_generated": self.segments_generated,
+            "objects_alive": self.count_objects(),
+            "peak_objects_alive": peak_objects,
+            "world_churn": dict(self.world.churn),
+            "profile": profiler.report(),
+        }
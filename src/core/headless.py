@@ -0,0 +1,126 @@
+"""
+Command line entry point for running the game headless.
+
+Usage:
+    python -m src.core.headless --frames 10000 --seed 42 --draw
+    python -m src.core.headless --replay recordings/session.dinp
+    python -m src.core.headless --autopilot --frames 7200 --draw
+    python -m src.core.headless --frames 3600 --draw --trace logs/trace.json
+    python -m src.core.headless --autopilot --frames 216000 --memory logs/memory.jsonl
+"""
+
+import argparse
+import json
+import os
+from src.constants.simulation import HEADLESS_DEFAULT_FRAMES
+from src.utils.logger import get_module_logger
+
+logger = get_module_logger("headless")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run Dasher without a window and report frames per second."
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=None,
+        help=f"Number of frames to simulate (default: {HEADLESS_DEFAULT_FRAMES}, or the replay length)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for the game's random number generator (random if omitted)",
+    )
+    parser.add_argument(
+        "--replay",
+        default=None,
+        help="Input recording to replay (also sets the seed and frame count)",
+    )
+    parser.add_argument(
+        "--autopilot",
+        action="store_true",
+        help="Let the autopilot play (reaches maximum difficulty in most seeds)",
+    )
+    parser.add_argument(
+        "--record",
+        default=None,
+        help="Record the simulated frames' key state to this file",
+    )
+    parser.add_argument(
+        "--draw",
+        action="store_true",
+        help="Also draw every frame into an offscreen surface",
+    )
+    parser.add_argument(
+        "--trace",
+        default=None,
+        help="Write a Chrome trace of the frame timeline to this file",
+    )
+    parser.add_argument(
+        "--memory",
+        default=None,
+        help="Write periodic memory snapshots (JSON lines) to this file",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    if args.trace:
+        # Read by Game so asset loading is traced as well
+        os.environ["TRACE_OUTPUT_PATH"] = args.trace
+    if args.memory:
+        os.environ["MEMORY_MONITOR_PATH"] = args.memory
+
+    # Import the game lazily so --help does not load pygame and the message system
+    from src.core.game import Game
+    from src.core.input_recording import InputReplay
+    from src.core.autopilot import Autopilot
+    import src.core.input_handler as input_handler
+
+    seed = args.seed
+    frames = args.frames
+    replay = None
+    if args.replay:
+        replay = InputReplay.load(args.replay)
+        if seed is None:
+            seed = replay.seed
+        if frames is None:
+            frames = replay.frame_count
+    if frames is None:
+        frames = HEADLESS_DEFAULT_FRAMES
+
+    game = Game(headless=True, seed=seed)
+    if replay is not None:
+        input_handler.set_key_source(replay)
+    elif args.autopilot:
+        input_handler.set_key_source(Autopilot(game))
+    if args.record:
+        input_handler.start_recording(game.seed)
+
+    result = game.run_headless(frames, draw=args.draw)
+
+    if args.record:
+        input_handler.stop_recording(args.record)
+    if replay is not None or args.autopilot:
+        input_handler.set_key_source(None)
+
+    from src.utils.tracer import tracer
+    from src.utils.memory_monitor import memory_monitor
+
+    tracer.stop()
+    memory_monitor.stop()
+
+    print(json.dumps(result, indent=2))
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -19,11 +19,65 @@ space_key_pressed = False
 d_key_pressed = False
 show_debug = False  # Start with debug off
 
+# Key state sampled for the current frame by poll_keys()
+current_keys = None
+# Replaces the keyboard when set (e.g. an InputReplay); must provide next_keys()
+key_source = None
+# Records every polled frame when set (an InputRecorder)
+input_recorder = None
+
+
+def poll_keys():
+    """Sample the key state for this frame from the keyboard or the active key source.
+
+    Called once per game update so that recording and replay line up frame by frame.
+    """
+    global current_keys
+    if key_source is not None:
+        keys = key_source.next_keys()
+    else:
+        keys = pygame.key.get_pressed()
+
+    if input_recorder is not None:
+        input_recorder.record(keys)
+
+    current_keys = keys
+    return keys
+
+
+def set_key_source(source):
+    """Feed key states from source.next_keys() instead of the keyboard (None to reset)."""
+    global key_source, current_keys
+    key_source = source
+    current_keys = None
+
+
+def start_recording(seed=None):
+    """Start recording the polled key state of every frame."""
+    global input_recorder
+    from src.core.input_recording import InputRecorder
+
+    input_recorder = InputRecorder(seed)
+    logger.info("Input recording started")
+
+
+def stop_recording(path=None):
+    """Stop recording, optionally saving the recording to path, and return it."""
+    global input_recorder
+    recorder = input_recorder
+    input_recorder = None
+    if recorder is not None and path:
+        try:
+            recorder.save(path)
+        except Exception as e:
+            logger.error(f"Failed to save input recording to {path}: {e}")
+    return recorder
+
 
 def handle_input(player):
     """Handle keyboard input for player movement and debug toggle."""
     global space_key_pressed, show_debug, d_key_pressed
-    keys = pygame.key.get_pressed()
+    keys = current_keys if current_keys is not None else pygame.key.get_pressed()
 
     # Toggle debug display with 'D' key (both uppercase and lowercase)
     # Note: pygame.K_d is lowercase 'd', pygame.K_CAPITAL_D doesn't exist
@@ -0,0 +1,187 @@
+"""
+Recording and replay of the per-frame keyboard state.
+
+Only the keys the game reads are stored: LEFT, RIGHT, SPACE and D. Each frame's
+key state is packed into a 4-bit mask, and consecutive frames with the same
+mask are run-length encoded, so a long session is usually a few kilobytes.
+
+File layout (little endian):
+    header: magic "DINP", version (u8), has_seed (u8), seed (u64), frames (u32)
+    body:   repeated runs of mask (u8) followed by the run length (varint)
+"""
+
+import os
+import struct
+import pygame
+from src.utils.logger import get_module_logger
+
+logger = get_module_logger("input_recording")
+
+RECORDING_MAGIC = b"DINP"
+RECORDING_VERSION = 1
+HEADER_FORMAT = struct.Struct("<4sBBQI")
+
+# Bit assigned to each recorded key
+KEY_BITS = {
+    pygame.K_LEFT: 1,
+    pygame.K_RIGHT: 2,
+    pygame.K_SPACE: 4,
+    pygame.K_d: 8,
+}
+
+
+def encode_keys(keys):
+    """Pack the recorded keys of a pygame key state into a bit mask."""
+    mask = 0
+    for key, bit in KEY_BITS.items():
+        if keys[key]:
+            mask |= bit
+    return mask
+
+
+def _write_varint(buffer, value):
+    """Append an unsigned LEB128 varint to a bytearray."""
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            buffer.append(byte | 0x80)
+        else:
+            buffer.append(byte)
+            return
+
+
+def _read_varint(data, offset):
+    """Read an unsigned LEB128 varint, returning (value, new_offset)."""
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated input recording")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+class RecordedKeys:
+    """Key state decoded from a recording, indexable like pygame.key.get_pressed()."""
+
+    def __init__(self, mask):
+        self.mask = mask
+
+    def __getitem__(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+
+class InputRecorder:
+    """Collects the key state of every frame as run-length encoded masks."""
+
+    def __init__(self, seed=None):
+        self.seed = seed
+        self.runs = []  # List of [mask, length] pairs
+        self.frame_count = 0
+
+    def record(self, keys):
+        """Record the key state for one frame."""
+        mask = encode_keys(keys)
+        if self.runs and self.runs[-1][0] == mask:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([mask, 1])
+        self.frame_count += 1
+
+    def to_bytes(self):
+        """Serialize the recording to the binary file format."""
+        data = bytearray(
+            HEADER_FORMAT.pack(
+                RECORDING_MAGIC,
+                RECORDING_VERSION,
+                1 if self.seed is not None else 0,
+                self.seed or 0,
+                self.frame_count,
+            )
+        )
+        for mask, length in self.runs:
+            data.append(mask)
+            _write_varint(data, length)
+        return bytes(data)
+
+    def save(self, path):
+        """Write the recording to a file."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = self.to_bytes()
+        with open(path, "wb") as f:
+            f.write(data)
+        logger.info(
+            f"Saved input recording to {path}: {self.frame_count} frames, {len(data)} bytes"
+        )
+
+
+class InputReplay:
+    """Feeds a recording back one frame at a time in place of the keyboard."""
+
+    def __init__(self, runs, seed=None):
+        self.runs = runs
+        self.seed = seed
+        self.frame_count = sum(length for _, length in runs)
+        self.frame = 0
+        self._run_index = 0
+        self._run_remaining = runs[0][1] if runs else 0
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Parse a recording from the binary file format."""
+        if len(data) < HEADER_FORMAT.size:
+            raise ValueError("Input recording is too short")
+        magic, version, has_seed, seed, frame_count = HEADER_FORMAT.unpack_from(data)
+        if magic != RECORDING_MAGIC:
+            raise ValueError("Not a Dasher input recording")
+        if version != RECORDING_VERSION:
+            raise ValueError(f"Unsupported input recording version: {version}")
+
+        runs = []
+        offset = HEADER_FORMAT.size
+        while offset < len(data):
+            mask = data[offset]
+            length, offset = _read_varint(data, offset + 1)
+            runs.append([mask, length])
+
+        replay = cls(runs, seed if has_seed else None)
+        if replay.frame_count != frame_count:
+            raise ValueError(
+                f"Input recording is corrupt: expected {frame_count} frames, found {replay.frame_count}"
+            )
+        return replay
+
+    @classmethod
+    def load(cls, path):
+        """Load a recording from a file."""
+        with open(path, "rb") as f:
+            replay = cls.from_bytes(f.read())
+        logger.info(
+            f"Loaded input recording from {path}: {replay.frame_count} frames, seed={replay.seed}"
+        )
+        return replay
+
+    @property
+    def finished(self):
+        """Check if every recorded frame has been replayed."""
+        return self.frame >= self.frame_count
+
+    def next_keys(self):
+        """Return the key state for the next frame (no keys once the replay ends)."""
+        if self.finished:
+            return RecordedKeys(0)
+
+        mask = self.runs[self._run_index][0]
+        self.frame += 1
+        self._run_remaining -= 1
+        if self._run_remaining == 0 and self._run_index + 1 < len(self.runs):
+            self._run_index += 1
+            self._run_remaining = self.runs[self._run_index][1]
+        return RecordedKeys(mask)
@@ -0,0 +1,59 @@
+"""
+Scripted key sources for headless and batch runs.
+
+A key source replaces the keyboard through input_handler.set_key_source() and
+returns one key state per frame from next_keys(), like InputReplay does for
+recordings.
+"""
+
+import random
+from src.core.input_recording import RecordedKeys, KEY_BITS
+import pygame
+
+# Frames the jump key is held for each press (releasing it allows the next jump)
+SCRIPTED_JUMP_HOLD_FRAMES = 6
+# Range of frames between jump presses
+SCRIPTED_JUMP_INTERVAL = (20, 90)
+# Chance of following a jump with a double jump
+SCRIPTED_DOUBLE_JUMP_CHANCE = 0.4
+
+
+class ScriptedKeys:
+    """Hold RIGHT and press SPACE at random intervals, seeded for repeatable runs.
+
+    Plays like an impatient player: it never stops or turns back, and jumps
+    (sometimes twice) without looking at what is ahead.
+    """
+
+    def __init__(self, seed=None, frames=None):
+        self.rng = random.Random(seed)
+        self.frame_count = frames
+        self.frame = 0
+        self._press_frames = set()
+        self._next_jump = self.rng.randint(*SCRIPTED_JUMP_INTERVAL)
+
+    @property
+    def finished(self):
+        """Check if the scripted number of frames has been played."""
+        return self.frame_count is not None and self.frame >= self.frame_count
+
+    def next_keys(self):
+        """Return the key state for the next frame."""
+        self.frame += 1
+
+        # Schedule the next jump (and maybe a double jump after it)
+        if self.frame >= self._next_jump:
+            start = self.frame
+            self._press_frames.update(range(start, start + SCRIPTED_JUMP_HOLD_FRAMES))
+            if self.rng.random() < SCRIPTED_DOUBLE_JUMP_CHANCE:
+                second = start + 2 * SCRIPTED_JUMP_HOLD_FRAMES
+                self._press_frames.update(
+                    range(second, second + SCRIPTED_JUMP_HOLD_FRAMES)
+                )
+            self._next_jump = self.frame + self.rng.randint(*SCRIPTED_JUMP_INTERVAL)
+
+        mask = KEY_BITS[pygame.K_RIGHT]
+        if self.frame in self._press_frames:
+            self._press_frames.discard(self.frame)
+            mask |= KEY_BITS[pygame.K_SPACE]
+        return RecordedKeys(mask)
@@ -39,23 +39,26 @@ class ParticleEffect(CollectionEffect):
         lifetime=1.0,
         size_range=(2, 5),
         speed_range=(50, 150),
+        rng=None,
     ):
         super().__init__(x, y, color, lifetime)
         self.particles = []
+        if rng is None:
+            rng = random
 
         # Create particles
         for _ in range(particle_count):
             # Random angle and speed
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(speed_range[0], speed_range[1])
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(speed_range[0], speed_range[1])
 
             # Calculate velocity components
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
 
             # Random size and fade rate
-            size = random.uniform(size_range[0], size_range[1])
-            fade_rate = random.uniform(0.5, 1.0)
+            size = rng.uniform(size_range[0], size_range[1])
+            fade_rate = rng.uniform(0.5, 1.0)
 
             self.particles.append(
                 {
@@ -166,9 +169,11 @@ class ParticleTrailEffect(CollectionEffect):
         size_range=(1, 3),
         speed_range=(20, 60),
         continuous=True,
+        rng=None,
     ):
         super().__init__(x, y, color, lifetime)
         self.particles = []
+        self.rng = rng if rng is not None else random
         self.size_range = size_range
         self.speed_range = speed_range
         self.continuous = continuous  # Whether to continuously emit particles
@@ -181,16 +186,16 @@ class ParticleTrailEffect(CollectionEffect):
     def _create_particles(self, count):
         """Create a batch of particles"""
         for _ in range(count):
-            size = random.uniform(self.size_range[0], self.size_range[1])
-            speed = random.uniform(self.speed_range[0], self.speed_range[1])
-            angle = random.uniform(0, 2 * math.pi)  # Random direction
+            size = self.rng.uniform(self.size_range[0], self.size_range[1])
+            speed = self.rng.uniform(self.speed_range[0], self.speed_range[1])
+            angle = self.rng.uniform(0, 2 * math.pi)  # Random direction
 
             # Calculate velocity components
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
 
             # Add some upward bias to the particles
-            vy -= random.uniform(10, 30)
+            vy -= self.rng.uniform(10, 30)
 
             # Create particle
             self.particles.append(
@@ -259,6 +264,7 @@ class ParticleTrailEffect(CollectionEffect):
 class CollectionEffectManager:
     def __init__(self):
         self.effects = []
+        self.rng = random  # Replaced with the game's seeded generator by set_rng()
 
         # Define colors for different effects
         self.coin_color = GOLD
@@ -269,6 +275,10 @@ class CollectionEffectManager:
             "life": RED,
         }
 
+    def set_rng(self, rng):
+        """Use the given random number generator for all new effects"""
+        self.rng = rng
+
     def create_coin_effect(self, x, y):
         """Create effects for coin collection"""
         # Particle explosion with reduced lifetime and range
@@ -281,6 +291,7 @@ class CollectionEffectManager:
                 lifetime=0.4,  # Reduced from 0.8
                 size_range=(1, 3),  # Reduced from (2, 4)
                 speed_range=(30, 100),  # Reduced from (50, 150)
+                rng=self.rng,
             )
         )
 
@@ -311,6 +322,7 @@ class CollectionEffectManager:
                 lifetime=0.5,  # Reduced from 1.0
                 size_range=(2, 4),  # Reduced from (3, 6)
                 speed_range=(40, 120),  # Reduced from (50, 150)
+                rng=self.rng,
             )
         )
 
@@ -338,6 +350,7 @@ class CollectionEffectManager:
                 size_range=(1, 3),
                 speed_range=(20, 60),
                 continuous=True,  # Ensure continuous emission
+                rng=self.rng,
             )
         )
 
@@ -352,6 +365,7 @@ class CollectionEffectManager:
                 size_range=(1, 3),
                 speed_range=(20, 60),
                 continuous=True,  # Ensure continuous emission
+                rng=self.rng,
             )
         )
 
@@ -366,6 +380,7 @@ class CollectionEffectManager:
                 size_range=(1, 3),
                 speed_range=(20, 60),
                 continuous=True,  # Ensure continuous emission
+                rng=self.rng,
             )
         )
 
@@ -29,6 +29,8 @@ class Floor:
         self.width = width
         self.height = FLOOR_HEIGHT
         self.y = PLAY_AREA_HEIGHT - self.height
+        # Rectangle the player collides with
+        self.collider = pygame.Rect(self.x, self.y, self.width, self.height)
 
     def draw(self, screen, camera_x):
         # Get the ground texture from asset_loader
@@ -66,6 +68,8 @@ class Platform:
         self.y = y
         self.width = width
         self.height = 20
+        # Rectangle the player collides with
+        self.collider = pygame.Rect(self.x, self.y, self.width, self.height)
 
     def draw(self, screen, camera_x):
         # Get the platform texture from asset_loader
@@ -103,7 +107,11 @@ class Obstacle:
         height=DEFAULT_OBSTACLE_SIZE,
         obstacle_type=None,
         difficulty_factor=0.0,
+        rng=None,
     ):
+        if rng is None:
+            rng = random
+
         self.x = x
         self.y = y
         self.width = width
@@ -130,7 +138,7 @@ class Obstacle:
 
             # Choose type based on weights
             total_weight = sum(weights)
-            r = random.uniform(0, total_weight)
+            r = rng.uniform(0, total_weight)
             cumulative_weight = 0
 
             for i, weight in enumerate(weights):
@@ -146,17 +154,21 @@ class Obstacle:
 
         # Animation properties
         self.animation_time = 0
-        self.animation_speed = random.uniform(0.5, 1.5)  # Random speed for variety
+        self.animation_speed = rng.uniform(0.5, 1.5)  # Random speed for variety
         self.frame_index = 0
         self.exploded = False
         self.explosion_time = 0
         self.explosion_started = False
         self.explosion_frame_index = 0
-        self.explosion_timer = random.uniform(2.0, 5.0)
+        self.explosion_timer = rng.uniform(2.0, 5.0)
         self.timer_started = False  # Flag to track if the bomb timer has started
         self.active = True  # Whether the obstacle is active (not exploded)
         self.visible_once = False  # Flag to track if the bomb has been visible
 
+        # Rectangle the player collides with, kept up to date by
+        # update_collider whenever the collision box changes
+        self.collider = pygame.Rect(0, 0, 0, 0)
+
         # Calculate the number of duplications needed for spikes and fire
         self.calculate_duplications()
 
@@ -217,20 +229,21 @@ class Obstacle:
                     self.y + self.height / 2 + 2
                 )  # Position collision box lower to the ground
 
-    def get_collision_rect(self):
-        """Return the collision rectangle for this obstacle"""
-        # If the obstacle is not active, return an empty rectangle
-        if not self.active:
-            return pygame.Rect(0, 0, 0, 0)
+        self.update_collider()
 
-        if self.type == "bomb" and self.exploded:
-            # Only return explosion collision during the active explosion frames
-            # Once the explosion is complete, return an empty rectangle
+    def update_collider(self):
+        """Move the collider to the rectangle this obstacle collides with now"""
+        # If the obstacle is not active, use an empty rectangle
+        if not self.active:
+            self.collider.update(0, 0, 0, 0)
+        elif self.type == "bomb" and self.exploded:
+            # Only collide with the explosion during the active explosion frames
+            # Once the explosion is complete, use an empty rectangle
             explosion_animation_frames = assets_loader.get_explosion_animation_frames()
             if self.explosion_frame_index < len(explosion_animation_frames):
                 # Explosion has a blast radius of 3x the bomb size
                 blast_radius = self.width * 3
-                return pygame.Rect(
+                self.collider.update(
                     self.x - blast_radius / 2 + self.width / 2,
                     self.y - blast_radius / 2 + self.height / 2,
                     blast_radius,
@@ -238,15 +251,34 @@ class Obstacle:
                 )
             else:
                 # Explosion animation is complete, no collision
-                return pygame.Rect(0, 0, 0, 0)
+                self.collider.update(0, 0, 0, 0)
         else:
-            return pygame.Rect(
+            self.collider.update(
                 self.collision_x,
                 self.collision_y,
                 self.collision_width,
                 self.collision_height,
             )
 
+    def get_collision_rect(self):
+        """Return the collision rectangle for this obstacle"""
+        return self.collider
+
+    def get_bounds(self):
+        """Return the largest area this obstacle can ever collide with.
+
+        A bomb's explosion reaches well past the bomb itself.
+        """
+        if self.type == "bomb":
+            blast_radius = self.width * 3
+            return (
+                self.x - blast_radius / 2 + self.width / 2,
+                self.y - blast_radius / 2 + self.height / 2,
+                blast_radius,
+                blast_radius,
+            )
+        return self.x, self.y, self.width, self.height
+
     def update(self, dt):
         # Update animation based on obstacle type
         self.animation_time += dt
@@ -294,6 +326,7 @@ class Obstacle:
                         # Ensure collision box is completely removed
                         self.collision_width = 0
                         self.collision_height = 0
+                        self.update_collider()
 
     def check_visibility(self, camera_x):
         """Check if the obstacle is visible on screen and start bomb timer if needed"""
@@ -477,7 +510,7 @@ class Obstacle:
                     if input_handler.show_debug and self.explosion_frame_index < len(
                         explosion_animation_frames
                     ):
-                        # Use the same calculation as in get_collision_rect method
+                        # Use the same calculation as in update_collider method
                         blast_radius = self.width * 3
                         explosion_rect = pygame.Rect(
                             self.x - blast_radius / 2 + self.width / 2 - camera_x,
@@ -524,6 +557,8 @@ class Coin:
         self.y = y
         self.width = COIN_SIZE
         self.height = COIN_SIZE
+        # Rectangle the player collides with
+        self.collider = pygame.Rect(self.x, self.y, self.width, self.height)
         # Animation variables
         self.animation_frame = 0
         self.animation_speed = 0.05
@@ -571,6 +606,9 @@ class PowerUp:
         self.y = y
         self.width = POWERUP_SIZE
         self.height = POWERUP_SIZE
+        # Rectangle the player collides with. The pulse only changes how the
+        # power-up is drawn, so it stays the same
+        self.collider = pygame.Rect(self.x, self.y, self.width, self.height)
         self.radius = 10
         self.type = type
         # Keep width and height properties for existing collision detection
@@ -1,4 +1,3 @@
-import pygame
 import asyncio
 import threading
 from src.constants.ui import (
@@ -7,7 +6,9 @@ from src.constants.ui import (
     MESSAGE_TRANSITION_DELAY,
 )
 from src.services.llm_message_handler import LLMMessageHandler
+import src.utils.game_clock as game_clock
 from src.utils.logger import get_module_logger
+from src.utils.tracer import tracer
 from src.utils.compat import IS_WEB
 from src.constants.messages import DEFAULT_MESSAGES
 
@@ -92,11 +93,15 @@ class StatusMessageManager:
 
     async def _process_with_llm(self, original_message):
         """Process the message through LLM"""
+        trace_id = tracer.async_begin("llm_request", "llm")
+        # The request is traced as failed unless the response comes back
+        status = "error"
         try:
             # Get the complete response as a string instead of streaming chunks
             full_response = await self.llm_handler.get_streaming_response(
                 original_message
             )
+            status = "ok"
 
             # Add the response to the queue if it's not a duplicate
             if (
@@ -125,6 +130,8 @@ class StatusMessageManager:
                 self.message_queue.append(original_message)
                 if not self.target_message:
                     self._load_next_message()
+        finally:
+            tracer.async_end("llm_request", trace_id, "llm", {"status": status})
 
     def _load_next_message(self):
         """Load the next message from the queue."""
@@ -139,7 +146,7 @@ class StatusMessageManager:
         next_message = self.message_queue.pop(0)
         logger.debug(next_message)
 
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         self.last_message_time = current_time
         self.target_message = next_message
         self.current_full_message = next_message
@@ -152,7 +159,7 @@ class StatusMessageManager:
 
     def update(self):
         """Update the streaming text effect."""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
 
         # If we're still streaming the message
         if self.display_index < len(self.target_message):
@@ -181,7 +188,7 @@ class StatusMessageManager:
 
     def can_show_default_message(self):
         """Check if enough time has passed to show a new default message."""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
 
         # Only show default messages if:
         # 1. Enough time has passed since the last message was shown
@@ -236,7 +243,7 @@ def get_status_message():
             # Set the message first
             message_manager.set_message(current_default_message)
             # Then update the last_message_time and increment the default message index
-            message_manager.last_message_time = pygame.time.get_ticks()
+            message_manager.last_message_time = game_clock.get_ticks()
             # Increment the default message index to cycle through the messages
             message_manager.default_message_index = (
                 message_manager.default_message_index + 1
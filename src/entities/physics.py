@@ -0,0 +1,148 @@
+"""
+Swept box collisions for moving the player through the level.
+
+A frame's movement is resolved in one sweep along the velocity instead of a
+horizontal and a vertical pass, so a fast box cannot skip through a thin
+platform or past the corner it should land on:
+
+    x, y, hits = move_box(x, y, width, height, dx, dy, solids)
+
+The box moves until the earliest solid it runs into (the time of impact),
+stops against it on that axis and slides along it with what is left of the
+movement on the other one. Boxes that already overlap a solid when the move
+starts are not stopped by it, so they can get out, except that a falling box
+is put back on top of a floor it is inside (see move_box).
+
+Rectangles are anything that unpacks to (x, y, width, height), e.g. the
+pygame.Rect colliders of the level objects or plain tuples.
+"""
+
+# Side of a solid the moving box ran into. TOP means it landed on the solid
+TOP = "top"
+BOTTOM = "bottom"
+LEFT = "left"
+RIGHT = "right"
+
+
+def _entry_and_exit(start, size, delta, other_start, other_size):
+    """Return the times of a move at which two ranges on an axis meet and part."""
+    near, far = other_start - start - size, other_start + other_size - start
+    if delta > 0:
+        return near / delta, far / delta
+    if delta < 0:
+        return far / delta, near / delta
+    # Not moving on this axis: the ranges overlap the whole move, or never
+    if near < 0 < far:
+        return float("-inf"), float("inf")
+    return None
+
+
+def sweep(x, y, width, height, dx, dy, rect):
+    """Return when and where a box moving by (dx, dy) runs into a rectangle.
+
+    Returns (time, side), where time is the fraction of the move done before
+    the boxes touch and side the side of rect that was hit, or None if the
+    box does not run into it during the move.
+    """
+    rx, ry, rw, rh = rect
+    if rw <= 0 or rh <= 0 or (not dx and not dy):
+        return None
+    # Most rectangles are nowhere near the area the box sweeps through
+    if dx > 0:
+        if x + dx + width <= rx or x >= rx + rw:
+            return None
+    elif x + width <= rx or x + dx >= rx + rw:
+        return None
+    if dy > 0:
+        if y + dy + height <= ry or y >= ry + rh:
+            return None
+    elif y + height <= ry or y + dy >= ry + rh:
+        return None
+
+    x_times = _entry_and_exit(x, width, dx, rx, rw)
+    y_times = _entry_and_exit(y, height, dy, ry, rh)
+    if x_times is None or y_times is None:
+        return None
+    entry = max(x_times[0], y_times[0])
+    if entry >= min(x_times[1], y_times[1]) or not 0 <= entry < 1:
+        return None
+
+    # The axis that starts overlapping last is the one the boxes meet on.
+    # Corners count as landing on or hitting the top or bottom
+    if y_times[0] >= x_times[0]:
+        return entry, TOP if dy > 0 else BOTTOM
+    return entry, LEFT if dx > 0 else RIGHT
+
+
+def touches(x, y, width, height, dx, dy, rect):
+    """Check if a moving box touches a rectangle on its way or where it ends."""
+    rx, ry, rw, rh = rect
+    end_x, end_y = x + dx, y + dy
+    if (
+        end_x < rx + rw
+        and end_x + width > rx
+        and end_y < ry + rh
+        and end_y + height > ry
+    ):
+        return True
+    return sweep(x, y, width, height, dx, dy, rect) is not None
+
+
+def move_box(x, y, width, height, dx, dy, solids):
+    """Move a box by (dx, dy), stopping and sliding along the solids it runs into.
+
+    solids are (rect, ledge, tag) triples. A ledge, such as a floor, is
+    climbed instead of blocking a box that runs into its side while falling,
+    or that is already inside it: the box is put on top of it and carries on.
+    Returns (x, y, hits), where hits are the (tag, side) pairs of the solids
+    run into, in order.
+    """
+    hits = []
+    if dy > 0:
+        for rect, ledge, tag in solids:
+            rx, ry, rw, rh = rect
+            if (
+                ledge
+                and x < rx + rw
+                and x + width > rx
+                and y < ry + rh
+                and y + height > ry
+            ):
+                y = ry - height
+                dy = 0
+                hits.append((tag, TOP))
+                break
+    # Every hit stops the move on one axis, so this ends after two hits
+    while dx or dy:
+        first = None
+        for solid in solids:
+            hit = sweep(x, y, width, height, dx, dy, solid[0])
+            if hit is not None and (first is None or hit[0] < first[0]):
+                first = (hit[0], hit[1], solid)
+        if first is None:
+            x += dx
+            y += dy
+            break
+
+        time, side, (rect, ledge, tag) = first
+        rx, ry, rw, rh = rect
+        x += dx * time
+        y += dy * time
+        dx -= dx * time
+        dy -= dy * time
+        if side in (LEFT, RIGHT) and ledge and dy > 0:
+            side = TOP
+        if side == TOP:
+            y = ry - height
+            dy = 0
+        elif side == BOTTOM:
+            y = ry + rh
+            dy = 0
+        elif side == LEFT:
+            x = rx - width
+            dx = 0
+        else:
+            x = rx + rw
+            dx = 0
+        hits.append((tag, side))
+    return x, y, hits
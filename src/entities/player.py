@@ -37,18 +37,24 @@ from src.constants.animation import (
     DEATH_ANIMATION_FRAME_DELAY,
     SPEED_BOOST_ANIMATION_FACTOR,
 )
+from src.constants.simulation import INTERPOLATION_SNAP_DISTANCE
 from src.utils.utils import collide
+from src.entities.physics import move_box, touches, TOP, BOTTOM
+from src.level.world_store import FLOOR, PLATFORM, OBSTACLE, COIN, POWER_UP
 from src.core.assets_loader import get_frame, player_frames, get_cloud_image
 import src.core.input_handler as input_handler
 import math
 from src.entities.effects import effect_manager
+import src.utils.game_clock as game_clock
 from src.utils.logger import get_module_logger
 
 logger = get_module_logger("player")
 
 
 class Player:
-    def __init__(self, x=PLAYER_INITIAL_X, y=PLAYER_INITIAL_Y):
+    def __init__(self, x=PLAYER_INITIAL_X, y=PLAYER_INITIAL_Y, rng=None):
+        # Random number generator for gameplay decisions (messages, trail particles)
+        self.rng = rng if rng is not None else random
         self.width = PLAYER_WIDTH
         self.height = PLAYER_HEIGHT
         self.x = x
@@ -81,6 +87,8 @@ class Player:
         self.furthest_right_position = self.x  # Track the furthest right position
         self.prev_x = self.x  # Added to track previous x position
         self.prev_y = self.y  # Added to track previous y position
+        self.render_prev_x = self.x  # Position before the last simulation step,
+        self.render_prev_y = self.y  # used to interpolate drawing between steps
 
         # Bonus score system variables
         self.bonus_score_active = False
@@ -119,32 +127,24 @@ class Player:
         self.sprite_offset_x = 0
         self.sprite_offset_y = 0
 
-    def draw(self, screen, camera_x):
-        screen_x = self.x - camera_x
+    def draw(self, screen, camera_x, interpolation=1.0):
+        # Position between the last two simulation steps
+        draw_x, draw_y = self.get_render_position(interpolation)
+        screen_x = draw_x - camera_x
 
         # Draw speed boost trail if active
         if self.speed_boost and not self.dying:
-            self._draw_speed_trail(screen, camera_x)
+            self._draw_speed_trail(screen, screen_x, draw_y)
 
         # Determine which animation to use based on player state
         animation_key = self._get_animation_key()
 
         # Update animation frame
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
 
-        # Handle death animation separately with slower speed
-        if self.dying:
-            if current_time - self.death_animation_timer > DEATH_ANIMATION_FRAME_DELAY:
-                self.death_animation_frame += 1
-                self.death_animation_timer = current_time
-
-                # Check if death animation is complete
-                if self.death_animation_frame >= len(player_frames["death_right"]):
-                    self.death_animation_complete = True
-                    self.death_animation_frame = (
-                        len(player_frames["death_right"]) - 1
-                    )  # Stay on last frame
-        else:
+        # The death animation is advanced by update() since it decides when the
+        # game ends, even when nothing is drawn
+        if not self.dying:
             # Normal animation update
             # Adjust animation speed for running with speed boost
             animation_speed = self.animation_speed
@@ -178,7 +178,7 @@ class Player:
 
         # Draw the sprite
         sprite_x = screen_x + self.sprite_offset_x
-        sprite_y = self.y + self.sprite_offset_y
+        sprite_y = draw_y + self.sprite_offset_y
 
         # Add motion blur effect when speed boost is active and moving
         if self.speed_boost and abs(self.vx) > 3 and not self.dying:
@@ -257,17 +257,17 @@ class Player:
                     self.cloud_image, True, False
                 )  # Flip horizontally
 
-            cloud_y = self.y + self.height - 38
+            cloud_y = draw_y + self.height - 38
 
             # Draw the cloud with slight bobbing motion
             bob_offset = (
-                math.sin(pygame.time.get_ticks() * 0.005) * 2
+                math.sin(game_clock.get_ticks() * 0.005) * 2
             )  # Gentle bobbing motion
             screen.blit(cloud_image, (cloud_x, cloud_y + bob_offset))
 
         # Draw dust effects if needed and not dying
         if not self.dying:
-            self._draw_dust_effects(screen, screen_x)
+            self._draw_dust_effects(screen, screen_x, draw_y)
 
         # Draw hitbox for debugging if enabled
         if input_handler.show_debug:
@@ -285,6 +285,26 @@ class Player:
                 1,
             )
 
+    def save_render_state(self):
+        """Remember the current position as the start point for draw interpolation."""
+        self.render_prev_x = self.x
+        self.render_prev_y = self.y
+
+    def get_render_position(self, interpolation=1.0):
+        """Return the position to draw at, blended between the last two simulation steps."""
+        dx = self.x - self.render_prev_x
+        dy = self.y - self.render_prev_y
+        # Teleports (respawning) should snap instead of sliding across the screen
+        if (
+            abs(dx) > INTERPOLATION_SNAP_DISTANCE
+            or abs(dy) > INTERPOLATION_SNAP_DISTANCE
+        ):
+            return self.x, self.y
+        return (
+            self.render_prev_x + dx * interpolation,
+            self.render_prev_y + dy * interpolation,
+        )
+
     def _get_animation_key(self):
         """Determine which animation to use based on player state."""
         # Determine direction suffix
@@ -295,7 +315,7 @@ class Player:
         # 1. Hurt animation when taking damage
         if self.invincible_from_damage:
             # Check if we're within the hurt animation duration
-            current_time = pygame.time.get_ticks()
+            current_time = game_clock.get_ticks()
             if current_time - self.hurt_animation_timer < self.hurt_animation_duration:
                 return "hurt" + dir_suffix
 
@@ -324,9 +344,9 @@ class Player:
         else:
             return "idle" + dir_suffix
 
-    def _draw_dust_effects(self, screen, screen_x):
+    def _draw_dust_effects(self, screen, screen_x, draw_y):
         """Draw dust effects for walking and double jumping."""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
 
         # Draw walking dust if player is moving on the ground
         if not self.jumping and abs(self.vx) > 0:
@@ -359,7 +379,7 @@ class Player:
             else:
                 dust_x = screen_x + self.width - 10  # Behind player when moving left
 
-            dust_y = self.y + self.height - 20  # At player's feet
+            dust_y = draw_y + self.height - 20  # At player's feet
 
             screen.blit(dust_frame, (dust_x, dust_y))
         else:
@@ -388,7 +408,7 @@ class Player:
 
                 # Position dust at the player's feet
                 dust_x = screen_x + (self.width - dust_frame.get_width()) // 2
-                dust_y = self.y + self.height - dust_frame.get_height()
+                dust_y = draw_y + self.height - dust_frame.get_height()
 
                 # Draw the dust effect
                 screen.blit(dust_frame, (dust_x, dust_y))
@@ -413,18 +433,17 @@ class Player:
                     )
                     screen.blit(larger_frame, (larger_x, larger_y))
 
-    def _draw_speed_trail(self, screen, camera_x):
+    def _draw_speed_trail(self, screen, screen_x, draw_y):
         """Draw a trail effect behind the player when speed boost is active."""
-        # Calculate screen_x for this method
-        screen_x = self.x - camera_x
-
         # Add a speed line effect when moving fast
         if abs(self.vx) >= 5:
             line_length = min(30, abs(self.vx) * 3)
             line_start_x = screen_x + (0 if self.direction == "right" else self.width)
-            line_start_y = self.y + self.height // 2
+            line_start_y = draw_y + self.height // 2
 
             for i in range(1):
+                # Cosmetic only: use the shared random source so drawing never
+                # advances the game's seeded generator
                 y_offset = random.randint(-10, 10)
                 line_end_x = line_start_x + (
                     -line_length if self.direction == "right" else line_length
@@ -437,16 +456,17 @@ class Player:
                     2,
                 )
 
-    def update(self, floors, platforms, obstacles, coins, power_ups):
+    def update(self, world):
         # If player is dying, just update the death animation and return
         if self.dying:
+            self._update_death_animation()
             # Check if death animation is complete
             if self.death_animation_complete:
                 return True  # Return True to indicate game over
             return False  # Return False to continue showing death animation
 
         if self.immobilized:
-            if pygame.time.get_ticks() - self.immobilized_timer > IMMOBILIZED_DURATION:
+            if game_clock.get_ticks() - self.immobilized_timer > IMMOBILIZED_DURATION:
                 self.immobilized = False
             return False  # Return False to indicate no game over
 
@@ -462,60 +482,63 @@ class Player:
         self.prev_x = self.x
         self.prev_y = self.y
 
+        # Only check the objects around the area the player sweeps through
+        # this frame
+        swept_x = min(self.x, self.x + self.vx)
+        swept_y = min(self.y, self.y + self.vy)
+        swept_width = abs(self.vx) + self.width
+        swept_height = abs(self.vy) + self.height
+        floors, platforms, obstacles = world.query_rect_by_kind(
+            swept_x, swept_y, swept_width, swept_height, (FLOOR, PLATFORM, OBSTACLE)
+        )
+
         # Track if we're colliding with an obstacle this frame
         obstacle_collision = False
         collided_obstacle = None
 
-        # Move horizontally first
-        self.x += self.vx
-
         # Update player direction based on velocity
         if self.vx > 0:
             self.direction = "right"
         elif self.vx < 0:
             self.direction = "left"
 
-        # Check for horizontal collisions with obstacles
-        for obstacle in obstacles:
-            if collide(self, obstacle):
-                # Get the collision rectangle for the obstacle
-                obstacle_rect = obstacle.get_collision_rect()
-                player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-
-                # Check if player collides with the collision rectangle
-                if player_rect.colliderect(obstacle_rect):
-                    # Handle special case for bomb
-                    if obstacle.type == "bomb" and not obstacle.exploded:
-                        # Skip bomb explosion if player is invincible from power-up
-                        if not (self.invincible and not self.invincible_from_damage):
-                            # Trigger bomb explosion on contact only if not invincible from power-up
-                            obstacle.start_explosion()
-                        # Don't count as collision yet (explosion will damage later)
-                    # Skip collision handling if player is invincible from power-up (not from damage)
-                    elif self.invincible and not self.invincible_from_damage:
-                        # Allow player to pass through obstacles when invincible from power-up
-                        pass
-                    else:
-                        obstacle_collision = True
-                        collided_obstacle = obstacle
-                        if self.vx > 0:  # Moving right
-                            self.x = (
-                                obstacle_rect.x - self.width
-                            )  # Place player to the left of the obstacle
-                        elif self.vx < 0:  # Moving left
-                            self.x = (
-                                obstacle_rect.x + obstacle_rect.width
-                            )  # Place player to the right of the obstacle
-
-        # Check for horizontal collisions with platforms (treating them as solid objects too)
-        for platform in platforms:
-            if collide(self, platform):
-                # Only block horizontal movement if we're not landing on top
-                if not (self.vy > 0 and self.prev_y + self.height <= platform.y):
-                    if self.vx > 0:  # Moving right
-                        self.x = platform.x - self.width
-                    elif self.vx < 0:  # Moving left
-                        self.x = platform.x + platform.width
+        # Obstacles don't block the player while invincible from a power-up
+        # (not from damage), and bombs go off when touched instead
+        passable = self.invincible and not self.invincible_from_damage
+        solids = [(floor.collider, True, (FLOOR, floor)) for floor in floors]
+        solids += [
+            (platform.collider, False, (PLATFORM, platform)) for platform in platforms
+        ]
+        if not passable:
+            solids += [
+                (obstacle.collider, False, (OBSTACLE, obstacle))
+                for obstacle in obstacles
+                if obstacle.type != "bomb" or obstacle.exploded
+            ]
+
+        # Move in one sweep, stopping at the floors, platforms and obstacles in
+        # the way. Floors are climbed when the player falls against their side
+        self.x, self.y, hits = move_box(
+            self.x, self.y, self.width, self.height, self.vx, self.vy, solids
+        )
+        for (kind, obj), side in hits:
+            if side == TOP:  # Landed on top
+                self.vy = 0
+                self.jumping = False
+                self.double_jumped = False  # Reset double jump when landing
+                # Respawn here, unless the player slid off the edge already
+                if (
+                    kind != OBSTACLE
+                    and self.x < obj.x + obj.width
+                    and self.x + self.width > obj.x
+                ):
+                    self.respawn_x = self.x
+                    self.respawn_y = self.y
+            elif side == BOTTOM:  # Hit from below
+                self.vy = 0  # Stop upward movement
+            if kind == OBSTACLE:
+                obstacle_collision = True
+                collided_obstacle = obj
 
         # Update furthest right position if player moves further right
         if self.x > self.furthest_right_position:
@@ -530,89 +553,30 @@ class Player:
         if self.x < dynamic_left_boundary:
             self.x = dynamic_left_boundary
 
-        # Now move vertically
-        self.y += self.vy
-
-        # Collide with floors
-        for floor in floors:
-            if collide(self, floor) and self.vy > 0:
-                self.y = floor.y - self.height
-                self.vy = 0
-                self.jumping = False
-                self.double_jumped = False  # Reset double jump when landing
-                self.respawn_x = self.x
-                self.respawn_y = self.y
-
-        # Collide with platforms - improved to prevent falling through at high speeds
-        for platform in platforms:
-            # Check if player is currently colliding with platform
-            if collide(self, platform):
-                # Case 1: Player is landing on top of the platform
-                if self.vy > 0 and (  # Moving downward
-                    self.y + self.height <= platform.y + 10
-                    or self.prev_y + self.height  # Either feet are near the top
-                    <= platform.y
-                ):  # OR was above the platform in previous frame
-                    self.y = platform.y - self.height
-                    self.vy = 0
-                    self.jumping = False
-                    self.double_jumped = False  # Reset double jump when landing
-                    self.respawn_x = self.x
-                    self.respawn_y = self.y
-                # Case 2: Player is hitting the bottom or sides of the platform
-                elif self.vy < 0:  # Moving up
-                    self.y = platform.y + platform.height
-                    self.vy = 0  # Stop upward movement
-
-            # Additional check for tunneling: check if player "jumped over" the platform in this frame
-            # This handles cases where player moved so fast they went from below to above the platform in one frame
-            elif (
-                not collide(self, platform)
-                and self.prev_y + self.height  # Not currently colliding
-                > platform.y + platform.height
-                and self.y < platform.y  # Was below the platform
-                and self.x + self.width > platform.x  # Now above the platform
-                and self.x < platform.x + platform.width
-            ):  # Horizontally aligned
-                # Player tunneled through the platform, place them on top
-                self.y = platform.y - self.height
-                self.vy = 0
-                self.jumping = False
-                self.double_jumped = False
-                self.respawn_x = self.x
-                self.respawn_y = self.y
-
-        # Vertical collision with obstacles
+        # Obstacles touched on the way without blocking the player: a bomb, or
+        # an explosion that went off around the player
+        moved_x = self.x - self.prev_x
+        moved_y = self.y - self.prev_y
         for obstacle in obstacles:
-            if collide(self, obstacle):
-                # Get the collision rectangle for the obstacle
-                obstacle_rect = obstacle.get_collision_rect()
-                player_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-
-                # Check if player collides with the collision rectangle
-                if player_rect.colliderect(obstacle_rect):
-                    # Handle special case for bomb
-                    if obstacle.type == "bomb" and not obstacle.exploded:
-                        # Skip bomb explosion if player is invincible from power-up
-                        if not (self.invincible and not self.invincible_from_damage):
-                            # Trigger bomb explosion on contact only if not invincible from power-up
-                            obstacle.start_explosion()
-                        # Don't count as collision yet (explosion will damage later)
-                    # Skip collision handling if player is invincible from power-up (not from damage)
-                    elif self.invincible and not self.invincible_from_damage:
-                        # Allow player to pass through obstacles when invincible from power-up
-                        pass
-                    else:
-                        obstacle_collision = True
-                        collided_obstacle = obstacle
-                        if self.vy > 0:  # Moving down
-                            self.y = obstacle_rect.y - self.height
-                            self.vy = 0
-                            self.jumping = False
-                            self.double_jumped = False
-                        elif self.vy < 0:  # Moving up
-                            self.y = obstacle_rect.y + obstacle_rect.height
-                            self.vy = 0
+            if not touches(
+                self.prev_x,
+                self.prev_y,
+                self.width,
+                self.height,
+                moved_x,
+                moved_y,
+                obstacle.collider,
+            ):
+                continue
+            # Handle special case for bomb
+            if obstacle.type == "bomb" and not obstacle.exploded:
+                # Skip bomb explosion if player is invincible from power-up
+                if not passable:
+                    obstacle.start_explosion()
+                # Don't count as collision yet (explosion will damage later)
+            elif not passable:
+                obstacle_collision = True
+                collided_obstacle = obstacle
 
         # Pit fall
         if self.y > PLAY_AREA_HEIGHT:
@@ -628,11 +592,11 @@ class Player:
                 elif self.lives == 1 and not message_manager.has_shown_message(
                     "last_life"
                 ):
-                    message_manager.set_message(random.choice(LAST_LIFE_MESSAGES))
+                    message_manager.set_message(self.rng.choice(LAST_LIFE_MESSAGES))
                     message_manager.mark_message_shown("last_life")
 
                 # Set pit fall message
-                message_manager.set_message(random.choice(PIT_FALL_MESSAGES))
+                message_manager.set_message(self.rng.choice(PIT_FALL_MESSAGES))
 
                 self.x = self.respawn_x
                 self.y = self.respawn_y
@@ -643,7 +607,7 @@ class Player:
                 self.start_invincibility(from_damage=True)
 
                 self.immobilized = True
-                self.immobilized_timer = pygame.time.get_ticks()
+                self.immobilized_timer = game_clock.get_ticks()
             else:
                 # Start death animation
                 self.start_death_animation()
@@ -669,23 +633,25 @@ class Player:
                     elif self.lives == 1 and not message_manager.has_shown_message(
                         "last_life"
                     ):
-                        message_manager.set_message(random.choice(LAST_LIFE_MESSAGES))
+                        message_manager.set_message(self.rng.choice(LAST_LIFE_MESSAGES))
                         message_manager.mark_message_shown("last_life")
 
                     # Set obstacle collision message based on obstacle type
                     if collided_obstacle:
                         if collided_obstacle.type == "spikes":
-                            message_manager.set_message(random.choice(SPIKES_MESSAGES))
+                            message_manager.set_message(
+                                self.rng.choice(SPIKES_MESSAGES)
+                            )
                         elif collided_obstacle.type == "fire":
-                            message_manager.set_message(random.choice(FIRE_MESSAGES))
+                            message_manager.set_message(self.rng.choice(FIRE_MESSAGES))
                         elif (
                             collided_obstacle.type == "bomb"
                             and collided_obstacle.exploded
                         ):
-                            message_manager.set_message(random.choice(BOMB_MESSAGES))
+                            message_manager.set_message(self.rng.choice(BOMB_MESSAGES))
                         else:
                             message_manager.set_message(
-                                random.choice(OBSTACLE_MESSAGES)
+                                self.rng.choice(OBSTACLE_MESSAGES)
                             )
 
                     # Start invincibility and hurt animation
@@ -708,9 +674,13 @@ class Player:
                     self.start_death_animation()
                     return False  # Return False to continue showing death animation
 
-        # Collect coins
-        for coin in coins[:]:
-            if collide(self, coin):
+        # Collect coins and power-ups near the player's final position
+        nearby_coins, nearby_power_ups = world.query_rect_by_kind(
+            self.x, self.y, self.width, self.height, (COIN, POWER_UP)
+        )
+
+        for coin in nearby_coins:
+            if collide(self, coin.collider):
                 self.coin_score += 50
                 # Create collection effect at the coin's position
                 effect_manager.create_coin_effect(coin.x, coin.y)
@@ -718,11 +688,11 @@ class Player:
                 from src.ui.ui import set_score_highlight
 
                 set_score_highlight(50)
-                coins.remove(coin)
+                world.remove(coin, COIN)
 
         # Collect power-ups
-        for power_up in power_ups[:]:
-            if collide(self, power_up):
+        for power_up in nearby_power_ups:
+            if collide(self, power_up.collider):
                 # Create collection effect at the power-up's position
                 effect_manager.create_powerup_effect(
                     power_up.x, power_up.y, power_up.type
@@ -733,22 +703,22 @@ class Player:
 
                 if power_up.type == "speed":
                     self.speed_boost = True
-                    self.speed_boost_timer = pygame.time.get_ticks()
-                    message_manager.set_message(random.choice(SPEED_MESSAGES))
+                    self.speed_boost_timer = game_clock.get_ticks()
+                    message_manager.set_message(self.rng.choice(SPEED_MESSAGES))
                 elif power_up.type == "flying":
                     self.flying = True
-                    self.flying_timer = pygame.time.get_ticks()
-                    message_manager.set_message(random.choice(FLYING_MESSAGES))
+                    self.flying_timer = game_clock.get_ticks()
+                    message_manager.set_message(self.rng.choice(FLYING_MESSAGES))
                 elif power_up.type == "invincibility":
                     self.start_invincibility(from_damage=False)
-                    message_manager.set_message(random.choice(INVINCIBILITY_MESSAGES))
+                    message_manager.set_message(self.rng.choice(INVINCIBILITY_MESSAGES))
                 elif power_up.type == "life":
                     self.add_life()
-                    message_manager.set_message(random.choice(LIFE_MESSAGES))
-                power_ups.remove(power_up)
+                    message_manager.set_message(self.rng.choice(LIFE_MESSAGES))
+                world.remove(power_up, POWER_UP)
 
         # Update power-up effects
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         if (
             self.speed_boost
             and current_time - self.speed_boost_timer > SPEED_BOOST_DURATION
@@ -804,7 +774,7 @@ class Player:
                 # Display bonus message
                 from src.ui.ui import message_manager
 
-                message_manager.set_message(random.choice(SCORE_BONUS_MESSAGES))
+                message_manager.set_message(self.rng.choice(SCORE_BONUS_MESSAGES))
 
                 # Reset for next bonus score period with increased requirement
                 self.bonus_score_timer = current_time
@@ -842,7 +812,7 @@ class Player:
             # Create speed trail particles when speed boost is active (even when idle)
             if self.speed_boost:
                 # Only create particles occasionally for performance
-                if random.random() < 0.2:  # 20% chance each frame
+                if self.rng.random() < 0.2:  # 20% chance each frame
                     # Position particles at the player's feet
                     particle_x = self.x + (
                         0 if self.direction == "right" else self.width
@@ -853,7 +823,7 @@ class Player:
             # Create invincibility trail particles when invincibility is active (even when idle)
             if self.invincible and not self.invincible_from_damage:
                 # Only create particles occasionally for performance
-                if random.random() < 0.2:  # 20% chance each frame
+                if self.rng.random() < 0.2:  # 20% chance each frame
                     # Position particles at the player's feet
                     particle_x = self.x + (
                         0 if self.direction == "right" else self.width
@@ -863,7 +833,7 @@ class Player:
 
             if self.flying:
                 # Only create particles occasionally for performance
-                if random.random() < 0.2:  # 20% chance each frame
+                if self.rng.random() < 0.2:  # 20% chance each frame
                     # Position particles at the player's feet
                     particle_x = self.x + (
                         0 if self.direction == "right" else self.width
@@ -875,23 +845,37 @@ class Player:
 
     def start_invincibility(self, from_damage=False):
         self.invincible = True
-        self.invincible_timer = pygame.time.get_ticks()
+        self.invincible_timer = game_clock.get_ticks()
         self.invincible_from_damage = from_damage
 
         # Initialize flashing effect when taking damage
         if from_damage:
             self.invincible_flash = True
-            self.invincible_flash_timer = pygame.time.get_ticks()
+            self.invincible_flash_timer = game_clock.get_ticks()
             # Reset the hurt animation timer when taking damage
-            self.hurt_animation_timer = pygame.time.get_ticks()
+            self.hurt_animation_timer = game_clock.get_ticks()
             # Reset animation frame to start the hurt animation from the beginning
             self.animation_frame = 0
 
+    def _update_death_animation(self):
+        """Advance the death animation, which plays at its own slower speed."""
+        current_time = game_clock.get_ticks()
+        if current_time - self.death_animation_timer > DEATH_ANIMATION_FRAME_DELAY:
+            self.death_animation_frame += 1
+            self.death_animation_timer = current_time
+
+            # Check if death animation is complete
+            if self.death_animation_frame >= len(player_frames["death_right"]):
+                self.death_animation_complete = True
+                self.death_animation_frame = (
+                    len(player_frames["death_right"]) - 1
+                )  # Stay on last frame
+
     def start_death_animation(self):
         """Start the death animation sequence"""
         self.dying = True
         self.death_animation_frame = 0
-        self.death_animation_timer = pygame.time.get_ticks()
+        self.death_animation_timer = game_clock.get_ticks()
         self.death_animation_complete = False
 
         # Stop all movement
@@ -910,7 +894,7 @@ class Player:
         # Set death message
         from src.ui.ui import message_manager
 
-        message_manager.set_message(random.choice(DEATH_MESSAGES))
+        message_manager.set_message(self.rng.choice(DEATH_MESSAGES))
 
     def add_life(self):
         """Add a life to the player and reset the last_life message flag."""
@@ -938,7 +922,7 @@ class Player:
         self.double_jumped = True
         self.show_double_jump_dust = True
         self.double_jump_dust_frame = 0
-        self.double_jump_dust_timer = pygame.time.get_ticks()
+        self.double_jump_dust_timer = game_clock.get_ticks()
 
     def get_collision_rect(self):
         """Return a slightly smaller collision rectangle for the player.
@@ -1,6 +1,8 @@
+import functools
+import math
 import pygame
 from src.utils.compat import random
-from src.constants.screen import PLAY_AREA_HEIGHT
+from src.constants.screen import WIDTH, PLAY_AREA_HEIGHT
 from src.constants.difficulty import (
     DIFFICULTY_START_DISTANCE,
     DIFFICULTY_MAX_DISTANCE,
@@ -16,116 +18,281 @@ from src.constants.difficulty import (
     MAX_SAW_SIZE,
 )
 from src.constants.level_generation import (
-    SEGMENT_LENGTH_MULTIPLIER,
-    GRID_CELL_SIZE,
+    SEGMENT_LENGTH,
+    MIN_FLOOR_WIDTH,
     OBSTACLE_BUFFER,
     MIN_PLATFORM_WIDTH,
     MAX_PLATFORM_WIDTH,
     PLATFORM_EDGE_BUFFER,
     MIN_PLATFORM_HORIZONTAL_DISTANCE,
+    TEMPLATE_SEGMENT_CHANCE,
 )
-from src.constants.game_objects import FLOOR_HEIGHT
-from src.constants.player import MAX_BACKTRACK_DISTANCE
+from src.constants.game_objects import FLOOR_HEIGHT, POWERUP_TYPES
+from src.constants.player import PLAYER_WIDTH, MAX_BACKTRACK_DISTANCE
 from src.entities.game_objects import Floor, Platform, Obstacle, Coin, PowerUp
+from src.level.world_store import (
+    WorldStore,
+    KINDS,
+    FLOOR,
+    PLATFORM,
+    OBSTACLE,
+    COIN,
+    POWER_UP,
+)
+from src.level import segment_templates
+from src.level.reachability import NORMAL_JUMPS, can_cross_pit
 from src.utils.logger import get_module_logger
 
 logger = get_module_logger("level_generator")
 
+# Kinds of objects that new obstacles, coins and power-ups must keep clear of
+_PLACED = (PLATFORM, OBSTACLE, COIN, POWER_UP)
+
+
+class Segment:
+    """The content of one generated segment of the level."""
+
+    def __init__(self, index, objects, end_x):
+        self.index = index
+        self.objects = objects  # (kind, object) pairs
+        self.end_x = end_x
+
+
+def segment_start(index):
+    """Return the x position a segment starts at.
+
+    Segments follow the start area, a single floor one screen wide.
+    """
+    return WIDTH + index * SEGMENT_LENGTH
+
+
+def segment_rng(seed, index):
+    """Return the random number generator for one segment of a game."""
+    return random.Random(f"{seed}:{index}")
+
+
+def difficulty_at(x):
+    """Return the difficulty factor (0.0 to 1.0) of the level at an x position."""
+    progress = max(0, x - DIFFICULTY_START_DISTANCE)
+    return min(1.0, progress / (DIFFICULTY_MAX_DISTANCE - DIFFICULTY_START_DISTANCE))
+
+
+def run_steps(steps):
+    """Run a step generator (see generate_segment_steps) to the end and return its result."""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as finished:
+            return finished.value
+
+
+def generate_segment(seed, index):
+    """Generate one segment of the level with floors, platforms, obstacles, and collectibles.
+
+    The content only depends on the game seed and the segment index: every
+    random decision comes from the segment's own generator, the difficulty
+    comes from where the segment starts, and all objects stay within the
+    segment with room to spare at its edges. Segments can therefore be
+    generated in any order, in other threads or processes, and again after
+    they were dropped, always with the same result.
+
+    Most segments are taken from the segment template library when it is
+    available (see segment_templates), the rest are generated in full.
+    """
+    return run_steps(generate_segment_steps(seed, index))
+
+
+def generate_segment_steps(seed, index):
+    """Do the work of generate_segment in small steps.
+
+    A generator that yields between steps and returns the Segment. Segments
+    taken from the template library are a single step, fully generated ones
+    take a step per floor.
+    """
+    start_x = segment_start(index)
+    end_x = start_x + SEGMENT_LENGTH
+    difficulty_factor = difficulty_at(start_x)
+    rng = segment_rng(seed, index)
+
+    library = segment_templates.get_library()
+    if library and rng.random() < TEMPLATE_SEGMENT_CHANCE:
+        templates = library[segment_templates.band_of(difficulty_factor)]
+        objects = segment_templates.instantiate(
+            rng.choice(templates), start_x, difficulty_factor, rng
+        )
+        return Segment(index, objects, end_x)
+
+    world = WorldStore()
+    yield from fill_segment_steps(world, start_x, end_x, difficulty_factor, rng)
+    objects = [(kind, obj) for kind in KINDS for obj in world.objects(kind)]
+    return Segment(index, objects, end_x)
+
 
-def generate_new_segment(
-    player, floors, platforms, obstacles, coins, power_ups, camera_x, width
+def overlaps_segment_objects(
+    world, new_x, segment_end_x, x, y, width, height, support=None
 ):
-    """Generate a new segment of the level with floors, platforms, obstacles, and collectibles."""
-    last_floor = floors[-1]
-    new_x = last_floor.x + last_floor.width
-
-    # Calculate difficulty factor (0.0 to 1.0) based on player's progress
-    progress = max(0, player.furthest_right_position - DIFFICULTY_START_DISTANCE)
-    difficulty_factor = min(
-        1.0, progress / (DIFFICULTY_MAX_DISTANCE - DIFFICULTY_START_DISTANCE)
+    """Check if a rectangle would overlap with any object of a segment.
+
+    new_x and segment_end_x are the edges of the segment being generated into
+    world. support is the platform the new object stands on, which it may touch.
+    """
+    test_rect = pygame.Rect(x, y, width, height)
+
+    # Add a small buffer around objects. Keep the same buffer from the
+    # segment's edges, so objects of neighbouring segments never overlap
+    buffer = OBSTACLE_BUFFER
+    if x < new_x + buffer or x + width > segment_end_x - buffer:
+        return True
+    nearby = world.query_rect(
+        x - buffer, y - buffer, width + 2 * buffer, height + 2 * buffer, _PLACED
     )
+    for obj in nearby:
+        if obj is support:
+            continue
+        obj_rect = obj.collider
+        expanded_obj_rect = pygame.Rect(
+            obj_rect.x - buffer,
+            obj_rect.y - buffer,
+            obj_rect.width + 2 * buffer,
+            obj_rect.height + 2 * buffer,
+        )
+        if test_rect.colliderect(expanded_obj_rect):
+            return True
+    return False
 
-    # Generate a larger segment at once (3x the previous size)
-    segment_length = width * SEGMENT_LENGTH_MULTIPLIER
-    segment_end_x = new_x + segment_length
-
-    # Pre-calculate the visible right edge
-    visible_right_edge = camera_x + width
-
-    # Track generated obstacles for collision detection
-    generated_obstacles = []
-
-    # Create a spatial grid for faster collision detection
-    collision_grid = {}
-
-    def add_to_collision_grid(obj, x, y, w, h):
-        """Add an object to the collision grid for faster lookups"""
-        # Calculate grid cells this object occupies
-        start_cell_x = int(x // GRID_CELL_SIZE)
-        end_cell_x = int((x + w) // GRID_CELL_SIZE)
-        start_cell_y = int(y // GRID_CELL_SIZE)
-        end_cell_y = int((y + h) // GRID_CELL_SIZE)
-
-        # Add object to all cells it occupies
-        for cell_x in range(start_cell_x, end_cell_x + 1):
-            for cell_y in range(start_cell_y, end_cell_y + 1):
-                cell_key = (cell_x, cell_y)
-                if cell_key not in collision_grid:
-                    collision_grid[cell_key] = []
-                collision_grid[cell_key].append((obj, pygame.Rect(x, y, w, h)))
-
-    def would_overlap_with_obstacle(x, y, width, height):
-        """Check if a rectangle would overlap with any obstacle using the grid"""
-        test_rect = pygame.Rect(x, y, width, height)
-
-        # Calculate grid cells to check
-        start_cell_x = int(x // GRID_CELL_SIZE)
-        end_cell_x = int((x + width) // GRID_CELL_SIZE)
-        start_cell_y = int(y // GRID_CELL_SIZE)
-        end_cell_y = int((y + height) // GRID_CELL_SIZE)
-
-        # Check for collisions in relevant grid cells only
-        for cell_x in range(start_cell_x, end_cell_x + 1):
-            for cell_y in range(start_cell_y, end_cell_y + 1):
-                cell_key = (cell_x, cell_y)
-                if cell_key in collision_grid:
-                    for _, obs_rect in collision_grid[cell_key]:
-                        # Add a small buffer around obstacles
-                        buffer = OBSTACLE_BUFFER
-                        expanded_obs_rect = pygame.Rect(
-                            obs_rect.x - buffer,
-                            obs_rect.y - buffer,
-                            obs_rect.width + 2 * buffer,
-                            obs_rect.height + 2 * buffer,
-                        )
-                        if test_rect.colliderect(expanded_obs_rect):
-                            return True
-        return False
 
-    def is_too_close_to_existing_platforms(x, width):
-        """Check if a new platform would be too close horizontally to existing platforms"""
-        # Since new platforms are generated to the right, we primarily need to check
-        # if the left edge of the new platform (x) is too close to the right edge
-        # of any existing platform (platform.x + platform.width)
+def too_close_to_platforms(world, new_x, segment_end_x, x, width):
+    """Check if a new platform would be too close horizontally to existing platforms"""
+    # Since new platforms are generated to the right, we primarily need to check
+    # if the left edge of the new platform (x) is too close to the right edge
+    # of any existing platform (platform.x + platform.width)
+
+    # Calculate the right edge of the new platform
+    right_edge = x + width
+
+    # Platforms of the previous segment can end right at its start
+    if x < new_x + MIN_PLATFORM_HORIZONTAL_DISTANCE or right_edge > segment_end_x:
+        return True
+
+    # Check against the platforms that could be close enough to matter
+    nearby = world.query_range(
+        x - MIN_PLATFORM_HORIZONTAL_DISTANCE, right_edge, (PLATFORM,)
+    )
+    for platform in nearby:
+        # Check for overlapping platforms (where the new platform starts before an existing platform ends)
+        if x <= platform.x + platform.width and right_edge >= platform.x:
+            return True
+
+        # Calculate the distance from the right edge of an existing platform to the left edge of the new platform
+        distance = x - (platform.x + platform.width)
+
+        # If the distance is less than the minimum and positive (meaning the new platform is to the right),
+        # the platforms are too close
+        if 0 <= distance < MIN_PLATFORM_HORIZONTAL_DISTANCE:
+            return True
+
+    return False
+
+
+def free_positions(
+    world, new_x, segment_end_x, left, right, y, width, height, support=None
+):
+    """Find where between left and right a rectangle fits without overlaps.
+
+    A position fits where overlaps_segment_objects would accept it. Returns
+    (first, last) ranges of whole-pixel offsets from left, in order.
+    """
+    buffer = OBSTACLE_BUFFER
+    first = max(0, math.ceil(new_x + buffer - left))
+    last = min(int(right - left), math.floor(segment_end_x - buffer - width - left))
+    if first > last:
+        return []
+
+    # Collision tests use whole-pixel rects, as overlaps_segment_objects does
+    base, top = int(left), int(y)
+    width, height = int(width), int(height)
+    blocked = []
+    nearby = world.query_rect(
+        left - buffer,
+        y - buffer,
+        right - left + width + 2 * buffer,
+        height + 2 * buffer,
+        _PLACED,
+    )
+    for obj in nearby:
+        if obj is support:
+            continue
+        obj_rect = obj.collider
+        if obj_rect.width <= 0 or obj_rect.height <= 0:
+            continue
+        ex, ey = obj_rect.x - buffer, obj_rect.y - buffer
+        ew, eh = obj_rect.width + 2 * buffer, obj_rect.height + 2 * buffer
+        if top < ey + eh and top + height > ey:
+            blocked.append((ex - width - base + 1, ex + ew - base - 1))
+
+    # What is left of first..last after taking out the blocked ranges
+    ranges = []
+    for start, end in sorted(blocked):
+        if start > first:
+            ranges.append((first, min(start - 1, last)))
+        first = max(first, end + 1)
+        if first > last:
+            break
+    else:
+        ranges.append((first, last))
+    return ranges
+
+
+def pick_position(ranges, u):
+    """Return the offset at fraction u (0.0 to 1.0) of the free_positions ranges.
+
+    Every free position is equally likely for a uniform u.
+    """
+    k = int(u * sum(last - first + 1 for first, last in ranges))
+    for first, last in ranges:
+        if k <= last - first:
+            return first + k
+        k -= last - first + 1
+    return ranges[-1][1]
+
+
+def fill_segment(world, new_x, segment_end_x, difficulty_factor, rng):
+    """Add a segment's objects to an empty world store and return where it ends.
+
+    This is the full generator, also used to build the segment template library.
+    """
+    return run_steps(
+        fill_segment_steps(world, new_x, segment_end_x, difficulty_factor, rng)
+    )
+
 
-        # Calculate the right edge of the new platform
-        right_edge = x + width
+def fill_segment_steps(world, new_x, segment_end_x, difficulty_factor, rng):
+    """Do the work of fill_segment a floor at a time.
 
-        # Check against all existing platforms
-        for platform in platforms:
-            # Check for overlapping platforms (where the new platform starts before an existing platform ends)
-            if x <= platform.x + platform.width and right_edge >= platform.x:
-                return True
+    Yields after each floor and returns where the segment ends, so callers
+    can spread a segment over several frames.
+    """
 
-            # Calculate the distance from the right edge of an existing platform to the left edge of the new platform
-            distance = x - (platform.x + platform.width)
+    # Checks of new objects against the ones placed so far
+    would_overlap_with_obstacle = functools.partial(
+        overlaps_segment_objects, world, new_x, segment_end_x
+    )
+    is_too_close_to_existing_platforms = functools.partial(
+        too_close_to_platforms, world, new_x, segment_end_x
+    )
 
-            # If the distance is less than the minimum and positive (meaning the new platform is to the right),
-            # the platforms are too close
-            if 0 <= distance < MIN_PLATFORM_HORIZONTAL_DISTANCE:
-                return True
+    def place(left, right, y, width, height, support=None):
+        """Return a random free x between left and right, or None if there is none.
 
-        return False
+        Positions are drawn from the free ranges directly instead of drawing
+        and testing, so placement costs one draw and only fails when nothing fits.
+        """
+        ranges = free_positions(
+            world, new_x, segment_end_x, left, right, y, width, height, support
+        )
+        if not ranges:
+            return None
+        return left + pick_position(ranges, rng.random())
 
     # Generate floor segments to fill the entire new segment
     current_x = new_x
@@ -136,12 +303,16 @@ def generate_new_segment(
         )
 
         # Determine if there will be a pit
-        has_pit = random.random() < pit_chance
+        has_pit = rng.random() < pit_chance
         if has_pit:
             # Scale pit width based on difficulty
             max_pit_width = 300 + int((MAX_PIT_WIDTH - 300) * difficulty_factor)
-            pit_width = random.randint(MIN_PIT_WIDTH, max_pit_width)
+            pit_width = rng.randint(MIN_PIT_WIDTH, max_pit_width)
+            # The segment ends with a floor, so skip pits that leave no room for one
+            has_pit = current_x + pit_width + MIN_FLOOR_WIDTH <= segment_end_x
+        if has_pit:
             current_x += pit_width
+            pit_platform = None
 
             # Always add a platform above the pit for the player to use
             # Ensure the platform width is appropriate for the pit width
@@ -153,7 +324,7 @@ def generate_new_segment(
             )  # Ensure min_platform_width is not greater than max_platform_width
 
             if max_platform_width >= min_platform_width:
-                platform_width = random.randint(min_platform_width, max_platform_width)
+                platform_width = rng.randint(min_platform_width, max_platform_width)
 
                 # Calculate valid range for platform placement
                 min_x_position = (
@@ -165,259 +336,159 @@ def generate_new_segment(
 
                 # Ensure we have a valid range
                 if max_x_position > min_x_position:
-                    platform_x = random.randint(min_x_position, max_x_position)
+                    platform_x = rng.randint(min_x_position, max_x_position)
                 else:
                     # If no valid range, place platform in the middle of the pit
                     platform_x = current_x - pit_width / 2 - platform_width / 2
 
-                platform_y = random.randint(100, PLAY_AREA_HEIGHT - 150)
+                platform_y = rng.randint(100, PLAY_AREA_HEIGHT - 150)
                 new_platform = Platform(platform_x, platform_y, platform_width)
 
                 # Only add the platform if it's not too close to existing platforms
                 if not is_too_close_to_existing_platforms(platform_x, platform_width):
-                    platforms.append(new_platform)
-                    add_to_collision_grid(
-                        new_platform, platform_x, platform_y, platform_width, 20
-                    )  # Changed from 10 to 20 to match Platform.height
+                    world.insert(new_platform, PLATFORM)
+                    pit_platform = (platform_x, platform_y, platform_width)
             else:
                 # If pit is too narrow for a platform, place a wider platform that extends beyond the pit
                 platform_width = 150
                 platform_x = (
                     current_x - pit_width - PLATFORM_EDGE_BUFFER
                 )  # Place it starting before the pit
-                platform_y = random.randint(100, PLAY_AREA_HEIGHT - 150)
+                platform_y = rng.randint(100, PLAY_AREA_HEIGHT - 150)
                 new_platform = Platform(platform_x, platform_y, platform_width + 100)
 
                 # Only add the platform if it's not too close to existing platforms
                 if not is_too_close_to_existing_platforms(
                     platform_x, platform_width + 100
                 ):
-                    platforms.append(new_platform)
-                    add_to_collision_grid(
-                        new_platform, platform_x, platform_y, platform_width + 100, 20
-                    )  # Changed from 10 to 20
+                    world.insert(new_platform, PLATFORM)
+                    pit_platform = (platform_x, platform_y, platform_width + 100)
+
+            # Bring the next floor closer if the player could not get over the pit
+            pit_start = current_x - pit_width
+            if not can_cross_pit(pit_start, current_x, platform=pit_platform):
+                current_x = pit_start + NORMAL_JUMPS.reach(0) + PLAYER_WIDTH
 
         # Add a floor segment
-        floor_width = random.randint(100, 300)
-        if current_x + floor_width > segment_end_x:
-            floor_width = max(
-                100, segment_end_x - current_x
-            )  # Ensure minimum width of 100px
+        floor_width = rng.randint(MIN_FLOOR_WIDTH, 300)
+        if segment_end_x - (current_x + floor_width) < MIN_FLOOR_WIDTH:
+            # No room for another floor: end the segment with this one
+            floor_width = segment_end_x - current_x
 
         new_floor = Floor(current_x, floor_width)
-        floors.append(new_floor)
+        world.insert(new_floor, FLOOR)
         current_x += floor_width
 
         # Platform (additional platforms besides the ones over pits)
-        if random.random() < 0.5:
+        if rng.random() < 0.5:
             # Ensure floor_width is large enough for a platform
             if floor_width >= 100:
-                platform_x = (
-                    current_x - floor_width + random.randint(0, floor_width - 100)
-                )
-                platform_y = random.randint(100, PLAY_AREA_HEIGHT - 100)
-                platform_width = random.randint(50, 150)
+                platform_x = current_x - floor_width + rng.randint(0, floor_width - 100)
+                platform_y = rng.randint(100, PLAY_AREA_HEIGHT - 100)
+                platform_width = rng.randint(50, 150)
                 new_platform = Platform(platform_x, platform_y, platform_width)
 
                 # Only add the platform if it's not too close to existing platforms
                 if not is_too_close_to_existing_platforms(platform_x, platform_width):
-                    platforms.append(new_platform)
-                    add_to_collision_grid(
-                        new_platform, platform_x, platform_y, platform_width, 20
-                    )  # Changed from 10 to 20
-
-        # Only generate obstacles and collectibles if they'll be off-screen
-        if current_x > visible_right_edge:
-            # Obstacle (on floor or platform)
-            obstacle_chance = (
-                BASE_OBSTACLE_CHANCE
-                + (MAX_OBSTACLE_CHANCE - BASE_OBSTACLE_CHANCE) * difficulty_factor
-            )
-
-            if random.random() < obstacle_chance and floor_width >= 100:
-                # Determine obstacle type based on difficulty and randomness
-                obstacle_types = ["spikes", "fire", "saw", "bomb"]
-
-                # Adjust weights based on difficulty
-                # As difficulty increases, more dangerous obstacles become more common
-                if difficulty_factor < 0.3:
-                    # Early game: more spikes, less of other types
-                    weights = [0.7, 0.2, 0.1, 0.0]  # No bombs early on
-                elif difficulty_factor < 0.6:
-                    # Mid game: balanced distribution
-                    weights = [0.4, 0.3, 0.2, 0.1]  # Introduce bombs
-                else:
-                    # Late game: more dangerous obstacles
-                    weights = [0.25, 0.25, 0.25, 0.25]  # Equal distribution
-
-                # Choose obstacle type based on weights
-                obstacle_type = random.choices(obstacle_types, weights=weights)[0]
-
-                # Determine obstacle size based on type and difficulty
-                if obstacle_type == "spikes":
-                    # For spikes, we'll set the width based on the number of duplications we want
-                    # The actual width will be adjusted in the Obstacle class based on the sprite width
-                    num_spikes = 1 + int((MAX_SPIKES - 1) * difficulty_factor)
-                    obstacle_width = (
-                        num_spikes * 40
-                    )  # Use actual spike width (30px) instead of approximate
-                    obstacle_height = 35  # Fixed height for spikes
-
-                elif obstacle_type == "fire":
-                    # For fire, we'll set the width based on the number of duplications we want
-                    # The actual width will be adjusted in the Obstacle class based on the sprite width
-                    num_fires = 1 + int((MAX_FIRES - 1) * difficulty_factor)
-                    obstacle_width = (
-                        num_fires * 30
-                    )  # Use actual fire width (30px) instead of approximate
-                    obstacle_height = 30  # Fixed height for fire
-
-                elif obstacle_type == "saw":
-                    # Saw gets bigger with difficulty
-                    min_size = 50 + int(20 * difficulty_factor)  # 50 to 70
-                    max_size = 60 + int(
-                        (MAX_SAW_SIZE - 60) * difficulty_factor
-                    )  # 60 to 100
-                    size = random.randint(min_size, max_size)
-                    obstacle_width = size
-                    obstacle_height = size  # Keep it square for better rotation
-
-                elif obstacle_type == "bomb":
-                    # Bombs are consistent in size
-                    obstacle_width = 75
-                    obstacle_height = 75
-
-                # Flag to track if we successfully created an obstacle
-                obstacle_created = False
-
-                # Place obstacle on floor or platform
-                if random.random() < 0.25 and platforms:
-                    # Find suitable platforms that are wide enough for the obstacle
-                    suitable_platforms = [
-                        p for p in platforms if p.width >= obstacle_width + 20
-                    ]  # Add 20px buffer
-
-                    if suitable_platforms:
-                        # Choose the most recently added suitable platform
-                        p = suitable_platforms[-1]
-
-                        # Ensure obstacle is fully on the platform by constraining its position
-                        # Calculate valid range for obstacle placement
-                        min_x = p.x + 10  # 10px buffer from left edge
-                        max_x = (
-                            p.x + p.width - obstacle_width - 10
-                        )  # 10px buffer from right edge
-
-                        # If valid placement range exists
-                        if min_x <= max_x:
-                            # Set the obstacle y position
-                            obstacle_y = p.y - obstacle_height
-
-                            # Try to find a non-overlapping position
-                            max_attempts = 10  # Limit the number of attempts to avoid infinite loops
-                            found_valid_position = False
-
-                            for _ in range(max_attempts):
-                                obstacle_x = random.randint(int(min_x), int(max_x))
-                                # Check if this position would overlap with any existing obstacle
-                                if not would_overlap_with_obstacle(
-                                    obstacle_x,
-                                    obstacle_y,
-                                    obstacle_width,
-                                    obstacle_height,
-                                ):
-                                    found_valid_position = True
-                                    break
-
-                            # If we found a valid position, create the obstacle
-                            if found_valid_position:
-                                new_obstacle = Obstacle(
-                                    obstacle_x,
-                                    obstacle_y,
-                                    obstacle_width,
-                                    obstacle_height,
-                                    obstacle_type,
-                                    difficulty_factor,
-                                )
-                                obstacle_created = True
-                        else:
-                            # Platform too small, but we can resize spikes and fire to fit
-                            if obstacle_type in ["spikes", "fire"]:
-                                # Calculate maximum possible width with buffers
-                                max_possible_width = (
-                                    p.width - 20
-                                )  # 10px buffer on each side
-
-                                if max_possible_width > 0:
-                                    # Adjust number of duplications to fit the platform
-                                    if obstacle_type == "spikes":
-                                        # Recalculate number of spikes to fit
-                                        num_spikes = max(
-                                            1, int(max_possible_width / 30)
-                                        )
-                                        obstacle_width = num_spikes * 30
-                                    else:  # fire
-                                        # Recalculate number of fires to fit
-                                        num_fires = max(1, int(max_possible_width / 30))
-                                        obstacle_width = num_fires * 30
-
-                                    # Place the resized obstacle
-                                    obstacle_x = p.x + 10  # 10px from left edge
-                                    obstacle_y = p.y - obstacle_height
-
-                                    # Check if this position would overlap with any existing obstacle
-                                    if not would_overlap_with_obstacle(
-                                        obstacle_x,
-                                        obstacle_y,
-                                        obstacle_width,
-                                        obstacle_height,
-                                    ):
-                                        new_obstacle = Obstacle(
-                                            obstacle_x,
-                                            obstacle_y,
-                                            obstacle_width,
-                                            obstacle_height,
-                                            obstacle_type,
-                                            difficulty_factor,
-                                        )
-                                        obstacle_created = True
-                                else:
-                                    # Platform too small even for a single sprite, try placing on floor instead
-                                    pass
-                            else:
-                                # For other obstacle types, try placing on floor instead
-                                pass
+                    world.insert(new_platform, PLATFORM)
 
-                # If we haven't created an obstacle yet, try placing it on the floor
-                if not obstacle_created:
-                    # Place obstacle on the floor
-                    obstacle_y = PLAY_AREA_HEIGHT - 20 - obstacle_height
+        # Obstacle (on floor or platform)
+        obstacle_chance = (
+            BASE_OBSTACLE_CHANCE
+            + (MAX_OBSTACLE_CHANCE - BASE_OBSTACLE_CHANCE) * difficulty_factor
+        )
 
-                    # Ensure obstacle is fully on the floor
-                    min_x = current_x - floor_width + 10  # 10px buffer from left edge
+        if rng.random() < obstacle_chance and floor_width >= 100:
+            # Determine obstacle type based on difficulty and randomness
+            obstacle_types = ["spikes", "fire", "saw", "bomb"]
+
+            # Adjust weights based on difficulty
+            # As difficulty increases, more dangerous obstacles become more common
+            if difficulty_factor < 0.3:
+                # Early game: more spikes, less of other types
+                weights = [0.7, 0.2, 0.1, 0.0]  # No bombs early on
+            elif difficulty_factor < 0.6:
+                # Mid game: balanced distribution
+                weights = [0.4, 0.3, 0.2, 0.1]  # Introduce bombs
+            else:
+                # Late game: more dangerous obstacles
+                weights = [0.25, 0.25, 0.25, 0.25]  # Equal distribution
+
+            # Choose obstacle type based on weights
+            obstacle_type = rng.choices(obstacle_types, weights=weights)[0]
+
+            # Determine obstacle size based on type and difficulty
+            if obstacle_type == "spikes":
+                # For spikes, we'll set the width based on the number of duplications we want
+                # The actual width will be adjusted in the Obstacle class based on the sprite width
+                num_spikes = 1 + int((MAX_SPIKES - 1) * difficulty_factor)
+                obstacle_width = (
+                    num_spikes * 40
+                )  # Use actual spike width (30px) instead of approximate
+                obstacle_height = 35  # Fixed height for spikes
+
+            elif obstacle_type == "fire":
+                # For fire, we'll set the width based on the number of duplications we want
+                # The actual width will be adjusted in the Obstacle class based on the sprite width
+                num_fires = 1 + int((MAX_FIRES - 1) * difficulty_factor)
+                obstacle_width = (
+                    num_fires * 30
+                )  # Use actual fire width (30px) instead of approximate
+                obstacle_height = 30  # Fixed height for fire
+
+            elif obstacle_type == "saw":
+                # Saw gets bigger with difficulty
+                min_size = 50 + int(20 * difficulty_factor)  # 50 to 70
+                max_size = 60 + int(
+                    (MAX_SAW_SIZE - 60) * difficulty_factor
+                )  # 60 to 100
+                size = rng.randint(min_size, max_size)
+                obstacle_width = size
+                obstacle_height = size  # Keep it square for better rotation
+
+            elif obstacle_type == "bomb":
+                # Bombs are consistent in size
+                obstacle_width = 75
+                obstacle_height = 75
+
+            # Flag to track if we successfully created an obstacle
+            obstacle_created = False
+
+            # Place obstacle on floor or platform
+            if rng.random() < 0.25 and world.last(PLATFORM) is not None:
+                # Find the last platform wide enough for the obstacle
+                suitable_platforms = world.platforms.last(
+                    min_width=obstacle_width + 20
+                )  # Add 20px buffer
+
+                if suitable_platforms:
+                    # Choose the most recently added suitable platform
+                    p = suitable_platforms[-1]
+
+                    # Ensure obstacle is fully on the platform by constraining its position
+                    # Calculate valid range for obstacle placement
+                    min_x = p.x + 10  # 10px buffer from left edge
                     max_x = (
-                        current_x - obstacle_width - 10
+                        p.x + p.width - obstacle_width - 10
                     )  # 10px buffer from right edge
 
-                    # Check if we have a valid range
+                    # If valid placement range exists
                     if min_x <= max_x:
-                        # Try to find a non-overlapping position
-                        max_attempts = (
-                            10  # Limit the number of attempts to avoid infinite loops
+                        # Set the obstacle y position
+                        obstacle_y = p.y - obstacle_height
+
+                        # Pick a position that does not overlap anything
+                        obstacle_x = place(
+                            min_x,
+                            max_x,
+                            obstacle_y,
+                            obstacle_width,
+                            obstacle_height,
+                            support=p,
                         )
-                        found_valid_position = False
-
-                        for _ in range(max_attempts):
-                            obstacle_x = random.randint(int(min_x), int(max_x))
-                            # Check if this position would overlap with any existing obstacle
-                            if not would_overlap_with_obstacle(
-                                obstacle_x, obstacle_y, obstacle_width, obstacle_height
-                            ):
-                                found_valid_position = True
-                                break
 
                         # If we found a valid position, create the obstacle
-                        if found_valid_position:
+                        if obstacle_x is not None:
                             new_obstacle = Obstacle(
                                 obstacle_x,
                                 obstacle_y,
@@ -425,159 +496,202 @@ def generate_new_segment(
                                 obstacle_height,
                                 obstacle_type,
                                 difficulty_factor,
+                                rng=rng,
                             )
                             obstacle_created = True
+                    else:
+                        # Platform too small, but we can resize spikes and fire to fit
+                        if obstacle_type in ["spikes", "fire"]:
+                            # Calculate maximum possible width with buffers
+                            max_possible_width = (
+                                p.width - 20
+                            )  # 10px buffer on each side
+
+                            if max_possible_width > 0:
+                                # Adjust number of duplications to fit the platform
+                                if obstacle_type == "spikes":
+                                    # Recalculate number of spikes to fit
+                                    num_spikes = max(1, int(max_possible_width / 30))
+                                    obstacle_width = num_spikes * 30
+                                else:  # fire
+                                    # Recalculate number of fires to fit
+                                    num_fires = max(1, int(max_possible_width / 30))
+                                    obstacle_width = num_fires * 30
+
+                                # Place the resized obstacle
+                                obstacle_x = p.x + 10  # 10px from left edge
+                                obstacle_y = p.y - obstacle_height
+
+                                # Check if this position would overlap with any existing obstacle
+                                if not would_overlap_with_obstacle(
+                                    obstacle_x,
+                                    obstacle_y,
+                                    obstacle_width,
+                                    obstacle_height,
+                                    support=p,
+                                ):
+                                    new_obstacle = Obstacle(
+                                        obstacle_x,
+                                        obstacle_y,
+                                        obstacle_width,
+                                        obstacle_height,
+                                        obstacle_type,
+                                        difficulty_factor,
+                                        rng=rng,
+                                    )
+                                    obstacle_created = True
+                            else:
+                                # Platform too small even for a single sprite, try placing on floor instead
+                                pass
+                        else:
+                            # For other obstacle types, try placing on floor instead
+                            pass
+
+            # If we haven't created an obstacle yet, try placing it on the floor
+            if not obstacle_created:
+                # Place obstacle on the floor
+                obstacle_y = PLAY_AREA_HEIGHT - 20 - obstacle_height
+
+                # Ensure obstacle is fully on the floor
+                min_x = current_x - floor_width + 10  # 10px buffer from left edge
+                max_x = current_x - obstacle_width - 10  # 10px buffer from right edge
+
+                # Check if we have a valid range
+                if min_x <= max_x:
+                    # Pick a position that does not overlap anything
+                    obstacle_x = place(
+                        min_x, max_x, obstacle_y, obstacle_width, obstacle_height
+                    )
 
-                # If we successfully created an obstacle, add it to the lists and collision grid
-                if obstacle_created:
-                    # Additional check to ensure obstacle is off-screen
-                    if new_obstacle.x > visible_right_edge:
-                        obstacles.append(new_obstacle)
-                        generated_obstacles.append(new_obstacle)
-
-                        # Use the collision box for grid collision detection
-                        collision_rect = new_obstacle.get_collision_rect()
-                        add_to_collision_grid(
-                            new_obstacle,
-                            collision_rect.x,
-                            collision_rect.y,
-                            collision_rect.width,
-                            collision_rect.height,
+                    # If we found a valid position, create the obstacle
+                    if obstacle_x is not None:
+                        new_obstacle = Obstacle(
+                            obstacle_x,
+                            obstacle_y,
+                            obstacle_width,
+                            obstacle_height,
+                            obstacle_type,
+                            difficulty_factor,
+                            rng=rng,
+                        )
+                        obstacle_created = True
+
+            # If we successfully created an obstacle, add it to the segment
+            if obstacle_created:
+                world.insert(new_obstacle, OBSTACLE)
+
+        # Coin generation - with platform placement similar to power-ups
+        coin_chance = 0.4  # Higher chance than power-ups
+
+        if rng.random() < coin_chance and floor_width >= 30:
+            # Similar to power-ups, increase chance of placing on platform vs floor as difficulty increases
+            coin_platform_placement_chance = 0.3 + (
+                0.5 * difficulty_factor
+            )  # Scales from 0.3 to 0.8
+
+            # Decide whether to place on platform or floor
+            if (
+                world.last(PLATFORM) is not None
+                and rng.random() < coin_platform_placement_chance
+            ):
+                # Place on a platform
+                # Only consider the platforms of this segment
+                segment_platforms = world.platforms.last(3)
+
+                if segment_platforms:
+                    # Choose from recent platforms
+                    p = rng.choice(segment_platforms)
+
+                    # Ensure platform is wide enough
+                    if p.width >= 30:
+                        coin_y = p.y - 30  # Place above the platform
+                        coin_x = place(
+                            p.x + 10, p.x + p.width - 20, coin_y, 20, 20, support=p
                         )
 
-            # Coin generation - with platform placement similar to power-ups
-            coin_chance = 0.4  # Higher chance than power-ups
-
-            if random.random() < coin_chance and floor_width >= 30:
-                # Similar to power-ups, increase chance of placing on platform vs floor as difficulty increases
-                coin_platform_placement_chance = 0.3 + (
-                    0.5 * difficulty_factor
-                )  # Scales from 0.3 to 0.8
-
-                # Decide whether to place on platform or floor
-                if platforms and random.random() < coin_platform_placement_chance:
-                    # Place on a platform
-                    # Only consider platforms that are off-screen
-                    off_screen_platforms = [
-                        p for p in platforms if p.x > visible_right_edge
-                    ]
-
-                    if off_screen_platforms:
-                        # Choose from recent off-screen platforms
-                        p = random.choice(
-                            off_screen_platforms[-3:]
-                            if len(off_screen_platforms) > 3
-                            else off_screen_platforms
+                        if coin_x is not None:
+                            new_coin = Coin(coin_x, coin_y)
+                            world.insert(new_coin, COIN)
+            else:
+                # Place on the floor (original behavior)
+                coin_y = (
+                    PLAY_AREA_HEIGHT - FLOOR_HEIGHT - 30
+                )  # 30px above the floor, matching platform placement
+                coin_x = place(current_x - floor_width, current_x - 20, coin_y, 20, 20)
+
+                if coin_x is not None:
+                    new_coin = Coin(coin_x, coin_y)
+                    world.insert(new_coin, COIN)
+
+        # Power-up generation - with increased platform placement as difficulty increases
+        powerup_chance = BASE_POWERUP_CHANCE + (
+            0.2 * difficulty_factor
+        )  # Scales from 0.1 to 0.3
+
+        if rng.random() < powerup_chance and floor_width >= 30:
+            # As difficulty increases, increase chance of placing on platform vs floor
+            platform_placement_chance = 0.3 + (
+                0.5 * difficulty_factor
+            )  # Scales from 0.3 to 0.8
+
+            # Decide whether to place on platform or floor
+            if (
+                world.last(PLATFORM) is not None
+                and rng.random() < platform_placement_chance
+            ):
+                # Place on a platform
+                # Only consider the platforms of this segment
+                segment_platforms = world.platforms.last(3)
+
+                if segment_platforms:
+                    # Choose from recent platforms
+                    p = rng.choice(segment_platforms)
+
+                    # Ensure platform is wide enough
+                    if p.width >= 30:
+                        powerup_y = p.y - 30  # Place above the platform
+                        powerup_x = place(
+                            p.x + 10, p.x + p.width - 20, powerup_y, 20, 20, support=p
                         )
 
-                        # Ensure platform is wide enough
-                        if p.width >= 30:
-                            coin_x = p.x + random.randint(10, p.width - 20)
-                            coin_y = p.y - 30  # Place above the platform
+                        if powerup_x is not None:
+                            new_powerup = PowerUp(
+                                powerup_x,
+                                powerup_y,
+                                rng.choice(POWERUP_TYPES),
+                            )
+                            world.insert(new_powerup, POWER_UP)
+            else:
+                # Place on the floor (original behavior)
+                powerup_y = (
+                    PLAY_AREA_HEIGHT - FLOOR_HEIGHT - 30
+                )  # 30px above the floor, matching platform placement
+                powerup_x = place(
+                    current_x - floor_width, current_x - 20, powerup_y, 20, 20
+                )
 
-                            if not would_overlap_with_obstacle(coin_x, coin_y, 20, 20):
-                                new_coin = Coin(coin_x, coin_y)
-                                coins.append(new_coin)
-                                add_to_collision_grid(new_coin, coin_x, coin_y, 20, 20)
-                else:
-                    # Place on the floor (original behavior)
-                    coin_x = (
-                        current_x - floor_width + random.randint(0, floor_width - 20)
+                if powerup_x is not None:
+                    new_powerup = PowerUp(
+                        powerup_x,
+                        powerup_y,
+                        rng.choice(POWERUP_TYPES),
                     )
-                    coin_y = (
-                        PLAY_AREA_HEIGHT - FLOOR_HEIGHT - 30
-                    )  # 30px above the floor, matching platform placement
-
-                    if (
-                        not would_overlap_with_obstacle(coin_x, coin_y, 20, 20)
-                        and coin_x > visible_right_edge
-                    ):
-                        new_coin = Coin(coin_x, coin_y)
-                        coins.append(new_coin)
-                        add_to_collision_grid(new_coin, coin_x, coin_y, 20, 20)
-
-            # Power-up generation - with increased platform placement as difficulty increases
-            powerup_chance = BASE_POWERUP_CHANCE + (
-                0.2 * difficulty_factor
-            )  # Scales from 0.1 to 0.3
-
-            if random.random() < powerup_chance and floor_width >= 30:
-                # As difficulty increases, increase chance of placing on platform vs floor
-                platform_placement_chance = 0.3 + (
-                    0.5 * difficulty_factor
-                )  # Scales from 0.3 to 0.8
-
-                # Decide whether to place on platform or floor
-                if platforms and random.random() < platform_placement_chance:
-                    # Place on a platform
-                    # Only consider platforms that are off-screen
-                    off_screen_platforms = [
-                        p for p in platforms if p.x > visible_right_edge
-                    ]
-
-                    if off_screen_platforms:
-                        # Choose from recent off-screen platforms
-                        p = random.choice(
-                            off_screen_platforms[-3:]
-                            if len(off_screen_platforms) > 3
-                            else off_screen_platforms
-                        )
+                    world.insert(new_powerup, POWER_UP)
 
-                        # Ensure platform is wide enough
-                        if p.width >= 30:
-                            powerup_x = p.x + random.randint(10, p.width - 20)
-                            powerup_y = p.y - 30  # Place above the platform
-
-                            if not would_overlap_with_obstacle(
-                                powerup_x, powerup_y, 20, 20
-                            ):
-                                new_powerup = PowerUp(
-                                    powerup_x,
-                                    powerup_y,
-                                    random.choice(
-                                        ["speed", "flying", "invincibility", "life"]
-                                    ),
-                                )
-                                power_ups.append(new_powerup)
-                                add_to_collision_grid(
-                                    new_powerup, powerup_x, powerup_y, 20, 20
-                                )
-                else:
-                    # Place on the floor (original behavior)
-                    powerup_x = (
-                        current_x - floor_width + random.randint(0, floor_width - 20)
-                    )
-                    powerup_y = (
-                        PLAY_AREA_HEIGHT - FLOOR_HEIGHT - 30
-                    )  # 30px above the floor, matching platform placement
-
-                    if (
-                        not would_overlap_with_obstacle(powerup_x, powerup_y, 20, 20)
-                        and powerup_x > visible_right_edge
-                    ):
-                        new_powerup = PowerUp(
-                            powerup_x,
-                            powerup_y,
-                            random.choice(["speed", "flying", "invincibility", "life"]),
-                        )
-                        power_ups.append(new_powerup)
-                        add_to_collision_grid(new_powerup, powerup_x, powerup_y, 20, 20)
+        # A floor with its platforms, obstacle and pickups is one step
+        yield
 
     return segment_end_x
 
 
-def remove_old_objects(player, floors, platforms, obstacles, coins, power_ups):
-    """Remove objects that are far behind the player."""
+def remove_old_objects(player, world):
+    """Remove objects that are far behind the player from the world store."""
     # Calculate dynamic left boundary based on furthest right position
     dynamic_left_boundary = max(
         0, player.furthest_right_position - MAX_BACKTRACK_DISTANCE - 100
     )
 
-    # Keep objects that are within the potential view range (from dynamic left boundary to current view)
-    floors = [f for f in floors if f.x + f.width > dynamic_left_boundary]
-    platforms = [p for p in platforms if p.x + p.width > dynamic_left_boundary]
-    obstacles = [o for o in obstacles if o.x + o.width > dynamic_left_boundary]
-    coins = [c for c in coins if c.x + c.width > dynamic_left_boundary]
-    power_ups = [p for p in power_ups if p.x + p.width > dynamic_left_boundary]
-
-    return floors, platforms, obstacles, coins, power_ups
+    # Drop the chunks behind the boundary, keeping the potential view range
+    world.evict_before(dynamic_left_boundary)
+    # Clear what collected coins and power-ups left behind, in batches
+    world.compact()
@@ -0,0 +1,150 @@
+"""
+Generates the next level segment ahead of time, off the game loop.
+
+Generating a whole segment inside one frame causes a visible hitch. Instead,
+the next segment is started while the camera is still a lookahead distance
+away from needing it, and generated into a staging area by a worker thread.
+Once the camera gets close, the finished segment is added to the world in one
+go. If the worker has not finished by then, the game waits for it.
+
+The lookahead is the distance the player covers in PREGENERATION_LOOKAHEAD_FRAMES
+at its current speed, so a speed boost starts generation earlier.
+
+A segment only depends on the game seed and its index (see generate_segment),
+so the worker shares nothing with the game loop, and the segment is added at a
+fixed point of the simulation. The level is therefore the same for a seed
+however long the worker takes.
+
+The web build has no threads. There the segment is generated a floor at a
+time on the game loop instead (see generate_segment_steps): every frame,
+advance() spends up to GENERATION_FRAME_BUDGET_MS on it until it is done. If
+the camera gets close before that, take() finishes it in one go.
+"""
+
+import queue
+import threading
+import time
+from src.constants.player import BASE_MOVE_SPEED, SPEED_BOOST_MULTIPLIER
+from src.constants.level_generation import (
+    PREGENERATION_LOOKAHEAD_FRAMES,
+    GENERATION_FRAME_BUDGET_MS,
+)
+from src.level.level_generator import generate_segment, generate_segment_steps
+from src.utils.compat import IS_WEB
+from src.utils.tracer import tracer
+from src.utils.logger import get_module_logger
+
+logger = get_module_logger("pregenerator")
+
+
+def lookahead_distance(player):
+    """Return how far ahead of need the next segment is started."""
+    speed = BASE_MOVE_SPEED * (SPEED_BOOST_MULTIPLIER if player.speed_boost else 1)
+    speed = max(speed, abs(player.vx))
+    return speed * PREGENERATION_LOOKAHEAD_FRAMES
+
+
+def _generate(seed, index):
+    with tracer.span("generate_segment", "level"):
+        return generate_segment(seed, index)
+
+
+class _Job:
+    """One segment to generate, with the inputs captured when it was started."""
+
+    def __init__(self, args):
+        self.args = args
+        self.segment = None
+        self.error = None
+        self.done = threading.Event()
+        self._steps = None  # Step generator when generated on the game loop
+
+    def run(self):
+        try:
+            self.segment = _generate(*self.args)
+        except Exception as e:
+            # Raised again on the game loop by take()
+            logger.error(f"Segment generation failed: {e}")
+            self.error = e
+        self.done.set()
+
+    def run_until(self, deadline=None):
+        """Generate steps until done or time.perf_counter() passes the deadline.
+
+        At least one step is made. Without a deadline, the segment is finished.
+        """
+        if self._steps is None:
+            self._steps = generate_segment_steps(*self.args)
+        try:
+            with tracer.span("generate_segment", "level"):
+                while True:
+                    next(self._steps)
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        return
+        except StopIteration as finished:
+            self.segment = finished.value
+        except Exception as e:
+            logger.error(f"Segment generation failed: {e}")
+            self.error = e
+        self.done.set()
+
+
+class SegmentPregenerator:
+    def __init__(
+        self, use_thread=not IS_WEB, frame_budget_ms=GENERATION_FRAME_BUDGET_MS
+    ):
+        self.use_thread = use_thread
+        self.frame_budget_ms = frame_budget_ms
+        self._job = None
+        self._jobs = queue.Queue()
+        self._worker = None
+
+    @property
+    def pending(self):
+        """Check if a segment has been started and not taken yet."""
+        return self._job is not None
+
+    def reset(self):
+        """Forget the segment in progress (a job that is still queued is ignored)."""
+        self._job = None
+
+    def start(self, seed, index):
+        """Start generating the segment with the given index."""
+        self._job = _Job((seed, index))
+
+        if not self.use_thread:
+            # Generated by advance() and take() on the game loop
+            return
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._work, name="level-pregenerator", daemon=True
+            )
+            self._worker.start()
+        self._jobs.put(self._job)
+
+    def _work(self):
+        while True:
+            self._jobs.get().run()
+
+    def advance(self):
+        """Spend up to the frame budget on the started segment.
+
+        Only does something without a worker thread, call it once per frame.
+        """
+        job = self._job
+        if job is None or self.use_thread or job.done.is_set():
+            return
+        job.run_until(time.perf_counter() + self.frame_budget_ms / 1000)
+
+    def take(self):
+        """Return the started segment, finishing it or waiting for the worker if needed."""
+        job, self._job = self._job, None
+        if not job.done.is_set():
+            logger.debug("Waiting for the next segment to finish generating")
+            if self.use_thread:
+                job.done.wait()
+            else:
+                job.run_until()
+        if job.error is not None:
+            raise job.error
+        return job.segment
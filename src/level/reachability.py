@@ -0,0 +1,226 @@
+"""
+Jump reachability tables for checking that generated segments can be played.
+
+A JumpTable is built once from the player's physics constants. It simulates
+a jump from standing with the double jump made at every possible frame (or
+not at all) and keeps, for every whole-pixel rise, the furthest horizontal
+distance at which the player's feet can come down to that height, and the
+longest distance the feet can stay above it. Checks then look the answer up
+instead of simulating anything:
+
+    NORMAL_JUMPS.can_reach(dx, dy)   # land dx pixels further at dy pixels higher
+    NORMAL_JUMPS.can_clear(width, height)   # jump over an obstacle
+
+Distances are measured between the player's left edge at take-off and at
+landing, rises are positive upwards. The player can slow down or stop in the
+air, so everything closer than the furthest distance can be reached too.
+Walking off an edge before the first jump gives a little more distance; the
+tables leave that out, so they err on the side of calling a jump impossible.
+"""
+
+import math
+from src.constants.screen import PLAY_AREA_HEIGHT
+from src.constants.game_objects import FLOOR_HEIGHT
+from src.constants.player import (
+    PLAYER_WIDTH,
+    PLAYER_HEIGHT,
+    GRAVITY,
+    FLYING_GRAVITY_REDUCTION,
+    JUMP_VELOCITY,
+    BASE_MOVE_SPEED,
+    SPEED_BOOST_MULTIPLIER,
+)
+
+FLOOR_TOP = PLAY_AREA_HEIGHT - FLOOR_HEIGHT
+
+
+class JumpTable:
+    """Reachable (dx, dy) envelope of a jump and double jump."""
+
+    def __init__(self, move_speed, gravity):
+        self.move_speed = move_speed
+        self.gravity = gravity
+        # Rises are tabled from a fall through the whole play area upwards
+        self._lowest = -PLAY_AREA_HEIGHT
+
+        trajectories = [self._trajectory(None)]
+        trajectories += [
+            self._trajectory(frame) for frame in range(1, len(trajectories[0]))
+        ]
+        self.max_height = max(max(heights) for heights in trajectories)
+
+        size = math.floor(self.max_height) - self._lowest + 1
+        landing = [-1] * size  # Latest frame the feet come down to a rise
+        above = [0] * size  # Most frames in a row the feet stay above a rise
+        for heights in trajectories:
+            # Frame each rise was passed on the way up, the feet start at 0
+            start = {i: 0 for i in range(-self._lowest)}
+            for frame in range(1, len(heights)):
+                before, after = heights[frame - 1], heights[frame]
+                if after > before:
+                    for i in self._crossed(before, after):
+                        start[i] = frame
+                else:
+                    for i in self._crossed(after, before):
+                        landing[i] = max(landing[i], frame)
+                        above[i] = max(above[i], frame - start.pop(i))
+
+        self._reach = [frame * move_speed if frame >= 0 else -1 for frame in landing]
+        self._clear = [frames * move_speed for frames in above]
+
+    def _trajectory(self, double_jump_frame):
+        """Return the feet heights of a jump frame by frame, like Player.update.
+
+        The second jump is made double_jump_frame frames after the first one,
+        or never if it is None. The jump ends once the feet fall below the
+        lowest tabled rise.
+        """
+        y, vy = 0.0, JUMP_VELOCITY
+        heights = [0.0]
+        while -y >= self._lowest:
+            if len(heights) - 1 == double_jump_frame:
+                vy = JUMP_VELOCITY
+            vy += self.gravity
+            y += vy
+            heights.append(-y)
+        return heights
+
+    def _crossed(self, low, high):
+        """Return the indices of the whole rises from low up to just below high."""
+        first = max(math.ceil(low), self._lowest) - self._lowest
+        last = min(math.ceil(high), math.floor(self.max_height) + 1) - self._lowest
+        return range(first, last)
+
+    def _index(self, dy):
+        return max(math.ceil(dy), self._lowest) - self._lowest
+
+    def reach(self, dy):
+        """Return the furthest distance to land at a rise, or -1 if it is too high."""
+        if dy > self.max_height:
+            return -1
+        return self._reach[self._index(dy)]
+
+    def can_reach(self, dx, dy):
+        """Check if the player can land dx pixels away and dy pixels higher."""
+        return max(dx, 0) <= self.reach(dy)
+
+    def can_clear(self, width, height):
+        """Check if the player can jump over an obstacle standing next to it.
+
+        The obstacle is width pixels wide and its top is height pixels above
+        the player's feet.
+        """
+        if height >= self.max_height:
+            return False
+        return width + PLAYER_WIDTH <= self._clear[self._index(height)]
+
+
+NORMAL_JUMPS = JumpTable(BASE_MOVE_SPEED, GRAVITY)
+SPEED_BOOST_JUMPS = JumpTable(BASE_MOVE_SPEED * SPEED_BOOST_MULTIPLIER, GRAVITY)
+# Flying also allows extra jumps after the double jump, so this is a lower bound
+FLYING_JUMPS = JumpTable(BASE_MOVE_SPEED, GRAVITY * FLYING_GRAVITY_REDUCTION)
+
+
+def can_cross_pit(left, right, platform=None, table=NORMAL_JUMPS):
+    """Check if the player can get from the floor ending at left to the one at right.
+
+    platform is an optional (x, y, width) platform over the pit to stop on.
+    """
+    if table.can_reach(right - left - PLAYER_WIDTH, 0):
+        return True
+    if platform is None:
+        return False
+    x, y, width = platform
+    rise = FLOOR_TOP - y
+    return table.can_reach(x - left - PLAYER_WIDTH, rise) and table.can_reach(
+        right - (x + width) - PLAYER_WIDTH, -rise
+    )
+
+
+def _stretches(surfaces, hazards):
+    """Return the (left, right, y) ranges of player x where it can stand safely.
+
+    A player at x stands on a surface while it overlaps it, from x = left to
+    x = right exclusive, unless it touches a hazard there.
+    """
+    stretches = []
+    for sx, sy, width in surfaces:
+        ranges = [(sx - PLAYER_WIDTH, sx + width)]
+        for hx, hy, hw, hh in hazards:
+            if hy >= sy or hy + hh <= sy - PLAYER_HEIGHT:
+                continue
+            blocked_left, blocked_right = hx - PLAYER_WIDTH, hx + hw
+            ranges = [
+                part
+                for left, right in ranges
+                for part in (
+                    (left, min(right, blocked_left)),
+                    (max(left, blocked_right), right),
+                )
+                if part[0] < part[1]
+            ]
+        stretches.extend((left, right, sy) for left, right in ranges)
+    return stretches
+
+
+def _can_jump(source, target, hazards, table):
+    """Check if the player can jump from one stretch to another."""
+    left, right, y = source
+    target_left, target_right, target_y = target
+    if target_left >= right:
+        gap = (right, target_left)
+    elif target_right <= left:
+        gap = (target_right, left)
+    else:
+        # The stretches overlap, only the height matters
+        return table.can_reach(0, y - target_y)
+    if not table.can_reach(gap[1] - gap[0], y - target_y):
+        return False
+
+    # Hazards low enough to hit on the way must be cleared, one at a time.
+    # Higher ones can be passed under
+    bottom = max(y, target_y)
+    top = min(y, target_y) - PLAYER_HEIGHT
+    for hx, hy, hw, hh in hazards:
+        if hx - PLAYER_WIDTH < gap[1] and hx + hw > gap[0]:
+            if hy < bottom and hy + hh > top and not table.can_clear(hw, y - hy):
+                return False
+    return True
+
+
+def find_dead_end(surfaces, hazards, start_x, end_x, margin=0, table=NORMAL_JUMPS):
+    """Return where the player gets stuck in a segment, or None if it can be crossed.
+
+    surfaces are the (x, y, width) tops of the segment's floors and platforms
+    and hazards the (x, y, width, height) collision rectangles of its
+    obstacles, grown by margin pixels on every side. The player comes in on
+    the floor that ends at start_x and must reach the floor that ends at
+    end_x. This is a coarse check that ignores bumping into platforms from
+    below and checks each jump on its own.
+    """
+    hazards = [
+        (x - margin, y - margin, width + 2 * margin, height + 2 * margin)
+        for x, y, width, height in hazards
+        if width > 0 and height > 0
+    ]
+    stretches = _stretches(surfaces, hazards)
+    start = (start_x - PLAYER_WIDTH, start_x, FLOOR_TOP)
+
+    reached = [start]
+    remaining = stretches
+    furthest = start_x
+    i = 0
+    while i < len(reached):
+        source = reached[i]
+        i += 1
+        if source[2] == FLOOR_TOP and source[1] >= end_x:
+            return None
+        furthest = max(furthest, source[1])
+        unreached = []
+        for target in remaining:
+            if _can_jump(source, target, hazards, table):
+                reached.append(target)
+            else:
+                unreached.append(target)
+        remaining = unreached
+    return furthest
@@ -0,0 +1,294 @@
+"""
+A library of pre-generated segment layouts per difficulty band.
+
+tools/build_segment_templates.py runs the full generator (fill_segment) many
+times for every difficulty band, screens out layouts with unfair combinations
+(see find_problems) and writes the rest to SEGMENT_TEMPLATES_PATH. At runtime,
+generate_segment takes most segments from the library instead of running the
+placement logic and its retry loops: it picks a template of the segment's
+band and only varies the pickups (see instantiate).
+
+The file is zlib-compressed little-endian records. A header (magic, version,
+band count) is followed, for every band, by its template count and its
+templates. A template is the number of objects of each kind followed by the
+objects, with x positions relative to the start of the segment.
+"""
+
+import struct
+import zlib
+from src.constants.screen import PLAY_AREA_HEIGHT
+from src.constants.game_objects import (
+    FLOOR_HEIGHT,
+    COIN_SIZE,
+    POWERUP_SIZE,
+    OBSTACLE_TYPES,
+    POWERUP_TYPES,
+)
+from src.constants.level_generation import (
+    SEGMENT_LENGTH,
+    OBSTACLE_BUFFER,
+    TEMPLATE_DIFFICULTY_BANDS,
+    TEMPLATE_PICKUP_JITTER,
+    TEMPLATE_LANDING_CLEARANCE,
+)
+from src.constants.paths import SEGMENT_TEMPLATES_PATH
+from src.entities.game_objects import Floor, Platform, Obstacle, Coin, PowerUp
+from src.level.world_store import KINDS, FLOOR, PLATFORM, OBSTACLE, COIN, POWER_UP
+from src.level.reachability import NORMAL_JUMPS
+from src.utils.logger import get_module_logger
+
+logger = get_module_logger("segment_templates")
+
+_MAGIC = b"DSEG"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHH")
+_COUNT = struct.Struct("<H")
+_KIND_COUNTS = struct.Struct(f"<{len(KINDS)}H")
+_RECORDS = {
+    FLOOR: struct.Struct("<hh"),  # x, width
+    PLATFORM: struct.Struct("<hhh"),  # x, y, width
+    OBSTACLE: struct.Struct("<hhhhB"),  # x, y, width, height, type
+    COIN: struct.Struct("<hh"),  # x, y
+    POWER_UP: struct.Struct("<hhB"),  # x, y, type
+}
+
+FLOOR_TOP = PLAY_AREA_HEIGHT - FLOOR_HEIGHT
+
+# Furthest jump to the same height and highest jump of the player
+MAX_JUMP_DISTANCE = NORMAL_JUMPS.reach(0)
+MAX_JUMP_HEIGHT = NORMAL_JUMPS.max_height
+
+# Library loaded by get_library(), False until the first attempt
+_library = False
+
+
+def band_of(difficulty_factor):
+    """Return the library band of a difficulty factor (0.0 to 1.0)."""
+    band = int(difficulty_factor * TEMPLATE_DIFFICULTY_BANDS)
+    return min(band, TEMPLATE_DIFFICULTY_BANDS - 1)
+
+
+def layout_of(objects, start_x):
+    """Return the template of a segment's (kind, object) pairs.
+
+    A template maps every kind to a list of record tuples (see _RECORDS).
+    """
+    template = {kind: [] for kind in KINDS}
+    for kind, obj in objects:
+        x, y = round(obj.x - start_x), round(obj.y)
+        if kind == FLOOR:
+            record = (x, obj.width)
+        elif kind == PLATFORM:
+            record = (x, y, round(obj.width))
+        elif kind == OBSTACLE:
+            record = (
+                x,
+                y,
+                round(obj.width),
+                round(obj.height),
+                OBSTACLE_TYPES.index(obj.type),
+            )
+        elif kind == COIN:
+            record = (x, y)
+        else:
+            record = (x, y, POWERUP_TYPES.index(obj.type))
+        template[kind].append(record)
+    return template
+
+
+def find_problems(template):
+    """Return the reasons a template is unfair to the player (empty if it is fine).
+
+    This is a coarse screen on the layout alone:
+    - "gap": a stretch without a floor or a platform low enough to jump on
+      that is longer than a double jump
+    - "landing": an obstacle on the floor right where a pit ends, too far
+      to clear in the jump over the pit
+    """
+    problems = []
+
+    # Floors and the platforms that can be reached from the floor, left to right
+    platforms = [
+        (x, x + width)
+        for x, y, width in template[PLATFORM]
+        if FLOOR_TOP - y <= MAX_JUMP_HEIGHT
+    ]
+    surfaces = sorted([(x, x + width) for x, width in template[FLOOR]] + platforms)
+    # The previous segment ends with a floor at this one's start
+    reached = 0
+    for left, right in surfaces:
+        if left - reached > MAX_JUMP_DISTANCE:
+            problems.append("gap")
+            break
+        reached = max(reached, right)
+
+    # An obstacle where a pit ends is only unfair if the jump over the pit
+    # cannot clear it too and there is no platform to stop on in between
+    floor_end = 0
+    for x, width in sorted(template[FLOOR]):
+        if x > floor_end and not any(
+            left < x and right > floor_end for left, right in platforms
+        ):
+            for ox, oy, ow, oh, _ in template[OBSTACLE]:
+                on_floor = oy + oh >= FLOOR_TOP
+                if (
+                    on_floor
+                    and x <= ox < x + TEMPLATE_LANDING_CLEARANCE
+                    and ox + ow - floor_end > MAX_JUMP_DISTANCE
+                ):
+                    problems.append("landing")
+                    break
+        floor_end = x + width
+    return problems
+
+
+def encode_library(bands):
+    """Return the file contents for a library (a list of template lists per band)."""
+    parts = [_HEADER.pack(_MAGIC, _VERSION, len(bands))]
+    for templates in bands:
+        parts.append(_COUNT.pack(len(templates)))
+        for template in templates:
+            parts.append(_KIND_COUNTS.pack(*(len(template[kind]) for kind in KINDS)))
+            for kind in KINDS:
+                record = _RECORDS[kind]
+                parts.extend(record.pack(*values) for values in template[kind])
+    return zlib.compress(b"".join(parts), 9)
+
+
+def decode_library(data):
+    """Return the library stored in file contents made by encode_library()."""
+    data = zlib.decompress(data)
+    magic, version, band_count = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"Not a version {_VERSION} segment template library")
+    offset = _HEADER.size
+
+    bands = []
+    for _ in range(band_count):
+        (template_count,) = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        templates = []
+        for _ in range(template_count):
+            counts = _KIND_COUNTS.unpack_from(data, offset)
+            offset += _KIND_COUNTS.size
+            template = {}
+            for kind, count in zip(KINDS, counts):
+                record = _RECORDS[kind]
+                template[kind] = [
+                    record.unpack_from(data, offset + i * record.size)
+                    for i in range(count)
+                ]
+                offset += count * record.size
+            templates.append(template)
+        bands.append(templates)
+    return bands
+
+
+def load_library(path=SEGMENT_TEMPLATES_PATH):
+    """Load a library file, or return None if it is missing or unusable."""
+    try:
+        with open(path, "rb") as f:
+            bands = decode_library(f.read())
+    except FileNotFoundError:
+        logger.info(f"No segment template library at {path}, generating every segment")
+        return None
+    except (ValueError, struct.error, zlib.error) as e:
+        logger.warning(f"Ignoring segment template library {path}: {e}")
+        return None
+    if len(bands) != TEMPLATE_DIFFICULTY_BANDS or not all(bands):
+        logger.warning(
+            f"Ignoring segment template library {path}: "
+            f"expected {TEMPLATE_DIFFICULTY_BANDS} non-empty bands"
+        )
+        return None
+    logger.info(f"Loaded {sum(map(len, bands))} segment templates from {path}")
+    return bands
+
+
+def get_library():
+    """Return the shared library, loading it on first use (None if unavailable)."""
+    global _library
+    if _library is False:
+        _library = load_library()
+    return _library
+
+
+def _pickup_position(x, y, size, template, taken, rng):
+    """Return a pickup's x moved by up to TEMPLATE_PICKUP_JITTER.
+
+    The pickup stays over the surface it was placed on and clear of the other
+    objects, or keeps its place if the move would break either.
+    """
+    new_x = x + rng.randint(-TEMPLATE_PICKUP_JITTER, TEMPLATE_PICKUP_JITTER)
+    if new_x == x:
+        return x
+    if new_x < OBSTACLE_BUFFER or new_x + size > SEGMENT_LENGTH - OBSTACLE_BUFFER:
+        return x
+
+    # Pickups float 30px above the floor or platform they were placed on
+    surface_y = y + 30
+    supported = any(
+        fx <= new_x and new_x + size <= fx + width
+        for fx, width in template[FLOOR]
+        if FLOOR_TOP == surface_y
+    ) or any(
+        px <= new_x and new_x + size <= px + width
+        for px, py, width in template[PLATFORM]
+        if py == surface_y
+    )
+    if not supported:
+        return x
+
+    buffer = OBSTACLE_BUFFER
+    for ox, oy, width, height in taken:
+        if (
+            new_x - buffer < ox + width
+            and new_x + size + buffer > ox
+            and y - buffer < oy + height
+            and y + size + buffer > oy
+        ):
+            return x
+    return new_x
+
+
+def instantiate(template, start_x, difficulty_factor, rng):
+    """Create the (kind, object) pairs of a template placed at start_x.
+
+    Coins and power-ups are moved a little and power-ups get a new type, so
+    the same template does not repeat exactly.
+    """
+    objects = []
+    for x, width in template[FLOOR]:
+        objects.append((FLOOR, Floor(start_x + x, width)))
+    for x, y, width in template[PLATFORM]:
+        objects.append((PLATFORM, Platform(start_x + x, y, width)))
+    for x, y, width, height, type_index in template[OBSTACLE]:
+        obstacle = Obstacle(
+            start_x + x,
+            y,
+            width,
+            height,
+            OBSTACLE_TYPES[type_index],
+            difficulty_factor,
+            rng=rng,
+        )
+        objects.append((OBSTACLE, obstacle))
+
+    # Rectangles the moved pickups must keep clear of. A pickup floats 30px
+    # above its own platform, just outside the buffer
+    taken = [(x, y, width, 20) for x, y, width in template[PLATFORM]]
+    taken += [(x, y, width, height) for x, y, width, height, _ in template[OBSTACLE]]
+    taken += [(x, y, COIN_SIZE, COIN_SIZE) for x, y in template[COIN]]
+    taken += [(x, y, POWERUP_SIZE, POWERUP_SIZE) for x, y, _ in template[POWER_UP]]
+
+    for x, y in template[COIN]:
+        taken.remove((x, y, COIN_SIZE, COIN_SIZE))
+        x = _pickup_position(x, y, COIN_SIZE, template, taken, rng)
+        taken.append((x, y, COIN_SIZE, COIN_SIZE))
+        objects.append((COIN, Coin(start_x + x, y)))
+    for x, y, _ in template[POWER_UP]:
+        taken.remove((x, y, POWERUP_SIZE, POWERUP_SIZE))
+        x = _pickup_position(x, y, POWERUP_SIZE, template, taken, rng)
+        taken.append((x, y, POWERUP_SIZE, POWERUP_SIZE))
+        objects.append((POWER_UP, PowerUp(start_x + x, y, rng.choice(POWERUP_TYPES))))
+    return objects
@@ -0,0 +1,323 @@
+"""
+Storage for the level objects that are alive in the world.
+
+The world is split into x-chunks of WORLD_CHUNK_WIDTH, kept left to right in a
+ring buffer (a deque). Every floor, platform, obstacle, coin and power-up is
+stored in the chunk its bounds start in, in a list per kind. Level generation,
+player collisions and drawing only visit the chunks around the area they ask
+about, and objects that fall behind the player are dropped a whole chunk at a
+time from the left of the buffer.
+
+Within a chunk, objects keep the order they were added in. Removing an object
+(a collected coin or power-up) leaves None in its place, so it costs no list
+shifting. These tombstones mostly go away with their chunk when it falls
+behind the player, and compact() clears the rest once there are
+WORLD_COMPACTION_THRESHOLD of them.
+
+Platforms are also kept in an IntervalIndex (WorldStore.platforms): sorted by
+x in buckets of similar width. Adding and removing one is a binary search in
+its bucket (plus the list insert or delete), and the level generator's
+queries for the last platforms, or the last ones wide enough for an
+obstacle, only look at the right end of the buckets that can hold them. Only
+the bucket holding the minimum width is walked past narrower platforms.
+"""
+
+import bisect
+import itertools
+from collections import deque
+from src.constants.level_generation import (
+    WORLD_CHUNK_WIDTH,
+    PLATFORM_INDEX_BUCKET_WIDTH,
+    WORLD_COMPACTION_THRESHOLD,
+)
+
+# Object kinds stored in the world
+FLOOR = "floor"
+PLATFORM = "platform"
+OBSTACLE = "obstacle"
+COIN = "coin"
+POWER_UP = "power_up"
+KINDS = (FLOOR, PLATFORM, OBSTACLE, COIN, POWER_UP)
+
+
+def get_bounds(obj):
+    """Return the largest (x, y, width, height) an object can ever collide with."""
+    if hasattr(obj, "get_bounds"):
+        return obj.get_bounds()
+    return obj.x, obj.y, obj.width, obj.height
+
+
+class IntervalIndex:
+    """Objects with an x and a width, sorted by x in buckets of similar width.
+
+    An object whose width is in [i * bucket_width, (i + 1) * bucket_width) is
+    kept in bucket i, so finding the rightmost objects of at least some width
+    only looks at the end of the buckets that can hold them. Objects with the
+    same x keep the order they were added in.
+    """
+
+    def __init__(self, bucket_width=PLATFORM_INDEX_BUCKET_WIDTH):
+        self.bucket_width = bucket_width
+        self._buckets = {}  # bucket -> ([(x, order)], [object]), sorted by x
+        self._bucket_order = []  # Buckets in use, narrowest first
+        self._keys = {}  # id(obj) -> (bucket, (x, order))
+        self._order = itertools.count()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, obj):
+        bucket = int(obj.width // self.bucket_width)
+        key = (obj.x, next(self._order))
+        if bucket not in self._buckets:
+            self._buckets[bucket] = ([], [])
+            bisect.insort(self._bucket_order, bucket)
+        keys, objects = self._buckets[bucket]
+        i = bisect.bisect_right(keys, key)
+        keys.insert(i, key)
+        objects.insert(i, obj)
+        self._keys[id(obj)] = (bucket, key)
+
+    def remove(self, obj):
+        found = self._keys.pop(id(obj), None)
+        if found is None:
+            return
+        bucket, key = found
+        keys, objects = self._buckets[bucket]
+        i = bisect.bisect_left(keys, key)
+        del keys[i]
+        del objects[i]
+        if not keys:
+            del self._buckets[bucket]
+            del self._bucket_order[bisect.bisect_left(self._bucket_order, bucket)]
+
+    def last(self, count=1, min_width=0):
+        """Return the count rightmost objects at least min_width wide, by x."""
+        first = int(min_width // self.bucket_width)
+        order = self._bucket_order
+        found = []
+        for bucket in order[bisect.bisect_left(order, first) :]:
+            keys, objects = self._buckets[bucket]
+            if bucket > first:
+                found.extend(zip(keys[-count:], objects[-count:]))
+                continue
+            # Only the bucket holding min_width can have narrower objects, so
+            # it is walked from the right until it has given count of them
+            taken = 0
+            for i in range(len(objects) - 1, -1, -1):
+                if objects[i].width >= min_width:
+                    found.append((keys[i], objects[i]))
+                    taken += 1
+                    if taken == count:
+                        break
+        found.sort(key=lambda item: item[0])
+        return [obj for _, obj in found[-count:]]
+
+
+class _Chunk:
+    __slots__ = ("objects", "bounds", "slots", "removed", "right")
+
+    def __init__(self):
+        self.objects = {kind: [] for kind in KINDS}  # None where one was removed
+        self.bounds = {}  # id(obj) -> bounds, for overlap tests in queries
+        self.slots = {}  # id(obj) -> index in the list of its kind
+        self.removed = {kind: 0 for kind in KINDS}  # Tombstones in each list
+        # Right edge of the chunk's furthest object. The chunk can be dropped
+        # once this is behind the player
+        self.right = float("-inf")
+
+
+class WorldStore:
+    def __init__(self, chunk_width=WORLD_CHUNK_WIDTH):
+        self.chunk_width = chunk_width
+        self._chunks = deque()
+        self._first_index = 0  # Chunk index of self._chunks[0]
+        self._max_width = 0  # Widest bounds stored, to find objects from earlier chunks
+        self._count = 0
+        self._removed = 0  # Tombstones in all chunks
+        self.platforms = IntervalIndex()
+        # Objects removed one by one, tombstones cleared by compact() and
+        # objects dropped with their chunk, since the store was created
+        self.churn = {"removed": 0, "compacted": 0, "evicted": 0}
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, obj):
+        chunk = self._chunk_at(get_bounds(obj)[0])
+        return chunk is not None and id(obj) in chunk.bounds
+
+    def count(self, kind):
+        """Return the number of stored objects of a kind."""
+        return sum(
+            len(chunk.objects[kind]) - chunk.removed[kind] for chunk in self._chunks
+        )
+
+    def objects(self, kind):
+        """Return every stored object of a kind, from left to right."""
+        return [
+            obj
+            for chunk in self._chunks
+            for obj in chunk.objects[kind]
+            if obj is not None
+        ]
+
+    def last(self, kind):
+        """Return the object of a kind in the rightmost chunk that has one."""
+        for chunk in reversed(self._chunks):
+            for obj in reversed(chunk.objects[kind]):
+                if obj is not None:
+                    return obj
+        return None
+
+    def _chunk_at(self, x):
+        offset = int(x // self.chunk_width) - self._first_index
+        if 0 <= offset < len(self._chunks):
+            return self._chunks[offset]
+        return None
+
+    def insert(self, obj, kind):
+        """Add an object to the chunk its bounds start in."""
+        bounds = get_bounds(obj)
+        index = int(bounds[0] // self.chunk_width)
+
+        # Grow the buffer on either side to reach the chunk
+        if not self._chunks:
+            self._first_index = index
+            self._chunks.append(_Chunk())
+        while index < self._first_index:
+            self._chunks.appendleft(_Chunk())
+            self._first_index -= 1
+        while index >= self._first_index + len(self._chunks):
+            self._chunks.append(_Chunk())
+
+        chunk = self._chunks[index - self._first_index]
+        chunk.slots[id(obj)] = len(chunk.objects[kind])
+        chunk.objects[kind].append(obj)
+        chunk.bounds[id(obj)] = bounds
+        chunk.right = max(chunk.right, obj.x + obj.width)
+        self._max_width = max(self._max_width, bounds[2])
+        self._count += 1
+        if kind == PLATFORM:
+            self.platforms.add(obj)
+
+    def remove(self, obj, kind):
+        """Remove an object (e.g. a collected coin), leaving a tombstone."""
+        chunk = self._chunk_at(get_bounds(obj)[0])
+        if chunk is not None and chunk.bounds.pop(id(obj), None) is not None:
+            chunk.objects[kind][chunk.slots.pop(id(obj))] = None
+            chunk.removed[kind] += 1
+            self._removed += 1
+            self._count -= 1
+            self.churn["removed"] += 1
+            if kind == PLATFORM:
+                self.platforms.remove(obj)
+
+    def evict_before(self, boundary):
+        """Drop the chunks whose objects all end at or left of the boundary.
+
+        Returns the number of objects removed.
+        """
+        removed = 0
+        chunks = self._chunks
+        while chunks and chunks[0].right <= boundary:
+            chunk = chunks.popleft()
+            removed += len(chunk.bounds)
+            self._removed -= sum(chunk.removed.values())
+            for platform in chunk.objects[PLATFORM]:
+                if platform is not None:
+                    self.platforms.remove(platform)
+            self._first_index += 1
+        self._count -= removed
+        self.churn["evicted"] += removed
+        return removed
+
+    def compact(self, threshold=WORLD_COMPACTION_THRESHOLD):
+        """Drop the tombstones of removed objects once there are threshold of them.
+
+        Returns the number of tombstones dropped.
+        """
+        if self._removed < threshold:
+            return 0
+        for chunk in self._chunks:
+            for kind, count in chunk.removed.items():
+                if not count:
+                    continue
+                objects = [obj for obj in chunk.objects[kind] if obj is not None]
+                for i, obj in enumerate(objects):
+                    chunk.slots[id(obj)] = i
+                chunk.objects[kind] = objects
+                chunk.removed[kind] = 0
+        compacted = self._removed
+        self._removed = 0
+        self.churn["compacted"] += compacted
+        return compacted
+
+    def query_rect(self, x, y, width, height, kinds=KINDS):
+        """Return the objects of some kinds whose bounds touch a rectangle.
+
+        Bounds are larger than the shapes objects collide with (see get_bounds),
+        so callers still test the exact shapes. Objects come grouped by kind,
+        in the order of kinds.
+        """
+        return [
+            obj
+            for found in self.query_rect_by_kind(x, y, width, height, kinds)
+            for obj in found
+        ]
+
+    def query_rect_by_kind(self, x, y, width, height, kinds):
+        """Return the objects whose bounds touch a rectangle, in one list per kind.
+
+        The lists come in the order of kinds, each from left to right by chunk,
+        for one pass over the chunks.
+        """
+        right = x + width
+        bottom = y + height
+        found = [[] for _ in kinds]
+        for chunk in self._visit(x, right):
+            bounds = chunk.bounds
+            for kind, kind_found in zip(kinds, found):
+                for obj in chunk.objects[kind]:
+                    if obj is None:
+                        continue
+                    bx, by, bw, bh = bounds[id(obj)]
+                    if bx <= right and bx + bw >= x and by <= bottom and by + bh >= y:
+                        kind_found.append(obj)
+        return found
+
+    def query_range(self, left, right=None, kinds=KINDS):
+        """Return the objects of some kinds whose bounds touch an x range.
+
+        Without right, the range reaches the end of the world.
+        """
+        if right is None:
+            right = float("inf")
+        found = []
+        for chunk in self._visit(left, right):
+            bounds = chunk.bounds
+            for kind in kinds:
+                for obj in chunk.objects[kind]:
+                    if obj is None:
+                        continue
+                    bx, _, bw, _ = bounds[id(obj)]
+                    if bx <= right and bx + bw >= left:
+                        found.append(obj)
+        return found
+
+    def _visit(self, left, right):
+        """Yield the chunks that can hold objects between two x positions."""
+        # Objects are stored by their left edge, so one that reaches into the
+        # range can start up to the widest object's width before it
+        first = int((left - self._max_width) // self.chunk_width) - self._first_index
+        first = max(first, 0)
+        if right == float("inf"):
+            last = len(self._chunks) - 1
+        else:
+            last = min(
+                int(right // self.chunk_width) - self._first_index,
+                len(self._chunks) - 1,
+            )
+        chunks = self._chunks
+        for offset in range(first, last + 1):
+            yield chunks[offset]
@@ -208,9 +208,11 @@ Do not use any emojis, line breaks, or special characters.
         """Return the current personality being used"""
         return self.personality
 
-    def change_personality(self):
+    def change_personality(self, rng=None):
         """Change to a different random personality"""
-        new_personality = random.choice(
+        if rng is None:
+            rng = random
+        new_personality = rng.choice(
             [p for p in PERSONALITIES if p != self.personality]
         )
         self.personality = new_personality
@@ -16,7 +16,13 @@ from src.constants.colors import (
     LIGHT_GREEN,
 )
 from src.constants.screen import PLAY_AREA_HEIGHT, STATUS_BAR_HEIGHT, WIDTH
-from src.constants.ui import HEART_SPRITE_SIZE
+from src.constants.ui import (
+    HEART_SPRITE_SIZE,
+    PROFILER_OVERLAY_REFRESH,
+    SPARKLINE_FRAMES,
+    SPARKLINE_MAX_MS,
+)
+from src.constants.simulation import FRAME_DURATION_MS
 from src.constants.player import (
     INVINCIBILITY_FROM_DAMAGE_DURATION,
     INVINCIBILITY_DURATION,
@@ -25,7 +31,9 @@ from src.constants.player import (
 from src.utils.utils import render_retro_text, get_retro_font
 from src.core.assets_loader import player_frames, get_frame, get_heart_sprite
 from src.entities.messages import message_manager, get_status_message
+import src.utils.game_clock as game_clock
 from src.utils.logger import get_module_logger
+from src.utils.profiler import profiler, FRAME_PHASES
 from src.constants.difficulty import DIFFICULTY_START_DISTANCE, DIFFICULTY_MAX_DISTANCE
 
 logger = get_module_logger("ui")
@@ -52,6 +60,10 @@ fps_update_interval = 500  # Update FPS every 500ms
 fps_frame_count = 0
 current_fps = 0
 
+# Profiler overlay variables
+profiler_overlay_time = -PROFILER_OVERLAY_REFRESH
+profiler_overlay_lines = []  # Rendered table rows, refreshed every interval
+
 # Bonus score variables
 bonus_score_circle_radius = 45
 bonus_score_circle_thickness = 4
@@ -62,7 +74,7 @@ bonus_reached_active = False
 def set_hearts_flash():
     """Set the hearts to flash (call this when player loses a life)."""
     global heart_flash_time
-    heart_flash_time = pygame.time.get_ticks()
+    heart_flash_time = game_clock.get_ticks()
 
 
 # New function to trigger the heart pop-in effect
@@ -70,7 +82,7 @@ def set_heart_pop_in(heart_index):
     """Set a heart to pop in with an animation effect."""
     global new_heart_index, new_heart_time
     new_heart_index = heart_index
-    new_heart_time = pygame.time.get_ticks()
+    new_heart_time = game_clock.get_ticks()
 
 
 # New function to trigger the "+X" indicator animation
@@ -78,7 +90,7 @@ def set_plus_indicator_animation():
     """Set the "+X" indicator to animate when a life is added beyond max displayed hearts."""
     global plus_indicator_active, plus_indicator_time
     plus_indicator_active = True
-    plus_indicator_time = pygame.time.get_ticks()
+    plus_indicator_time = game_clock.get_ticks()
 
 
 # New function to trigger the score highlight effect
@@ -87,7 +99,7 @@ def set_score_highlight(amount=50, is_bonus=False):
     global score_highlights
     # Create a new highlight object
     highlight = {
-        "time": pygame.time.get_ticks(),
+        "time": game_clock.get_ticks(),
         "amount": amount,
         "is_bonus": is_bonus,
         "duration": (
@@ -103,7 +115,7 @@ def set_target_reached_celebration():
     """Set the target reached celebration effect when player hits the score target early."""
     global bonus_reached_active, bonus_reached_time
     bonus_reached_active = True
-    bonus_reached_time = pygame.time.get_ticks()
+    bonus_reached_time = game_clock.get_ticks()
 
 
 # Function to reset the target reached celebration effect
@@ -133,7 +145,7 @@ def draw_heart(
 
     # Apply pop-in effect if this is a new heart
     if is_new:
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         effect_progress = min(1.0, (current_time - new_heart_time) / new_heart_duration)
 
         # Scale effect: start larger and shrink to normal size
@@ -169,7 +181,7 @@ def draw_heart(
 
 def draw_ui(screen, player):
     # Check if hearts should be flashing
-    current_time = pygame.time.get_ticks()
+    current_time = game_clock.get_ticks()
     hearts_flashing = current_time - heart_flash_time < heart_flash_duration
 
     # Flash pattern - alternate every 100ms
@@ -815,7 +827,7 @@ def draw_debug_info(screen, player):
 
     # Update FPS calculation
     global fps_update_time, fps_frame_count, current_fps, fps_update_interval
-    current_time = pygame.time.get_ticks()
+    current_time = game_clock.get_ticks()
 
     # Increment frame counter
     fps_frame_count += 1
@@ -889,7 +901,7 @@ def draw_debug_info(screen, player):
 
     # Display bonus score system info
     if player.bonus_score_active:
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         elapsed_time = current_time - player.bonus_score_timer
         remaining_time = max(
             0, (player.bonus_score_period_duration - elapsed_time) // 1000
@@ -903,3 +915,58 @@ def draw_debug_info(screen, player):
         )
         screen.blit(bonus_text, (10, y_pos))
         y_pos += line_height
+
+    # Draw the frame phase timings on the right side of the screen
+    draw_profiler_overlay(screen)
+
+
+def draw_profiler_overlay(screen):
+    """Draw p50/p95/p99 phase timings and a frame time sparkline."""
+    global profiler_overlay_time, profiler_overlay_lines
+    x_pos = WIDTH - 330
+    y_pos = 170
+    line_height = 14
+
+    # Rendering the table every frame would skew the timings it reports,
+    # so the text surfaces are only refreshed every interval
+    current_time = game_clock.get_ticks()
+    if current_time - profiler_overlay_time >= PROFILER_OVERLAY_REFRESH:
+        profiler_overlay_time = current_time
+        rows = [f"{'PHASE (ms)':<18}{'P50':>6}{'P95':>6}{'P99':>6}"]
+        for name in ["frame"] + FRAME_PHASES:
+            p50, p95, p99 = profiler.percentiles(name)
+            # Indent nested phases under their parent
+            label = "  " + name.split(".")[-1] if "." in name else name
+            rows.append(f"{label:<18}{p50:>6.2f}{p95:>6.2f}{p99:>6.2f}")
+        profiler_overlay_lines = [render_retro_text(row, 8, BLACK) for row in rows]
+
+    for line in profiler_overlay_lines:
+        screen.blit(line, (x_pos, y_pos))
+        y_pos += line_height
+
+    # Sparkline of the most recent frame times, one pixel column per frame
+    graph_height = 40
+    graph_top = y_pos + 6
+    graph_bottom = graph_top + graph_height
+    frame_times = list(profiler.frame_times)[-SPARKLINE_FRAMES:]
+    pygame.draw.rect(
+        screen, DARK_GREY, (x_pos, graph_top, SPARKLINE_FRAMES * 2, graph_height), 1
+    )
+    for i, frame_time in enumerate(frame_times):
+        height = min(graph_height, int(frame_time / SPARKLINE_MAX_MS * graph_height))
+        color = RED if frame_time > FRAME_DURATION_MS else BLUE
+        pygame.draw.line(
+            screen,
+            color,
+            (x_pos + i * 2, graph_bottom - 1),
+            (x_pos + i * 2, graph_bottom - 1 - height),
+        )
+
+    # Frame budget line at the target frame duration
+    budget_y = graph_bottom - int(FRAME_DURATION_MS / SPARKLINE_MAX_MS * graph_height)
+    pygame.draw.line(
+        screen,
+        GOLD,
+        (x_pos, budget_y),
+        (x_pos + SPARKLINE_FRAMES * 2 - 1, budget_y),
+    )
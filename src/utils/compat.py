@@ -105,4 +105,21 @@ if IS_WEB:
     random.choice = web_random.choice
     random.choices = web_random.choices
 
-__all__ = ["IS_WEB", "random"]
+
+def create_rng(seed=None):
+    """Create a seedable random number generator for a single game.
+
+    If no seed is given, one is drawn from the shared random source (the
+    browser's crypto API on the web), so every game still gets a different
+    world while remaining reproducible from its seed. The returned
+    random.Random instance can be snapshotted with getstate()/setstate().
+
+    Returns:
+        tuple: (rng, seed)
+    """
+    if seed is None:
+        seed = random.randint(0, 2**32 - 1)
+    return random.Random(seed), seed
+
+
+__all__ = ["IS_WEB", "random", "create_rng"]
@@ -0,0 +1,46 @@
+"""
+Game clock used by timers, animations and the message system.
+
+During normal play this is just pygame's wall clock. Headless runs switch it to
+a simulated clock that only moves when the game loop advances it, so power-up
+durations, invincibility and message timing stay tied to frames instead of to
+how fast the CPU happens to step the loop.
+"""
+
+import pygame
+
+# Simulated clock state
+_simulated = False
+_simulated_ticks = 0.0
+
+
+def get_ticks():
+    """Return the current game time in milliseconds."""
+    if _simulated:
+        return int(_simulated_ticks)
+    return pygame.time.get_ticks()
+
+
+def use_simulated_clock(start_ticks=0):
+    """Switch to the simulated clock, starting at the given time in milliseconds."""
+    global _simulated, _simulated_ticks
+    _simulated = True
+    _simulated_ticks = float(start_ticks)
+
+
+def use_real_clock():
+    """Switch back to pygame's wall clock."""
+    global _simulated
+    _simulated = False
+
+
+def is_simulated():
+    """Check if the simulated clock is active."""
+    return _simulated
+
+
+def advance(milliseconds):
+    """Advance the simulated clock. Has no effect on the wall clock."""
+    global _simulated_ticks
+    if _simulated:
+        _simulated_ticks += milliseconds
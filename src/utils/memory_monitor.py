@@ -0,0 +1,187 @@
+"""
+Long-run memory growth monitor.
+
+When started, tracemalloc traces every Python allocation and a snapshot is
+taken every MEMORY_SNAPSHOT_INTERVAL of game time. Each snapshot is appended to
+a JSON lines file with:
+    - the traced memory in use and its peak
+    - retained memory per module, and its growth since the first snapshot
+    - the length of the game's caches, queues and world lists
+
+Tracing allocations slows the game down and each snapshot takes a moment, so
+this is meant for soak tests and kiosk sessions, not normal play.
+
+Usage:
+    memory_monitor.start("logs/memory.jsonl", game)
+    memory_monitor.update()  # Once per frame
+    memory_monitor.stop()
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from src.constants.simulation import (
+    MEMORY_SNAPSHOT_INTERVAL,
+    MEMORY_TOP_MODULES,
+    MEMORY_TRACE_FRAMES,
+)
+import src.utils.game_clock as game_clock
+from src.utils.logger import get_module_logger
+
+logger = get_module_logger("memory_monitor")
+
+# Allocations made while taking snapshots are not part of the game
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def module_name(filename):
+    """Shorten an allocation's file name to the module it belongs to."""
+    root = os.getcwd() + os.sep
+    if filename.startswith(root):
+        return filename[len(root) :]
+    # Third party and standard library files: keep the part after the install path
+    for marker in ("site-packages" + os.sep, "lib" + os.sep + "python"):
+        index = filename.rfind(marker)
+        if index != -1:
+            return filename[index:]
+    return filename
+
+
+def count_objects(game):
+    """Return the length of the structures that can grow during a session."""
+    from src.core import assets_loader
+    from src.entities.effects import effect_manager
+    from src.entities.messages import message_manager
+    from src.ui import ui
+    from src.utils import utils
+
+    counts = {
+        "effects": len(effect_manager.effects),
+        "assets_font_cache": len(assets_loader.font_cache),
+        "text_font_cache": len(utils._font_cache),
+        "score_highlights": len(ui.score_highlights),
+        "shown_messages": len(message_manager.shown_messages),
+        "message_queue": len(message_manager.message_queue),
+        "conversation_history": len(message_manager.llm_handler.conversation_history),
+    }
+    if game is not None:
+        counts.update(game.count_objects())
+        counts["trail_positions"] = len(game.player.trail_positions)
+    return counts
+
+
+class MemoryMonitor:
+    def __init__(self, interval=MEMORY_SNAPSHOT_INTERVAL, top=MEMORY_TOP_MODULES):
+        self.enabled = False
+        self.interval = interval
+        self.top = top
+        self.path = None
+        self.game = None
+        self.samples = 0
+        self._file = None
+        self._baseline = None  # Per-module sizes of the first snapshot
+        self._last_sample_ticks = 0
+        self._start_time = 0.0
+        self._started_tracing = False
+
+    def start(self, path, game=None):
+        """Start tracing allocations and write snapshots to a JSON lines file."""
+        if self.enabled:
+            self.stop()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "w")
+        self.path = path
+        self.game = game
+        self.samples = 0
+        self._baseline = None
+        self._start_time = time.perf_counter()
+
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(MEMORY_TRACE_FRAMES)
+        self.enabled = True
+        logger.info(f"Memory monitor writing to {path} every {self.interval} ms")
+
+        # The first snapshot is the baseline that growth is measured against
+        self.sample()
+
+    def stop(self):
+        """Take a last snapshot and stop tracing."""
+        if not self.enabled:
+            return
+        self.sample()
+        self.enabled = False
+        if self._started_tracing:
+            tracemalloc.stop()
+        self._file.close()
+        self._file = None
+        self.game = None
+        logger.info(f"Memory monitor stopped after {self.samples} snapshots")
+
+    def update(self):
+        """Take a snapshot if the interval has passed. Call once per frame."""
+        if not self.enabled:
+            return
+        if game_clock.get_ticks() - self._last_sample_ticks >= self.interval:
+            self.sample()
+
+    def sample(self):
+        """Take a snapshot and append it to the file."""
+        if not self.enabled:
+            return
+        self._last_sample_ticks = game_clock.get_ticks()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+        sizes = {}
+        for stat in snapshot.statistics("filename"):
+            name = module_name(stat.traceback[0].filename)
+            sizes[name] = sizes.get(name, 0) + stat.size
+        if self._baseline is None:
+            self._baseline = sizes
+
+        growth = {
+            name: size - self._baseline.get(name, 0) for name, size in sizes.items()
+        }
+        largest = sorted(sizes.items(), key=lambda item: item[1], reverse=True)
+        growing = sorted(growth.items(), key=lambda item: item[1], reverse=True)
+        current, peak = tracemalloc.get_traced_memory()
+
+        sample = {
+            "sample": self.samples,
+            "game_ticks": self._last_sample_ticks,
+            "elapsed_s": round(time.perf_counter() - self._start_time, 3),
+            "traced_kb": round(current / 1024, 1),
+            "traced_peak_kb": round(peak / 1024, 1),
+            "modules_kb": {
+                name: round(size / 1024, 1) for name, size in largest[: self.top]
+            },
+            "growth_kb": {
+                name: round(size / 1024, 1)
+                for name, size in growing[: self.top]
+                if size > 0
+            },
+            "counts": count_objects(self.game),
+        }
+        self._file.write(json.dumps(sample) + "\n")
+        self._file.flush()
+        self.samples += 1
+
+        total_growth = sum(growth.values())
+        logger.info(
+            f"Memory snapshot {sample['sample']}: {sample['traced_kb']} KB traced, "
+            f"{total_growth / 1024:+.1f} KB since start"
+        )
+        return sample
+
+
+# Global instance
+memory_monitor = MemoryMonitor()
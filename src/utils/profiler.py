@@ -0,0 +1,152 @@
+"""
+Per-frame profiler for the game loop.
+
+Each rendered frame records how long every instrumented phase took (event
+handling, the parts of update and draw). A rolling window of recent frames is
+kept per phase so the debug overlay can show p50/p95/p99 timings and a frame
+time sparkline.
+While the tracer is running, every phase and frame is also written as a trace
+event.
+
+Usage:
+    profiler.begin_frame()
+    with profiler.phase("update.player"):
+        ...
+    profiler.end_frame()
+"""
+
+import time
+from collections import deque
+from src.constants.simulation import PROFILER_WINDOW
+from src.utils.tracer import tracer
+
+# Phases in display order. Nested phases use "parent.child" names.
+FRAME_PHASES = [
+    "events",
+    "update",
+    "update.input",
+    "update.player",
+    "update.entities",
+    "update.effects",
+    "update.generation",
+    "update.cleanup",
+    "draw",
+    "draw.background",
+    "draw.world",
+    "draw.player",
+    "draw.effects",
+    "draw.ui",
+]
+
+
+def percentile(sorted_values, fraction):
+    """Return the value at the given fraction (0.0 to 1.0) of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class _Phase:
+    """Context manager that adds its elapsed time to a phase of the current frame."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        self.profiler.add_time(self.name, elapsed * 1000.0)
+        if tracer.enabled:
+            tracer.complete(self.name, self.start, elapsed, "phase")
+        return False
+
+
+class FrameProfiler:
+    def __init__(self, window=PROFILER_WINDOW):
+        self.window = window
+        self.enabled = True
+        self.frame_times = deque(maxlen=window)  # Total work time per frame (ms)
+        self.samples = {name: deque(maxlen=window) for name in FRAME_PHASES}
+        self._current = {}  # Phase times accumulated in the current frame (ms)
+        self._phases = {}  # Cached context managers by phase name
+        self._frame_start = None
+
+    def phase(self, name):
+        """Return a context manager that times a phase of the current frame."""
+        phase = self._phases.get(name)
+        if phase is None:
+            phase = _Phase(self, name)
+            self._phases[name] = phase
+        return phase
+
+    def add_time(self, name, milliseconds):
+        """Add time to a phase of the current frame."""
+        if self.enabled:
+            self._current[name] = self._current.get(name, 0.0) + milliseconds
+
+    def begin_frame(self):
+        """Start timing a new frame."""
+        self._current = {}
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Finish the current frame and add its timings to the rolling window."""
+        if not self.enabled or self._frame_start is None:
+            return
+        elapsed = time.perf_counter() - self._frame_start
+        self.frame_times.append(elapsed * 1000.0)
+        if tracer.enabled:
+            tracer.complete("frame", self._frame_start, elapsed, "frame")
+        self._frame_start = None
+
+        # Phases that did not run this frame count as zero
+        for name, samples in self.samples.items():
+            samples.append(self._current.get(name, 0.0))
+        for name, value in self._current.items():
+            if name not in self.samples:
+                self.samples[name] = deque([value], maxlen=self.window)
+
+    def percentiles(self, name):
+        """Return (p50, p95, p99) in milliseconds for a phase over the window."""
+        samples = self.frame_times if name == "frame" else self.samples.get(name, ())
+        ordered = sorted(samples)
+        return (
+            percentile(ordered, 0.5),
+            percentile(ordered, 0.95),
+            percentile(ordered, 0.99),
+        )
+
+    def report(self):
+        """Return p50/p95/p99 for the whole frame and every phase."""
+        report = {}
+        for name in ["frame"] + list(self.samples):
+            p50, p95, p99 = self.percentiles(name)
+            report[name] = {"p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+        return report
+
+    def set_window(self, window):
+        """Change how many recent frames are kept. Clears recorded frames."""
+        self.window = window
+        self.frame_times = deque(maxlen=window)
+        self.samples = {name: deque(maxlen=window) for name in FRAME_PHASES}
+        self.reset()
+
+    def reset(self):
+        """Clear all recorded frames."""
+        self.frame_times.clear()
+        for samples in self.samples.values():
+            samples.clear()
+        self._current = {}
+        self._frame_start = None
+
+
+# Global instance
+profiler = FrameProfiler()
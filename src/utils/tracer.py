@@ -0,0 +1,231 @@
+"""
+Chrome trace-event export of frame timelines.
+
+When started, every profiler phase, every frame and a few slow operations
+(segment generation, LLM requests, asset loading) are written as trace events
+that can be opened in chrome://tracing or https://ui.perfetto.dev.
+
+Events are kept in memory and handed to a writer thread in chunks, so tracing
+does not block the game loop on disk writes. On the web the chunks are written
+directly since there are no background threads.
+
+Usage:
+    tracer.start("logs/trace.json")
+    with tracer.span("assets.fonts", "assets"):
+        ...
+    tracer.stop()
+"""
+
+import atexit
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+from src.constants.simulation import TRACE_FLUSH_EVENTS
+from src.utils.compat import IS_WEB
+from src.utils.logger import get_module_logger
+
+logger = get_module_logger("tracer")
+
+
+class _Span:
+    """Context manager that records a complete ("X") event when it exits."""
+
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.complete(
+            self.name,
+            self.start,
+            time.perf_counter() - self.start,
+            self.category,
+            self.args,
+        )
+        return False
+
+
+class Tracer:
+    def __init__(self, flush_events=TRACE_FLUSH_EVENTS):
+        self.enabled = False
+        self.path = None
+        self.flush_events = flush_events
+        self.event_count = 0
+        self._buffer = []  # Serialized events waiting for the next chunk
+        self._lock = threading.Lock()  # Events also come from the messages thread
+        self._file = None
+        self._first_chunk = True
+        self._origin = 0.0  # perf_counter value at time zero of the trace
+        self._pid = os.getpid()
+        self._named_threads = set()
+        self._async_ids = itertools.count(1)
+        self._queue = None
+        self._writer = None
+
+    def start(self, path):
+        """Start writing trace events to a file."""
+        if self.enabled:
+            self.stop()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "w")
+        # JSON array format: events are appended as they are flushed
+        self._file.write("[\n")
+        self._first_chunk = True
+        self._buffer = []
+        self._named_threads = set()
+        self._origin = time.perf_counter()
+        self.event_count = 0
+        self.path = path
+
+        if not IS_WEB:
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(
+                target=self._write_chunks, name="trace-writer", daemon=True
+            )
+            self._writer.start()
+
+        self.enabled = True
+        atexit.register(self.stop)
+        logger.info(f"Tracing to {path}")
+
+    def stop(self):
+        """Flush the remaining events and close the trace file."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        self.flush()
+
+        if self._writer:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+
+        self._file.write("\n]\n")
+        self._file.close()
+        self._file = None
+        atexit.unregister(self.stop)
+        logger.info(f"Trace saved to {self.path}: {self.event_count} events")
+
+    def span(self, name, category="game", args=None):
+        """Return a context manager that records how long a block took."""
+        return _Span(self, name, category, args)
+
+    def complete(self, name, start, duration, category="game", args=None):
+        """Record a complete event from a perf_counter start time and a duration in seconds."""
+        if not self.enabled:
+            return
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": duration * 1e6,
+        }
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    def async_begin(self, name, category="game", args=None):
+        """Start an event that can finish on a later frame. Returns its id."""
+        event_id = next(self._async_ids)
+        if self.enabled:
+            event = {"name": name, "cat": category, "ph": "b", "id": event_id}
+            if args:
+                event["args"] = args
+            self._add(event, time.perf_counter())
+        return event_id
+
+    def async_end(self, name, event_id, category="game", args=None):
+        """Finish an event started with async_begin()."""
+        if not self.enabled:
+            return
+        event = {"name": name, "cat": category, "ph": "e", "id": event_id}
+        if args:
+            event["args"] = args
+        self._add(event, time.perf_counter())
+
+    def instant(self, name, category="game", args=None):
+        """Record a single point in time."""
+        if not self.enabled:
+            return
+        event = {"name": name, "cat": category, "ph": "i", "s": "t"}
+        if args:
+            event["args"] = args
+        self._add(event, time.perf_counter())
+
+    def _add(self, event, timestamp=None):
+        """Add an event to the buffer, handing off a chunk when the buffer is full."""
+        thread = threading.current_thread()
+        event["pid"] = self._pid
+        event["tid"] = thread.ident
+        if timestamp is not None:
+            event["ts"] = (timestamp - self._origin) * 1e6
+
+        with self._lock:
+            # Name each thread the first time it records an event
+            if thread.ident not in self._named_threads:
+                self._named_threads.add(thread.ident)
+                self._buffer.append(
+                    json.dumps(
+                        {
+                            "name": "thread_name",
+                            "ph": "M",
+                            "pid": self._pid,
+                            "tid": thread.ident,
+                            "args": {"name": thread.name},
+                        }
+                    )
+                )
+            self._buffer.append(json.dumps(event))
+            self.event_count += 1
+            if len(self._buffer) >= self.flush_events:
+                self._flush_locked()
+
+    def flush(self):
+        """Hand off all buffered events."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """Hand off the buffer as one chunk. Called with the lock held, so chunks
+        reach the writer in order."""
+        if not self._buffer:
+            return
+        chunk = ",\n".join(self._buffer)
+        if not self._first_chunk:
+            chunk = ",\n" + chunk
+        self._first_chunk = False
+        self._buffer = []
+
+        if self._queue is not None:
+            self._queue.put(chunk)
+        elif self._file is not None:
+            self._file.write(chunk)
+
+    def _write_chunks(self):
+        """Writer thread: write chunks to the file until stop() sends None."""
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                return
+            self._file.write(chunk)
+
+
+# Global instance
+tracer = Tracer()
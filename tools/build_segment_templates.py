@@ -0,0 +1,107 @@
+"""
+Build the segment template library used by the level generator.
+
+Every difficulty band gets TEMPLATES_PER_BAND segments made by the full
+generator at difficulties spread over the band. Segments that fail the
+fairness screen (segment_templates.find_problems) are thrown away and
+generated again.
+
+Usage:
+    python -m tools.build_segment_templates
+    python -m tools.build_segment_templates --per-band 128 --seed 7
+"""
+
+import argparse
+import collections
+import os
+import random
+
+# Keep the game's logging quiet unless asked otherwise
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("LOG_TO_FILE", "False")
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+from src.constants.screen import WIDTH, HEIGHT
+from src.constants.paths import SEGMENT_TEMPLATES_PATH
+from src.constants.level_generation import (
+    SEGMENT_LENGTH,
+    TEMPLATE_DIFFICULTY_BANDS,
+    TEMPLATES_PER_BAND,
+)
+from src.core.assets_loader import load_all_assets
+from src.level import segment_templates
+from src.level.level_generator import fill_segment
+from src.level.world_store import WorldStore, KINDS
+
+# Give up on a band after this many rejected segments per template
+MAX_ATTEMPTS_PER_TEMPLATE = 20
+
+
+def build_band(band, count, seed, rejected):
+    """Return count screened templates for a band, counting rejections by reason."""
+    templates = []
+    attempt = 0
+    while len(templates) < count:
+        if attempt >= count * MAX_ATTEMPTS_PER_TEMPLATE:
+            raise RuntimeError(f"Band {band} rejects almost every segment")
+        rng = random.Random(f"{seed}:{band}:{attempt}")
+        attempt += 1
+
+        difficulty_factor = (band + rng.random()) / TEMPLATE_DIFFICULTY_BANDS
+        world = WorldStore()
+        fill_segment(world, 0, SEGMENT_LENGTH, difficulty_factor, rng)
+        objects = [(kind, obj) for kind in KINDS for obj in world.objects(kind)]
+        # Screen the template as it will be stored, after rounding
+        template = segment_templates.layout_of(objects, 0)
+        problems = segment_templates.find_problems(template)
+        if problems:
+            rejected.update(problems)
+            continue
+        templates.append(template)
+    return templates
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Build the segment template library of the level generator."
+    )
+    parser.add_argument(
+        "--per-band",
+        type=int,
+        default=TEMPLATES_PER_BAND,
+        help=f"Templates per difficulty band (default: {TEMPLATES_PER_BAND})",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed of the generated segments"
+    )
+    parser.add_argument(
+        "--output",
+        default=SEGMENT_TEMPLATES_PATH,
+        help=f"Library file to write (default: {SEGMENT_TEMPLATES_PATH})",
+    )
+    args = parser.parse_args(argv)
+
+    # Obstacle sizes depend on the sprite sizes
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    load_all_assets()
+
+    bands = []
+    for band in range(TEMPLATE_DIFFICULTY_BANDS):
+        rejected = collections.Counter()
+        bands.append(build_band(band, args.per_band, args.seed, rejected))
+        print(f"Band {band}: {args.per_band} templates, rejected {dict(rejected)}")
+
+    data = segment_templates.encode_library(bands)
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "wb") as f:
+        f.write(data)
+    print(f"Wrote {len(data)} bytes to {args.output}")
+
+
+if __name__ == "__main__":
+    main()